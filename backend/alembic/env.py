@@ -9,7 +9,7 @@ from alembic import context
 
 # Import models to register them with Base.metadata
 from app.core.database import Base
-from app.models import ISSFetchLog, OSDRItem, SpaceCache, TelemetryLegacy
+from app.models import CollectorState, ISSFetchLog, ISSRollup, OSDRItem, SpaceCache, TelemetryLegacy
 
 # Alembic Config object
 config = context.config
@@ -0,0 +1,43 @@
+"""Add collector state table
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # collector_state - persisted scheduling state per collector source
+    op.create_table(
+        "collector_state",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(50), nullable=False, comment="Collector source (iss, osdr, apod, ...)"),
+        sa.Column("last_attempt_at", sa.DateTime(timezone=True), nullable=True, comment="Start of the last run"),
+        sa.Column("last_success_at", sa.DateTime(timezone=True), nullable=True, comment="Start of the last successful run"),
+        sa.Column("last_outcome", sa.String(20), nullable=True, comment="success, unchanged or error"),
+        sa.Column("last_error", sa.Text(), nullable=True, comment="Error of the last failed run"),
+        sa.Column("next_due_at", sa.DateTime(timezone=True), nullable=True, comment="Next scheduled run"),
+        sa.Column("validators", postgresql.JSONB(), nullable=True, comment="ETag/Last-Modified validators per request key"),
+        sa.Column("fingerprint", sa.String(64), nullable=True, comment="Digest of the last fetched payload"),
+        sa.Column("last_change_at", sa.DateTime(timezone=True), nullable=True, comment="When the payload last changed"),
+        sa.Column("interval_seconds", sa.Float(), nullable=True, comment="Learned adaptive poll interval"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, comment="Last update timestamp"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", name="uq_collector_state_source")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("collector_state")
@@ -0,0 +1,35 @@
+"""Make ISS position timestamps unique
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Positions are keyed by their upstream timestamp so backfills are idempotent.
+    # Drop exact duplicates first, keeping the earliest row.
+    op.execute(
+        """
+        DELETE FROM iss_fetch_log a
+        USING iss_fetch_log b
+        WHERE a.timestamp = b.timestamp AND a.id > b.id
+        """
+    )
+    op.drop_index("ix_iss_fetch_log_timestamp", table_name="iss_fetch_log")
+    op.create_unique_constraint("uq_iss_fetch_log_timestamp", "iss_fetch_log", ["timestamp"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_iss_fetch_log_timestamp", "iss_fetch_log", type_="unique")
+    op.create_index("ix_iss_fetch_log_timestamp", "iss_fetch_log", ["timestamp"])
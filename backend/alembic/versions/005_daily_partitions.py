@@ -0,0 +1,139 @@
+"""Range partition iss_fetch_log and telemetry_legacy by day
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created ahead of today; later ones come from partition maintenance
+PREMAKE_DAYS = 7
+
+
+def _iss_columns() -> list:
+    return [
+        sa.Column("id", sa.Integer(), server_default=sa.text("nextval('iss_fetch_log_id_seq')"), nullable=False),
+        sa.Column("lat", sa.Float(), nullable=False, comment="Latitude"),
+        sa.Column("lon", sa.Float(), nullable=False, comment="Longitude"),
+        sa.Column("alt_km", sa.Float(), nullable=False, comment="Altitude in kilometers"),
+        sa.Column("velocity_kmh", sa.Float(), nullable=False, comment="Velocity in km/h"),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False, comment="Upstream timestamp of the position"),
+        sa.Column("source_url", sa.String(500), nullable=False, comment="API source URL"),
+        sa.Column("raw", postgresql.JSONB(), nullable=True, comment="Raw API response"),
+        sa.Column("inserted_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, comment="Record insertion time"),
+    ]
+
+
+def _telemetry_columns() -> list:
+    return [
+        sa.Column("id", sa.Integer(), server_default=sa.text("nextval('telemetry_legacy_id_seq')"), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False, comment="Time when telemetry was recorded"),
+        sa.Column("voltage", sa.Float(), nullable=False, comment="Voltage reading"),
+        sa.Column("temp", sa.Float(), nullable=False, comment="Temperature reading"),
+        sa.Column("source_file", sa.String(255), nullable=True, comment="Source CSV file name"),
+    ]
+
+
+def _set_aside(table: str, constraints: Sequence[str], indexes: Sequence[str]) -> None:
+    """Rename a table and its constraint/index names; detach its id sequence."""
+    op.rename_table(table, f"{table}_old")
+    for name in constraints:
+        op.execute(f"ALTER TABLE {table}_old RENAME CONSTRAINT {name} TO {name}_old")
+    for name in indexes:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_old")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+
+
+def _move_rows(table: str, columns: list) -> None:
+    """Copy the old table's rows over, then drop it and hand over the sequence."""
+    names = ", ".join(f'"{c.name}"' for c in columns)
+    op.execute(f"INSERT INTO {table} ({names}) SELECT {names} FROM {table}_old")
+    op.drop_table(f"{table}_old")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+
+def _create_partitions(table: str, column: str) -> None:
+    """
+    Daily partitions for every day with existing rows, today and PREMAKE_DAYS
+    ahead, plus a DEFAULT partition so inserts never fail for a day that has
+    no partition yet (maintenance moves such rows into their own partition).
+    """
+    op.execute(
+        f"""
+        DO $$
+        DECLARE day date;
+        BEGIN
+            FOR day IN
+                SELECT DISTINCT ("{column}" AT TIME ZONE 'UTC')::date FROM {table}_old
+                UNION
+                SELECT generate_series(0, {PREMAKE_DAYS}) + (now() AT TIME ZONE 'UTC')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                    '{table}_p' || to_char(day, 'YYYYMMDD'),
+                    day::timestamp AT TIME ZONE 'UTC',
+                    (day + 1)::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    # Retention drops whole daily partitions instead of DELETEing rows.
+    # Unique constraints of a partitioned table must include the partition
+    # key, so the primary keys become (id, <time column>).
+    _set_aside("iss_fetch_log", ["iss_fetch_log_pkey", "uq_iss_fetch_log_timestamp"], [])
+    op.create_table(
+        "iss_fetch_log",
+        *_iss_columns(),
+        sa.PrimaryKeyConstraint("id", "timestamp", name="iss_fetch_log_pkey"),
+        sa.UniqueConstraint("timestamp", name="uq_iss_fetch_log_timestamp"),
+        postgresql_partition_by="RANGE (timestamp)"
+    )
+    _create_partitions("iss_fetch_log", "timestamp")
+    _move_rows("iss_fetch_log", _iss_columns())
+
+    _set_aside("telemetry_legacy", ["telemetry_legacy_pkey"], ["ix_telemetry_legacy_recorded_at"])
+    op.create_table(
+        "telemetry_legacy",
+        *_telemetry_columns(),
+        sa.PrimaryKeyConstraint("id", "recorded_at", name="telemetry_legacy_pkey"),
+        postgresql_partition_by="RANGE (recorded_at)"
+    )
+    op.create_index("ix_telemetry_legacy_recorded_at", "telemetry_legacy", ["recorded_at"])
+    _create_partitions("telemetry_legacy", "recorded_at")
+    _move_rows("telemetry_legacy", _telemetry_columns())
+
+
+def downgrade() -> None:
+    _set_aside("telemetry_legacy", ["telemetry_legacy_pkey"], ["ix_telemetry_legacy_recorded_at"])
+    op.create_table(
+        "telemetry_legacy",
+        *_telemetry_columns(),
+        sa.PrimaryKeyConstraint("id", name="telemetry_legacy_pkey")
+    )
+    op.create_index("ix_telemetry_legacy_recorded_at", "telemetry_legacy", ["recorded_at"])
+    _move_rows("telemetry_legacy", _telemetry_columns())
+
+    _set_aside("iss_fetch_log", ["iss_fetch_log_pkey", "uq_iss_fetch_log_timestamp"], [])
+    op.create_table(
+        "iss_fetch_log",
+        *_iss_columns(),
+        sa.PrimaryKeyConstraint("id", name="iss_fetch_log_pkey"),
+        sa.UniqueConstraint("timestamp", name="uq_iss_fetch_log_timestamp")
+    )
+    _move_rows("iss_fetch_log", _iss_columns())
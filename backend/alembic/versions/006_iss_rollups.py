@@ -0,0 +1,47 @@
+"""Add hourly/daily ISS rollups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # iss_rollups - hourly/daily statistics, kept beyond raw data retention
+    op.create_table(
+        "iss_rollups",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("granularity", sa.String(8), nullable=False, comment="hour or day"),
+        sa.Column("bucket", sa.DateTime(timezone=True), nullable=False, comment="Bucket start (UTC)"),
+        sa.Column("samples", sa.Integer(), nullable=False, comment="Positions in the bucket"),
+        sa.Column("alt_sum", sa.Float(), nullable=False, comment="Sum of altitudes (km)"),
+        sa.Column("alt_min", sa.Float(), nullable=False, comment="Minimum altitude (km)"),
+        sa.Column("alt_max", sa.Float(), nullable=False, comment="Maximum altitude (km)"),
+        sa.Column("velocity_sum", sa.Float(), nullable=False, comment="Sum of velocities (km/h)"),
+        sa.Column("velocity_min", sa.Float(), nullable=False, comment="Minimum velocity (km/h)"),
+        sa.Column("velocity_max", sa.Float(), nullable=False, comment="Maximum velocity (km/h)"),
+        sa.Column("countries", postgresql.JSONB(), nullable=False, comment="Samples per overflown country code"),
+        sa.Column("source_inserted_at", sa.DateTime(timezone=True), nullable=False, comment="Latest inserted_at of the raw rows included (refresh watermark)"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, comment="Last refresh time"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("granularity", "bucket", name="uq_iss_rollups_granularity_bucket")
+    )
+    # The rollup job looks up rows inserted since its watermark
+    op.create_index("ix_iss_fetch_log_inserted_at", "iss_fetch_log", ["inserted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_iss_fetch_log_inserted_at", table_name="iss_fetch_log")
+    op.drop_table("iss_rollups")
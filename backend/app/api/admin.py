@@ -0,0 +1,77 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Request, Query
+
+from app.core.response import success_response
+from app.collectors.leader import leader_elector
+from app.collectors.scheduler import COLLECTOR_JOBS, JOB_IDS, scheduler
+from app.collectors.startup import check_fresh, startup_sources
+from app.collectors.telemetry import job_telemetry
+
+router = APIRouter()
+
+
+@router.get("/jobs")
+async def list_jobs(
+    request: Request,
+    history: int = Query(10, ge=0, le=20, description="Recent runs per job")
+):
+    """
+    Collector jobs with telemetry and per-source freshness.
+
+    For every job: schedule and APScheduler policies, run counters
+    (duration, outcome, rows written, lag, overlaps, misfires), recent run
+    history and whether the source's data in the DB is within TTL (None
+    for maintenance jobs such as the ISS gap backfill).
+    Telemetry is per process; only the collector leader runs scheduled jobs.
+    """
+    trace_id = request.state.trace_id
+
+    sources = {source.name: source for source in startup_sources()}
+
+    async def freshness(source_name: str) -> Optional[bool]:
+        source = sources.get(source_name)
+        return await check_fresh(source) if source else None
+
+    fresh = await asyncio.gather(*(freshness(job.source) for job in COLLECTOR_JOBS))
+    now = datetime.now(timezone.utc)
+
+    jobs = []
+    for job, is_fresh in zip(COLLECTOR_JOBS, fresh):
+        job_id = JOB_IDS[job.source]
+        scheduled = scheduler.get_job(job_id)
+        telemetry = job_telemetry.snapshot(job_id, history=history)
+        last_success = job_telemetry.stats_for(job_id).last_success_at
+        jobs.append({
+            "id": job_id,
+            "name": job.name,
+            "source": job.source,
+            "trigger": str(scheduled.trigger) if scheduled else None,
+            "next_run_time": (
+                scheduled.next_run_time.isoformat()
+                if scheduled and scheduled.next_run_time else None
+            ),
+            "policy": {
+                "coalesce": scheduled.coalesce,
+                "max_instances": scheduled.max_instances,
+                "misfire_grace_time": scheduled.misfire_grace_time,
+            } if scheduled else None,
+            "freshness": {
+                "fresh": is_fresh,
+                "seconds_since_success": (
+                    round((now - last_success).total_seconds(), 1) if last_success else None
+                ),
+            },
+            "telemetry": telemetry,
+        })
+
+    return success_response(
+        {
+            "leader": leader_elector.status(),
+            "scheduler_running": scheduler.running,
+            "jobs": jobs,
+        },
+        trace_id
+    )
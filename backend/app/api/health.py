@@ -1,8 +1,26 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from app.core.config import get_settings
 from app.core.database import get_session
+from app.clients.circuit_breaker import upstream_guard
+from app.clients.http_cache import validator_cache
+from app.clients.http_pool import http_client_registry
+from app.clients.rate_limit import rate_limit_governor
+from app.clients.retry_budget import retry_budgets
+from app.collectors.adaptive import change_tracker
+from app.collectors.leader import leader_elector
+from app.collectors.notify import data_update_listener
+from app.collectors.startup import startup_readiness
+from app.geo.geocoder import reverse_geocoder
+from app.orbit.engine import orbit_engine
+from app.services.iss_buffer import iss_position_buffer
+from app.orbit.groundtrack import groundtrack_cache
+from app.orbit.passes import pass_cache
+
+settings = get_settings()
 
 router = APIRouter()
 
@@ -13,7 +31,11 @@ async def health_check(session: AsyncSession = Depends(get_session)):
     Health check endpoint.
 
     Returns:
-        Status of the API and database connection.
+        Status of the API and database connection, plus upstream
+        connection pool, conditional GET, quota, circuit breaker and
+        retry budget state, whether this process leads the collectors and
+        the learned collector poll intervals, the offline geocoder and the
+        ISS orbit engine.
     """
     try:
         await session.execute(text("SELECT 1"))
@@ -24,5 +46,40 @@ async def health_check(session: AsyncSession = Depends(get_session)):
     return {
         "status": "ok" if db_status == "ok" else "degraded",
         "database": db_status,
+        "http_pools": http_client_registry.stats(),
+        "http_cache": validator_cache.stats(),
+        "rate_limits": rate_limit_governor.stats(),
+        "circuit_breakers": upstream_guard.stats(),
+        "retry_budgets": retry_budgets.stats(),
+        "collector_leader": {
+            "collectors_mode": settings.collectors_mode,
+            **leader_elector.status(),
+        },
+        "data_updates": data_update_listener.stats(),
+        "geocoder": reverse_geocoder.stats(),
+        "iss_position_buffer": iss_position_buffer.stats(),
+        "orbit": {
+            **orbit_engine.stats(),
+            "groundtrack_cache": groundtrack_cache.stats(),
+            "pass_cache": pass_cache.stats(),
+        },
+        "collector_schedule": {
+            "mode": settings.collector_schedule_mode,
+            "sources": change_tracker.stats(),
+        },
         "service": "Space Dashboard API"
     }
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    Readiness endpoint.
+
+    Returns 200 once the startup steps and the startup collection have
+    settled and 503 while they are still running, with the per-step and
+    per-source state and the list of warm sources (data fresh in the DB)
+    in both cases.
+    """
+    body = {**startup_readiness.snapshot(), "service": "Space Dashboard API"}
+    return JSONResponse(body, status_code=200 if startup_readiness.ready else 503)
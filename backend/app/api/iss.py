@@ -1,18 +1,36 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.database import get_session
-from app.core.response import success_response
+from app.core.response import encoded_success_response, success_response
 from app.repositories.iss_repository import ISSRepository
+from app.repositories.iss_rollup_repository import ISSRollupRepository
+from app.repositories.space_cache_repository import SpaceCacheRepository
 from app.services.iss_service import ISSService
+from app.services.iss_stats_service import ISSStatsService
+from app.services.orbit_service import OrbitService
 
 router = APIRouter()
+settings = get_settings()
 
 
 def get_iss_service(session: AsyncSession = Depends(get_session)) -> ISSService:
     """Dependency to get ISS service instance."""
     repository = ISSRepository(session)
-    return ISSService(repository)
+    return ISSService(repository, OrbitService(SpaceCacheRepository(session)))
+
+
+def get_orbit_service(session: AsyncSession = Depends(get_session)) -> OrbitService:
+    """Dependency to get orbit prediction service instance."""
+    return OrbitService(SpaceCacheRepository(session))
+
+
+def get_iss_stats_service(session: AsyncSession = Depends(get_session)) -> ISSStatsService:
+    """Dependency to get ISS statistics service instance."""
+    return ISSStatsService(ISSRollupRepository(session))
 
 
 @router.get("/last")
@@ -23,7 +41,9 @@ async def get_latest_position(
     """
     Get the latest ISS position.
 
-    Returns position data if fresh (< 10 minutes old), otherwise NO_DATA error.
+    Propagated from the latest TLE for the current instant ("source":
+    "sgp4"); without one, the latest poll if fresh (< 10 minutes old,
+    "source": "poll"), otherwise NO_DATA error.
     Per TASK.md: HTTP status is always 200.
     """
     trace_id = request.state.trace_id
@@ -37,6 +57,9 @@ async def get_trend(
     request: Request,
     hours: int = Query(default=24, ge=1, le=168, description="Hours to look back"),
     limit: int = Query(default=100, ge=1, le=1000, description="Max positions"),
+    points: Optional[int] = Query(
+        default=None, ge=3, le=5000, description="Downsample the whole window to this many positions"
+    ),
     service: ISSService = Depends(get_iss_service)
 ):
     """
@@ -45,52 +68,108 @@ async def get_trend(
     Args:
         hours: Number of hours to look back (1-168)
         limit: Maximum number of positions to return (1-1000)
+        points: Downsample the whole window to at most this many positions
+            (LTTB over the ground track) instead of returning the newest
+            limit positions; the response adds points and total
+
+    Served from the in-memory position buffer as pre-serialized JSON.
+    """
+    trace_id = request.state.trace_id
+
+    data = await service.get_trend_json(hours=hours, limit=limit, points=points)
+    return encoded_success_response(data, trace_id)
+
+
+@router.get("/groundtrack")
+async def get_groundtrack(
+    request: Request,
+    orbits: int = Query(default=3, ge=1, le=16, description="Orbits to predict"),
+    step_seconds: int = Query(default=60, ge=10, le=600, description="Seconds between points"),
+    service: OrbitService = Depends(get_orbit_service)
+):
+    """
+    Predicted ISS ground track for the next orbits.
+
+    Returns a GeoJSON MultiLineString ([lon, lat] points) split at the
+    antimeridian. Responses are cached per TLE epoch and resolution;
+    refetch after valid_until.
     """
     trace_id = request.state.trace_id
 
-    data = await service.get_trend(hours=hours, limit=limit)
+    data = await service.get_groundtrack(orbits=orbits, step_seconds=step_seconds)
+    return success_response(data, trace_id)
+
+
+@router.get("/passes")
+async def get_passes(
+    request: Request,
+    latitude: float = Query(..., ge=-90, le=90, description="Observer latitude"),
+    longitude: float = Query(..., ge=-180, le=180, description="Observer longitude"),
+    elevation: int = Query(default=0, ge=0, description="Observer elevation in meters"),
+    days: int = Query(default=3, ge=1, le=10, description="Days to look ahead"),
+    min_elevation: float = Query(default=10, ge=0, le=90, description="Minimum peak elevation (deg)"),
+    visible_only: bool = Query(default=False, description="Only passes visible to the eye"),
+    service: OrbitService = Depends(get_orbit_service)
+):
+    """
+    Predicted ISS passes over an observer.
+
+    Each pass has rise, culmination and set times with azimuths, the
+    maximum elevation, and whether the ISS is sunlit and visible (sunlit
+    while the observer is in darkness). Results are cached per quantized
+    location and TLE epoch.
+    """
+    trace_id = request.state.trace_id
+
+    data = await service.get_passes(
+        latitude=latitude,
+        longitude=longitude,
+        elevation_m=elevation,
+        days=days,
+        min_elevation=min_elevation,
+        visible_only=visible_only
+    )
+    return success_response(data, trace_id)
+
+
+@router.get("/stats")
+async def get_stats(
+    request: Request,
+    granularity: str = Query(default="day", pattern="^(hour|day)$", description="hour or day buckets"),
+    days: int = Query(default=7, ge=1, le=366, description="Days to look back (hourly: up to 31)"),
+    service: ISSStatsService = Depends(get_iss_stats_service)
+):
+    """
+    ISS statistics per hour or day.
+
+    Each bucket has the number of samples, altitude and velocity
+    min/avg/max and samples per overflown country, plus a summary of the
+    whole range. Read from rollup tables, so ranges beyond the raw data
+    retention keep working.
+    """
+    trace_id = request.state.trace_id
+
+    data = await service.get_stats(granularity=granularity, days=days)
     return success_response(data, trace_id)
 
 
 @router.get("/export/csv")
 async def export_csv(
-    hours: int = Query(default=24, ge=1, le=168, description="Hours to look back"),
+    hours: int = Query(
+        default=24, ge=1, le=settings.iss_retention_days * 24, description="Hours to look back"
+    ),
     service: ISSService = Depends(get_iss_service)
 ):
     """
     Export ISS position history as CSV.
+
+    Streamed from a server-side cursor in chunks; any range up to the
+    retention window is exported in full.
     """
     from fastapi.responses import StreamingResponse
-    import io
-    import csv
-
-    # Fetch data (no limit, or high limit)
-    data = await service.get_trend(hours=hours, limit=10000)
-    positions = data["positions"]
-
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow(["timestamp", "latitude", "longitude", "altitude_km", "velocity_kmh", "visibility", "country_code"])
-    
-    # Rows
-    for pos in positions:
-        writer.writerow([
-            pos["timestamp"],
-            pos["latitude"],
-            pos["longitude"],
-            pos["altitude_km"],
-            pos["velocity_kmh"],
-            pos.get("visibility", ""),
-            pos.get("country_code", "")
-        ])
-    
-    output.seek(0)
-    
+
     return StreamingResponse(
-        io.BytesIO(output.getvalue().encode()),
+        service.export_csv(hours=hours),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=iss_history_{hours}h.csv"}
     )
@@ -0,0 +1,68 @@
+from typing import Optional
+
+from fastapi import APIRouter, Request, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.response import success_response
+from app.clients.circuit_breaker import upstream_guard
+from app.clients.http_pool import http_client_registry
+from app.clients.latency import latency_tracker
+from app.clients.metrics import upstream_metrics
+from app.clients.rate_limit import rate_limit_governor
+from app.clients.retry_budget import retry_budgets
+
+router = APIRouter()
+
+_BREAKER_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+@router.get("", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Upstream metrics in Prometheus text exposition format.
+
+    Request duration histograms, response bytes, status classes, retries
+    and timeouts per host/path, plus quota, breaker, retry budget and
+    pool gauges.
+    """
+    lines = upstream_metrics.prometheus_lines()
+
+    lines.append("# TYPE upstream_rate_limit_remaining gauge")
+    for host, budget in rate_limit_governor.stats().items():
+        lines.append(f'upstream_rate_limit_remaining{{host="{host}"}} {budget["remaining"]}')
+
+    lines.append("# TYPE upstream_circuit_state gauge")
+    for host, breaker in upstream_guard.stats().items():
+        value = _BREAKER_STATE_VALUES[breaker["state"]]
+        lines.append(f'upstream_circuit_state{{host="{host}"}} {value}')
+
+    lines.append("# TYPE upstream_retry_budget_exhausted_total counter")
+    for host, budget in retry_budgets.stats().items():
+        lines.append(f'upstream_retry_budget_exhausted_total{{host="{host}"}} {budget["retries_suppressed"]}')
+
+    lines.append("# TYPE upstream_pool_connections_reused_total counter")
+    for host, pool in http_client_registry.stats().items():
+        lines.append(f'upstream_pool_connections_reused_total{{host="{host}"}} {pool["connections_reused"]}')
+
+    return "\n".join(lines) + "\n"
+
+
+@router.get("/upstream")
+async def upstream_metrics_json(
+    request: Request,
+    trace_id: Optional[str] = Query(default=None, description="Only recent calls of this trace"),
+    recent: int = Query(default=50, ge=0, le=500, description="Recent calls to include")
+):
+    """
+    Upstream call metrics as JSON.
+
+    Per host/path aggregates, latency percentiles and the most recent
+    request attempts tagged with their trace_id.
+    """
+    data = {
+        "endpoints": upstream_metrics.snapshot(),
+        "latency": latency_tracker.stats(),
+        "retry_budgets": retry_budgets.stats(),
+        "recent": upstream_metrics.recent(limit=recent, trace_id=trace_id),
+    }
+    return success_response(data, request.state.trace_id)
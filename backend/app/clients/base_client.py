@@ -1,7 +1,12 @@
+import asyncio
+import functools
 import httpx
 import logging
+import time
 from tenacity import (
+    RetryCallState,
     retry,
+    retry_all,
     stop_after_attempt,
     wait_exponential_jitter,
     retry_if_exception_type
@@ -9,8 +14,17 @@ from tenacity import (
 from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlsplit
 
+from app.clients import json_codec
+from app.clients.circuit_breaker import upstream_guard
+from app.clients.http_cache import NotModified, validator_cache
+from app.clients.http_pool import http_client_registry
+from app.clients.latency import latency_tracker
+from app.clients.metrics import RequestEvent, upstream_metrics
+from app.clients.rate_limit import rate_limit_governor
+from app.clients.retry_budget import retry_budgets, retry_if_budget_allows
 from app.core.config import get_settings
 from app.core.exceptions import UpstreamError, RateLimitedError
+from app.middleware.trace_id import trace_id_var
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -26,30 +40,79 @@ def split_base_and_path(url: str) -> Tuple[str, str]:
     return base_url, path
 
 
+def _record_retry(retry_state: RetryCallState) -> None:
+    """tenacity before_sleep hook: count a retry for the client's endpoint."""
+    client = retry_state.args[0]
+    path = retry_state.args[1] if len(retry_state.args) > 1 else retry_state.kwargs["path"]
+    upstream_metrics.emit(RequestEvent(
+        host=client.base_url,
+        path=path,
+        method="GET" if retry_state.fn.__name__ == "_get_response" else "POST",
+        outcome="retry",
+        trace_id=trace_id_var.get()
+    ))
+
+
+# Attempts per call, including the first one
+UPSTREAM_ATTEMPTS = 3
+
+# Retries are limited per host by a shared budget (see RetryBudget), so
+# overlapping collectors and refreshes cannot multiply load on an
+# upstream that is already failing.
+upstream_retry = retry(
+    stop=stop_after_attempt(UPSTREAM_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=1, max=10, jitter=2),
+    retry=retry_all(
+        retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout)),
+        retry_if_budget_allows(UPSTREAM_ATTEMPTS)
+    ),
+    before_sleep=_record_retry,
+    reraise=True
+)
+
+
 class BaseAPIClient:
     """
     Base HTTP client with retry logic and error handling.
 
     Features:
-    - Automatic retry with exponential backoff and jitter
+    - Automatic retry with exponential backoff and jitter, capped by a
+      per-host retry budget
     - Timeout handling
-    - Rate limit detection
+    - Rate limit detection and per-host quota budgeting
     - Upstream error classification (4xx vs 5xx)
+    - Shared per-host connection pools (see HTTPClientRegistry)
+    - Optional conditional GET (ETag / Last-Modified revalidation)
+    - Per-host circuit breaker and concurrency bulkhead
+    - Per-endpoint timeouts derived from observed p99 latency
+    - Optional hedged GETs for latency-sensitive clients
+    - Instrumentation events per request attempt (see UpstreamInstrumentation)
     """
 
     def __init__(
         self,
         base_url: str,
         timeout: Optional[int] = None,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        conditional: bool = False,
+        hedge: bool = False
     ):
         self.base_url = base_url
         self.timeout = timeout or settings.http_timeout_seconds
         self.headers = headers or {}
+        self.conditional = conditional
+        self.hedge = hedge
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """
+        Get HTTP client.
+
+        Borrows the process-wide pooled client for this host; a private
+        client is only created when pooling is disabled.
+        """
+        if settings.http_pool_enabled:
+            return http_client_registry.get_client(self.base_url)
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
@@ -59,17 +122,177 @@ class BaseAPIClient:
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client (pooled clients stay open for reuse)."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential_jitter(initial=1, max=10, jitter=2),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout)),
-        reraise=True
-    )
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Send a request, hedging idempotent GETs when enabled.
+
+        A hedged duplicate is started once the primary has been running
+        longer than the endpoint's observed p95; the first successful
+        response wins and the other request is cancelled.
+        """
+        send = functools.partial(
+            self._send_once,
+            method, path, params=params, headers=headers, data=data, json=json
+        )
+
+        delay = None
+        if self.hedge and method == "GET":
+            delay = latency_tracker.hedge_delay(self.base_url, path)
+        if delay is None:
+            return await send()
+
+        primary = asyncio.create_task(send())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        logger.info(f"Hedging slow request to {self.base_url}{path} after {delay:.2f}s")
+        pending = {primary, asyncio.create_task(send())}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        Send one request through the circuit breaker, bulkhead and quota
+        governor for this host, and classify the response status.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+            RateLimitedError: If rate limited (429) or out of quota
+            UpstreamError: If upstream returns 4xx/5xx or times out
+        """
+        client = await self._get_client()
+        action = "fetching" if method == "GET" else "posting to"
+
+        # Quota first: a locally shed call must not count for (or close) the
+        # breaker, and waiting for a token must not hold a bulkhead slot
+        await rate_limit_governor.acquire(self.base_url)
+
+        async with upstream_guard.call(self.base_url):
+            timeout = latency_tracker.timeout_for(self.base_url, path, self.timeout)
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    method,
+                    path,
+                    params=params,
+                    headers=headers if headers is not None else self.headers,
+                    data=data,
+                    json=json,
+                    timeout=timeout
+                )
+            except httpx.TimeoutException:
+                self._emit(method, path, "timeout", started)
+                # Count the timeout as a sample at the timeout value: once the
+                # upstream slows past it, p99 (and so the timeout) grows with it
+                latency_tracker.observe(self.base_url, path, timeout)
+                logger.warning(f"Timeout {action} {self.base_url}{path}")
+                raise UpstreamError(504, f"Timeout {action} {path}")
+            except httpx.ConnectError as e:
+                self._emit(method, path, "connect_error", started)
+                logger.warning(f"Connection error {action} {self.base_url}{path}: {e}")
+                raise
+
+            self._emit(method, path, "response", started, response)
+            if response.status_code < 500:
+                retry_budgets.record_success(self.base_url)
+            latency_tracker.observe(self.base_url, path, time.perf_counter() - started)
+            rate_limit_governor.observe(self.base_url, response)
+
+            if response.status_code == 429:
+                logger.warning(f"Rate limited by {self.base_url}")
+                raise RateLimitedError()
+
+            if response.status_code >= 400:
+                logger.warning(
+                    f"Upstream error from {self.base_url}{path}: {response.status_code}"
+                )
+                raise UpstreamError(
+                    response.status_code,
+                    f"Upstream API error: {response.status_code}"
+                )
+
+        return response
+
+    def _emit(
+        self,
+        method: str,
+        path: str,
+        outcome: str,
+        started: float,
+        response: Optional[httpx.Response] = None
+    ) -> None:
+        """Report one request attempt to the instrumentation hooks."""
+        upstream_metrics.emit(RequestEvent(
+            host=self.base_url,
+            path=path,
+            method=method,
+            outcome=outcome,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            status_code=response.status_code if response is not None else None,
+            response_bytes=len(response.content) if response is not None else 0,
+            trace_id=trace_id_var.get()
+        ))
+
+    @upstream_retry
+    async def _get_response(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """GET with automatic retry and optional conditional revalidation."""
+        headers = dict(self.headers)
+        cache_key = None
+        if self.conditional:
+            cache_key = validator_cache.make_key(self.base_url, path, params)
+            validators = validator_cache.get(cache_key)
+            if validators is not None:
+                headers.update(validators.request_headers())
+
+        response = await self._send("GET", path, params=params, headers=headers)
+
+        if cache_key is not None:
+            if response.status_code == 304:
+                validator_cache.hits += 1
+                raise NotModified(cache_key)
+            validator_cache.misses += 1
+            validator_cache.store(cache_key, response)
+
+        return response
+
     async def get(
         self,
         path: str,
@@ -86,41 +309,41 @@ class BaseAPIClient:
             JSON response as dict
 
         Raises:
+            NotModified: If conditional and upstream returns 304
+            CircuitOpenError: If the host's circuit is open
             RateLimitedError: If rate limited (429)
             UpstreamError: If upstream returns 4xx/5xx
         """
-        client = await self._get_client()
+        response = await self._get_response(path, params=params)
+        return json_codec.loads(response.content)
 
-        try:
-            response = await client.get(path, params=params)
-        except httpx.TimeoutException:
-            logger.warning(f"Timeout fetching {self.base_url}{path}")
-            raise UpstreamError(504, f"Timeout fetching {path}")
-        except httpx.ConnectError as e:
-            logger.warning(f"Connection error fetching {self.base_url}{path}: {e}")
-            raise
-
-        if response.status_code == 429:
-            logger.warning(f"Rate limited by {self.base_url}")
-            raise RateLimitedError()
-
-        if response.status_code >= 400:
-            logger.warning(
-                f"Upstream error from {self.base_url}{path}: {response.status_code}"
-            )
-            raise UpstreamError(
-                response.status_code,
-                f"Upstream API error: {response.status_code}"
-            )
+    async def get_raw(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Make a GET request and return the undecoded JSON body.
+
+        For payloads that are stored as-is: the bytes can be handed to
+        Postgres (which parses them into JSONB) without building Python
+        objects or re-encoding them. Raises the same errors as get().
 
-        return response.json()
+        The body is only sniffed (content type and first byte), so e.g.
+        an HTML error page served with 200 fails here as an upstream
+        error instead of inside the database insert.
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential_jitter(initial=1, max=10, jitter=2),
-        retry=retry_if_exception_type((httpx.ConnectError, httpx.ReadTimeout)),
-        reraise=True
-    )
+        Raises:
+            UpstreamError: If the body does not look like JSON (502)
+        """
+        response = await self._get_response(path, params=params)
+        content_type = response.headers.get("Content-Type", "")
+        if (content_type and "json" not in content_type) or not json_codec.looks_like_json(response.content):
+            logger.warning(f"Non-JSON body from {self.base_url}{path} ({content_type or 'no content type'})")
+            raise UpstreamError(502, f"Upstream returned a non-JSON body for {path}")
+        return response.content
+
+    @upstream_retry
     async def post(
         self,
         path: str,
@@ -128,27 +351,8 @@ class BaseAPIClient:
         json: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Make a POST request with automatic retry."""
-        client = await self._get_client()
-
-        try:
-            response = await client.post(path, data=data, json=json)
-        except httpx.TimeoutException:
-            logger.warning(f"Timeout posting to {self.base_url}{path}")
-            raise UpstreamError(504, f"Timeout posting to {path}")
-        except httpx.ConnectError as e:
-            logger.warning(f"Connection error posting to {self.base_url}{path}: {e}")
-            raise
-
-        if response.status_code == 429:
-            raise RateLimitedError()
-
-        if response.status_code >= 400:
-            raise UpstreamError(
-                response.status_code,
-                f"Upstream API error: {response.status_code}"
-            )
-
-        return response.json()
+        response = await self._send("POST", path, data=data, json=json)
+        return json_codec.loads(response.content)
 
     async def __aenter__(self):
         return self
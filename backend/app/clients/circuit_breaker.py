@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Deque, Dict, Any, AsyncIterator, Tuple
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.exceptions import CircuitOpenError, UpstreamError
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for a single upstream host.
+
+    - CLOSED: calls pass; outcomes are kept for a sliding time window and the
+      circuit opens when the failure rate crosses the threshold
+    - OPEN: calls fail immediately with CircuitOpenError until the cool-down ends
+    - HALF_OPEN: a limited number of probe calls decide whether to close again
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.rejected = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - settings.circuit_window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+
+    def failure_rate(self) -> float:
+        self._prune(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / len(self._outcomes)
+
+    def allow(self) -> None:
+        """
+        Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or probes are exhausted
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < settings.circuit_open_seconds:
+                self.rejected += 1
+                raise CircuitOpenError(self.base_url)
+            self.state = CircuitState.HALF_OPEN
+            logger.info(f"Circuit for {self.base_url} half-open, probing")
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self.probes_in_flight >= settings.circuit_half_open_max_calls:
+                self.rejected += 1
+                raise CircuitOpenError(self.base_url)
+            self.probes_in_flight += 1
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of an admitted call."""
+        now = time.monotonic()
+
+        if self.state == CircuitState.HALF_OPEN:
+            self.probes_in_flight = max(self.probes_in_flight - 1, 0)
+            if ok:
+                self.state = CircuitState.CLOSED
+                self._outcomes.clear()
+                logger.info(f"Circuit for {self.base_url} closed")
+            else:
+                self._open(now)
+            return
+
+        self._outcomes.append((now, ok))
+        self._prune(now)
+        if (
+            self.state == CircuitState.CLOSED
+            and len(self._outcomes) >= settings.circuit_min_calls
+            and self.failure_rate() >= settings.circuit_failure_rate_threshold
+        ):
+            self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+        logger.warning(
+            f"Circuit for {self.base_url} opened for {settings.circuit_open_seconds}s"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "failure_rate": round(self.failure_rate(), 3),
+            "calls_in_window": len(self._outcomes),
+            "rejected": self.rejected,
+        }
+
+
+class UpstreamGuard:
+    """
+    Per-host circuit breakers plus concurrency bulkheads.
+
+    Each host gets at most upstream_max_concurrency in-flight calls; callers
+    that cannot get a slot quickly fail instead of queueing behind a slow
+    upstream and holding DB sessions or request handlers.
+    """
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._bulkheads: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def breaker(self, base_url: str) -> CircuitBreaker:
+        breaker = self._breakers.get(base_url)
+        if breaker is None:
+            breaker = CircuitBreaker(base_url)
+            self._breakers[base_url] = breaker
+        return breaker
+
+    def _bulkhead(self, base_url: str) -> asyncio.Semaphore:
+        semaphore = self._bulkheads.get(base_url)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(settings.upstream_max_concurrency)
+            self._bulkheads[base_url] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _is_failure(exc: BaseException) -> bool:
+        if isinstance(exc, httpx.TransportError):
+            return True
+        return isinstance(exc, UpstreamError) and exc.status_code >= 500
+
+    @asynccontextmanager
+    async def call(self, base_url: str) -> AsyncIterator[None]:
+        """
+        Guard one upstream call.
+
+        Transport errors and 5xx UpstreamErrors raised inside the block count
+        as failures; anything else (including 4xx and 429) counts as success.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            UpstreamError: If no concurrency slot frees up in time (503)
+        """
+        breaker = self.breaker(base_url)
+        breaker.allow()
+
+        semaphore = self._bulkhead(base_url)
+        try:
+            await asyncio.wait_for(
+                semaphore.acquire(),
+                timeout=settings.upstream_bulkhead_wait_seconds
+            )
+        except asyncio.TimeoutError:
+            if breaker.state == CircuitState.HALF_OPEN:
+                breaker.probes_in_flight = max(breaker.probes_in_flight - 1, 0)
+            logger.warning(f"Bulkhead full for {base_url}")
+            raise UpstreamError(503, f"Too many concurrent calls to {base_url}")
+
+        self._in_flight[base_url] = self._in_flight.get(base_url, 0) + 1
+        try:
+            yield
+        except asyncio.CancelledError:
+            if breaker.state == CircuitState.HALF_OPEN:
+                breaker.probes_in_flight = max(breaker.probes_in_flight - 1, 0)
+            raise
+        except BaseException as exc:
+            breaker.record(not self._is_failure(exc))
+            raise
+        else:
+            breaker.record(True)
+        finally:
+            self._in_flight[base_url] -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and bulkhead usage per host."""
+        return {
+            base_url: {
+                **breaker.to_dict(),
+                "in_flight": self._in_flight.get(base_url, 0),
+                "max_concurrency": settings.upstream_max_concurrency,
+            }
+            for base_url, breaker in self._breakers.items()
+        }
+
+
+# Global guard instance
+upstream_guard = UpstreamGuard()
@@ -0,0 +1,125 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class NotModified(Exception):
+    """
+    Raised by a conditional GET when the upstream answers 304.
+
+    Callers treat it as "payload unchanged since the last fetch".
+    """
+
+    def __init__(self, cache_key: str):
+        self.cache_key = cache_key
+        super().__init__(f"Not modified: {cache_key}")
+
+
+@dataclass
+class CacheValidators:
+    """Validators (RFC 9111 / RFC 9110) stored for one request."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: Optional[datetime] = None
+
+    def request_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """
+    In-process store of ETag/Last-Modified validators per URL + params.
+
+    Only validators are kept; payloads live in the database, so a 304
+    simply means the stored row is still current.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, CacheValidators] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(base_url: str, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Cache key for a request.
+
+        The query string is digested so keys never carry API keys and can
+        be logged or persisted (see export()).
+        """
+        query = urlencode(sorted((params or {}).items()))
+        if not query:
+            return f"{base_url}{path}"
+        return f"{base_url}{path}?{hashlib.blake2b(query.encode(), digest_size=8).hexdigest()}"
+
+    def get(self, key: str) -> Optional[CacheValidators]:
+        return self._entries.get(key)
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """Remember the validators of a 200 response (unless no-store)."""
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            self._entries.pop(key, None)
+            return
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = CacheValidators(
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=datetime.now(timezone.utc)
+        )
+
+    def discard(self, key: str) -> None:
+        """Forget validators so the next request is unconditional."""
+        self._entries.pop(key, None)
+
+    def export(self, prefix: str) -> Dict[str, Dict[str, Optional[str]]]:
+        """Validators of all keys starting with prefix, as JSON-safe dicts."""
+        return {
+            key: {
+                "etag": v.etag,
+                "last_modified": v.last_modified,
+                "stored_at": v.stored_at.isoformat() if v.stored_at else None,
+            }
+            for key, v in self._entries.items()
+            if key.startswith(prefix)
+        }
+
+    def restore(self, entries: Dict[str, Dict[str, Optional[str]]]) -> None:
+        """Load validators produced by export() (e.g. after a restart)."""
+        for key, data in entries.items():
+            stored_at = data.get("stored_at")
+            self._entries.setdefault(key, CacheValidators(
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                stored_at=datetime.fromisoformat(stored_at) if stored_at else None
+            ))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "not_modified": self.hits,
+            "modified": self.misses,
+        }
+
+
+# Global validator cache instance
+validator_cache = ValidatorCache()
@@ -0,0 +1,150 @@
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, Optional
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class PoolStats:
+    """Connection reuse counters for a single upstream host."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    warmed: bool = False
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        reuse_ratio = (
+            self.connections_reused / self.requests if self.requests else 0.0
+        )
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "reuse_ratio": round(reuse_ratio, 3),
+            "warmed": self.warmed,
+        }
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide registry of long-lived, per-host HTTP connection pools.
+
+    Every BaseAPIClient borrows its httpx.AsyncClient from here instead of
+    creating (and closing) one per collector run, so DNS, TCP and TLS setup
+    is paid once per host rather than once per poll.
+
+    Features:
+    - One pooled client per base URL with configurable limits and keep-alive
+    - Optional HTTP/2 (requires the 'h2' package)
+    - Connection warm-up at startup
+    - Reuse statistics per host (requests vs. newly opened connections)
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, PoolStats] = {}
+
+    @staticmethod
+    def _http2_enabled() -> bool:
+        if not settings.http2_enabled:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+            return False
+        return True
+
+    def _build_client(self, base_url: str) -> httpx.AsyncClient:
+        stats = self._stats.setdefault(base_url, PoolStats())
+
+        async def _trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+
+        async def _on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = _trace
+
+        return httpx.AsyncClient(
+            base_url=base_url,
+            timeout=settings.http_timeout_seconds,
+            http2=self._http2_enabled(),
+            limits=httpx.Limits(
+                max_connections=settings.http_pool_max_connections,
+                max_keepalive_connections=settings.http_pool_max_keepalive,
+                keepalive_expiry=settings.http_pool_keepalive_expiry_seconds,
+            ),
+            event_hooks={"request": [_on_request]},
+            transport=self._transport,
+        )
+
+    def get_client(self, base_url: str) -> httpx.AsyncClient:
+        """Get the shared client for a base URL, creating it on first use."""
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = self._build_client(base_url)
+            self._clients[base_url] = client
+        return client
+
+    async def warmup(self, base_urls: Iterable[str]) -> None:
+        """
+        Open one connection per host so the first real poll reuses it.
+
+        Failures are logged and ignored; warm-up is best effort.
+        """
+        async def _warm(base_url: str) -> None:
+            client = self.get_client(base_url)
+            try:
+                await client.head("/", timeout=settings.http_pool_warmup_timeout_seconds)
+                self._stats[base_url].warmed = True
+            except httpx.HTTPError as e:
+                logger.info(f"Connection warm-up failed for {base_url}: {e}")
+
+        unique = sorted(set(base_urls))
+        await asyncio.gather(*(_warm(url) for url in unique))
+        logger.info(f"HTTP pools warmed for {len(unique)} hosts")
+
+    async def aclose(self) -> None:
+        """Close every pooled client (called on application shutdown)."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
+        logger.info(f"Closed {len(clients)} pooled HTTP clients")
+
+    def stats(self, base_url: Optional[str] = None) -> Dict[str, Any]:
+        """Return reuse statistics for one host or for all hosts."""
+        if base_url is not None:
+            return self._stats.get(base_url, PoolStats()).to_dict()
+        return {url: s.to_dict() for url, s in self._stats.items()}
+
+
+# Global registry instance
+http_client_registry = HTTPClientRegistry()
+
+
+def upstream_base_urls() -> Iterable[str]:
+    """Base URLs of all configured upstreams (used for warm-up)."""
+    from app.clients.base_client import split_base_and_path
+
+    urls = [
+        settings.iss_api_url,
+        settings.osdr_api_url,
+        settings.apod_api_url,
+        settings.spacex_api_url,
+        settings.jwst_api_url,
+    ]
+    return [split_base_and_path(url)[0] for url in urls]
@@ -1,10 +1,24 @@
-from typing import Dict, Any
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
 
 from app.clients.base_client import BaseAPIClient, split_base_and_path
 from app.core.config import get_settings
+from app.geo.geocoder import reverse_geocoder
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Upper limit of the positions endpoint
+MAX_TIMESTAMPS_PER_REQUEST = 10
+
+
+def upstream_time(timestamp: Optional[Any]) -> datetime:
+    """Position time reported by the upstream (unix seconds), or now if missing."""
+    if timestamp is None:
+        return datetime.now(timezone.utc)
+    return datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
+
 
 class ISSClient(BaseAPIClient):
     """
@@ -16,7 +30,7 @@ class ISSClient(BaseAPIClient):
 
     def __init__(self):
         base_url, path = split_base_and_path(settings.iss_api_url)
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, hedge=True)
         self._position_path = path
 
     async def get_position(self) -> Dict[str, Any]:
@@ -24,21 +38,29 @@ class ISSClient(BaseAPIClient):
         Fetch current ISS position and location info.
 
         Returns:
-            Dict with keys: latitude, longitude, altitude, velocity, visibility, raw
-            raw includes 'location_info' from coordinates endpoint.
+            Dict with keys: latitude, longitude, altitude, velocity, visibility,
+            timestamp (upstream position time), raw
+            raw includes 'location_info' (country_code, timezone_id) from the
+            offline reverse geocoder, or from the coordinates endpoint when no
+            boundary data is configured or it is still loading.
         """
         data = await self.get(self._position_path)
         
         # Enrich with location info (country, timezone)
         location_info = {}
-        try:
-            lat = data.get("latitude")
-            lon = data.get("longitude")
-            if lat is not None and lon is not None:
-                location_info = await self.get(f"/v1/coordinates/{lat},{lon}")
-        except Exception:
-            # Ignore location fetch errors, main position is more important
-            pass
+        lat = data.get("latitude")
+        lon = data.get("longitude")
+        if lat is not None and lon is not None:
+            # Never load here: building the index would block the event loop
+            # (it is loaded at startup in a thread; until then use upstream)
+            if reverse_geocoder.loaded:
+                location_info = reverse_geocoder.lookup(float(lat), float(lon))
+            else:
+                try:
+                    location_info = await self.get(f"/v1/coordinates/{lat},{lon}")
+                except Exception as e:
+                    # Main position is more important than location info
+                    logger.warning(f"ISS location lookup failed: {e}")
 
         # Merge location info into raw data
         full_data = {**data, "location_info": location_info}
@@ -49,6 +71,30 @@ class ISSClient(BaseAPIClient):
             "altitude": data.get("altitude"),
             "velocity": data.get("velocity"),
             "visibility": data.get("visibility"),
+            "timestamp": upstream_time(data.get("timestamp")),
             "source_url": settings.iss_api_url,
             "raw": full_data
         }
+
+    async def get_positions(self, timestamps: List[int]) -> List[Dict[str, Any]]:
+        """
+        Fetch historical ISS positions for up to 10 unix timestamps at once.
+
+        Returns the upstream position objects (same format as get_position's
+        raw, without location info).
+        """
+        if len(timestamps) > MAX_TIMESTAMPS_PER_REQUEST:
+            raise ValueError(f"At most {MAX_TIMESTAMPS_PER_REQUEST} timestamps per request")
+        return await self.get(
+            f"{self._position_path.rstrip('/')}/positions",
+            params={"timestamps": ",".join(str(t) for t in timestamps), "units": "kilometers"}
+        )
+
+    async def get_tle(self) -> Dict[str, Any]:
+        """
+        Fetch the current ISS two-line element set.
+
+        Returns:
+            Dict with keys: header, line1, line2, tle_timestamp (upstream format)
+        """
+        return await self.get(f"{self._position_path.rstrip('/')}/tles")
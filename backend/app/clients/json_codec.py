@@ -0,0 +1,36 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a JSON body straight from bytes.
+
+    Uses orjson when installed (no intermediate str copy, much faster on
+    large payloads); falls back to the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def looks_like_json(raw: bytes) -> bool:
+    """Cheap check of an encoded body: starts with an object or array."""
+    return raw.lstrip()[:1] in (b"{", b"[")
+
+
+def wrap(key: str, raw: bytes) -> bytes:
+    """Wrap an encoded JSON value as {key: value} without decoding it."""
+    return b'{' + dumps(key) + b':' + raw + b'}'
@@ -18,7 +18,8 @@ class JWSTClient(BaseAPIClient):
         base_url, _ = split_base_and_path(settings.jwst_api_url)
         super().__init__(
             base_url=base_url,
-            headers={"x-api-key": settings.jwst_api_key}
+            headers={"x-api-key": settings.jwst_api_key},
+            hedge=True
         )
 
     async def get_program_list(self) -> Dict[str, Any]:
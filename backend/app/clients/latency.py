@@ -0,0 +1,111 @@
+import re
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Path segments that carry identifiers rather than routes:
+# numbers, coordinate pairs ("51.5,-0.12"), hex ids / UUIDs
+_ID_SEGMENT = re.compile(
+    r"^(-?\d+(\.\d+)?(,-?\d+(\.\d+)?)*|[0-9a-fA-F-]{16,}|[A-Za-z]+-\d+)$"
+)
+
+
+def path_template(path: str) -> str:
+    """
+    Collapse identifier segments of a URL path into '{id}'.
+
+    '/v1/coordinates/51.5,-0.12' -> '/v1/coordinates/{id}'
+    """
+    path = path.split("?", 1)[0]
+    segments = [
+        "{id}" if segment and _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    ]
+    return "/".join(segments) or "/"
+
+
+def _percentile(sorted_samples: list, q: float) -> float:
+    index = min(int(round(q * (len(sorted_samples) - 1))), len(sorted_samples) - 1)
+    return sorted_samples[index]
+
+
+class LatencyWindow:
+    """Bounded window of recent request durations (seconds) for one endpoint."""
+
+    def __init__(self, size: int):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if len(self._samples) < settings.latency_min_samples:
+            return None
+        return _percentile(sorted(self._samples), q)
+
+
+class LatencyTracker:
+    """
+    Per host + path template latency percentiles.
+
+    Used to derive per-endpoint timeouts from the observed p99 and the
+    hedging delay from the observed p95.
+    """
+
+    def __init__(self):
+        self._windows: Dict[Tuple[str, str], LatencyWindow] = {}
+
+    def _window(self, base_url: str, path: str) -> LatencyWindow:
+        key = (base_url, path_template(path))
+        window = self._windows.get(key)
+        if window is None:
+            window = LatencyWindow(settings.latency_window_size)
+            self._windows[key] = window
+        return window
+
+    def observe(self, base_url: str, path: str, seconds: float) -> None:
+        self._window(base_url, path).add(seconds)
+
+    def timeout_for(self, base_url: str, path: str, default: float) -> float:
+        """
+        Timeout derived from p99, bounded by [adaptive_timeout_min_seconds, default].
+
+        Falls back to the static default until enough samples are collected.
+        """
+        if not settings.adaptive_timeouts_enabled:
+            return default
+        p99 = self._window(base_url, path).percentile(0.99)
+        if p99 is None:
+            return default
+        adaptive = p99 * settings.adaptive_timeout_multiplier
+        return min(default, max(settings.adaptive_timeout_min_seconds, adaptive))
+
+    def hedge_delay(self, base_url: str, path: str) -> Optional[float]:
+        """Delay after which a hedged duplicate is sent (observed p95)."""
+        if not settings.hedging_enabled:
+            return None
+        return self._window(base_url, path).percentile(0.95)
+
+    def stats(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for (base_url, template), window in self._windows.items():
+            samples = sorted(window._samples)
+            if not samples:
+                continue
+            result[f"{base_url}{template}"] = {
+                "samples": len(samples),
+                "p50_ms": round(_percentile(samples, 0.50) * 1000, 1),
+                "p95_ms": round(_percentile(samples, 0.95) * 1000, 1),
+                "p99_ms": round(_percentile(samples, 0.99) * 1000, 1),
+            }
+        return result
+
+
+# Global tracker instance
+latency_tracker = LatencyTracker()
@@ -0,0 +1,183 @@
+import logging
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
+
+from app.clients.latency import path_template
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000
+)
+
+
+@dataclass
+class RequestEvent:
+    """One finished upstream request attempt."""
+
+    host: str
+    path: str
+    method: str
+    outcome: str  # "response", "timeout", "connect_error" or "retry"
+    duration_ms: float = 0.0
+    status_code: Optional[int] = None
+    response_bytes: int = 0
+    trace_id: str = ""
+
+    @property
+    def template(self) -> str:
+        return path_template(self.path)
+
+    @property
+    def status_class(self) -> Optional[str]:
+        if self.status_code is None:
+            return None
+        return f"{self.status_code // 100}xx"
+
+
+@dataclass
+class EndpointMetrics:
+    """Aggregated counters for one host + path template."""
+
+    requests: int = 0
+    duration_ms_sum: float = 0.0
+    histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    response_bytes: int = 0
+    status_classes: Dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+    timeouts: int = 0
+    connect_errors: int = 0
+
+    def add(self, event: RequestEvent) -> None:
+        if event.outcome == "retry":
+            self.retries += 1
+            return
+
+        self.requests += 1
+        self.duration_ms_sum += event.duration_ms
+        self.histogram[bisect_left(LATENCY_BUCKETS_MS, event.duration_ms)] += 1
+
+        if event.outcome == "timeout":
+            self.timeouts += 1
+        elif event.outcome == "connect_error":
+            self.connect_errors += 1
+        else:
+            self.response_bytes += event.response_bytes
+            status_class = event.status_class
+            self.status_classes[status_class] = self.status_classes.get(status_class, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["histogram"] = {
+            **{f"le_{int(bound)}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram)},
+            "le_inf": self.histogram[-1],
+        }
+        data["avg_ms"] = round(self.duration_ms_sum / self.requests, 2) if self.requests else 0.0
+        return data
+
+
+class UpstreamInstrumentation:
+    """
+    Instrumentation hooks for upstream calls.
+
+    BaseAPIClient emits a RequestEvent for every request attempt and every
+    tenacity retry. Events are aggregated per host + path template and the
+    most recent ones are kept with their trace_id. Extra listeners (e.g. a
+    benchmark harness) can subscribe with add_listener().
+    """
+
+    def __init__(self, recent_size: int = 500):
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._recent: Deque[RequestEvent] = deque(maxlen=recent_size)
+        self._listeners: List[Callable[[RequestEvent], None]] = []
+
+    def add_listener(self, listener: Callable[[RequestEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[RequestEvent], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def emit(self, event: RequestEvent) -> None:
+        key = (event.host, event.template)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self._endpoints[key] = metrics
+        metrics.add(event)
+        self._recent.append(event)
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:  # pragma: no cover - listeners must not break calls
+                logger.warning(f"Instrumentation listener failed: {e}")
+
+    def endpoint(self, host: str, path: str) -> Optional[EndpointMetrics]:
+        return self._endpoints.get((host, path_template(path)))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregated metrics keyed by '<host><path template>'."""
+        return {
+            f"{host}{template}": metrics.to_dict()
+            for (host, template), metrics in sorted(self._endpoints.items())
+        }
+
+    def recent(self, limit: int = 50, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent events, optionally only those of one trace."""
+        events = [e for e in self._recent if trace_id is None or e.trace_id == trace_id]
+        return [asdict(e) for e in events[-limit:]]
+
+    def reset(self) -> None:
+        self._endpoints.clear()
+        self._recent.clear()
+
+    def prometheus_lines(self) -> List[str]:
+        """
+        Render aggregated metrics in Prometheus text exposition format.
+
+        Each family is contiguous: its TYPE line, then its samples for
+        every host/path.
+        """
+        endpoints = sorted(self._endpoints.items())
+
+        def labels(host: str, template: str) -> str:
+            return f'host="{host}",path="{template}"'
+
+        lines = ["# TYPE upstream_request_duration_ms histogram"]
+        for (host, template), m in endpoints:
+            label = labels(host, template)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, m.histogram):
+                cumulative += count
+                lines.append(f'upstream_request_duration_ms_bucket{{{label},le="{bound:g}"}} {cumulative}')
+            lines.append(f'upstream_request_duration_ms_bucket{{{label},le="+Inf"}} {m.requests}')
+            lines.append(f"upstream_request_duration_ms_sum{{{label}}} {m.duration_ms_sum:.3f}")
+            lines.append(f"upstream_request_duration_ms_count{{{label}}} {m.requests}")
+
+        lines.append("# TYPE upstream_response_bytes_total counter")
+        for (host, template), m in endpoints:
+            lines.append(f"upstream_response_bytes_total{{{labels(host, template)}}} {m.response_bytes}")
+
+        lines.append("# TYPE upstream_responses_total counter")
+        for (host, template), m in endpoints:
+            for status_class, count in sorted(m.status_classes.items()):
+                lines.append(
+                    f'upstream_responses_total{{{labels(host, template)},status="{status_class}"}} {count}'
+                )
+
+        lines.append("# TYPE upstream_retries_total counter")
+        for (host, template), m in endpoints:
+            lines.append(f"upstream_retries_total{{{labels(host, template)}}} {m.retries}")
+
+        lines.append("# TYPE upstream_timeouts_total counter")
+        for (host, template), m in endpoints:
+            lines.append(f"upstream_timeouts_total{{{labels(host, template)}}} {m.timeouts}")
+        return lines
+
+
+# Global instrumentation instance
+upstream_metrics = UpstreamInstrumentation()
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
 
 from app.clients.base_client import BaseAPIClient, split_base_and_path
@@ -20,9 +20,9 @@ class NASAClient(BaseAPIClient):
     All endpoints require api_key parameter.
     """
 
-    def __init__(self):
+    def __init__(self, conditional: bool = False):
         base_url, apod_path = split_base_and_path(settings.apod_api_url)
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, conditional=conditional)
         self.api_key = settings.nasa_api_key
         _, self._neo_path = split_base_and_path(settings.neo_api_url)
         _, self._flr_path = split_base_and_path(settings.donki_flr_url)
@@ -48,14 +48,16 @@ class NASAClient(BaseAPIClient):
     async def get_neo_feed(
         self,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
-    ) -> Dict[str, Any]:
+        end_date: Optional[str] = None,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Get Near Earth Objects feed.
 
         Args:
             start_date: Start date in YYYY-MM-DD format (default: today)
             end_date: End date in YYYY-MM-DD format (default: today)
+            raw: Return the undecoded JSON body
 
         Returns:
             NEO feed data with near_earth_objects grouped by date
@@ -67,17 +69,20 @@ class NASAClient(BaseAPIClient):
             "end_date": end_date or today
         }
 
-        return await self.get(self._neo_path, params=params)
+        fetch = self.get_raw if raw else self.get
+        return await fetch(self._neo_path, params=params)
 
     async def get_donki_flr(
         self,
-        start_date: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        start_date: Optional[str] = None,
+        raw: bool = False
+    ) -> Union[List[Dict[str, Any]], bytes]:
         """
         Get DONKI Solar Flare data.
 
         Args:
             start_date: Start date (default: 30 days ago)
+            raw: Return the undecoded JSON body
 
         Returns:
             List of solar flare events
@@ -90,17 +95,20 @@ class NASAClient(BaseAPIClient):
             "startDate": start
         }
 
-        return await self.get(self._flr_path, params=params)
+        fetch = self.get_raw if raw else self.get
+        return await fetch(self._flr_path, params=params)
 
     async def get_donki_cme(
         self,
-        start_date: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        start_date: Optional[str] = None,
+        raw: bool = False
+    ) -> Union[List[Dict[str, Any]], bytes]:
         """
         Get DONKI Coronal Mass Ejection data.
 
         Args:
             start_date: Start date (default: 30 days ago)
+            raw: Return the undecoded JSON body
 
         Returns:
             List of CME events
@@ -113,7 +121,8 @@ class NASAClient(BaseAPIClient):
             "startDate": start
         }
 
-        return await self.get(self._cme_path, params=params)
+        fetch = self.get_raw if raw else self.get
+        return await fetch(self._cme_path, params=params)
 
 
 class OSDRClient(BaseAPIClient):
@@ -123,9 +132,9 @@ class OSDRClient(BaseAPIClient):
     API: https://visualization.osdr.nasa.gov/biodata/api/v2/datasets/
     """
 
-    def __init__(self):
+    def __init__(self, conditional: bool = False):
         base_url, path = split_base_and_path(settings.osdr_api_url)
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, conditional=conditional)
         self._datasets_path = path
 
     async def get_datasets(self, limit: int = 100) -> Dict[str, Any]:
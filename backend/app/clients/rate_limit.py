@@ -0,0 +1,189 @@
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Dict, Any, Iterator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.exceptions import RateLimitedError
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class RequestPriority(str, Enum):
+    """Who is spending upstream quota."""
+    SCHEDULED = "scheduled"
+    ON_DEMAND = "on_demand"
+
+
+# Priority of the current task; background collectors run as SCHEDULED,
+# user-triggered refreshes switch to ON_DEMAND via on_demand_priority().
+request_priority_var: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    "request_priority", default=RequestPriority.SCHEDULED
+)
+
+
+@contextmanager
+def on_demand_priority() -> Iterator[None]:
+    """Mark upstream calls made inside the block as on-demand."""
+    token = request_priority_var.set(RequestPriority.ON_DEMAND)
+    try:
+        yield
+    finally:
+        request_priority_var.reset(token)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at limit_per_hour / 3600 tokens/s."""
+
+    def __init__(self, limit_per_hour: int):
+        self.capacity = float(limit_per_hour)
+        self.tokens = float(limit_per_hour)
+        self.updated_at = time.monotonic()
+        self.shed = 0
+        self.deferred = 0
+        # Guards refill + reservation only; callers never sleep while holding it
+        self.lock = asyncio.Lock()
+
+    @property
+    def refill_rate(self) -> float:
+        return self.capacity / 3600.0
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def seconds_until(self, tokens: float) -> float:
+        missing = tokens - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / self.refill_rate if self.refill_rate > 0 else float("inf")
+
+
+class RateLimitGovernor:
+    """
+    Per-upstream token-bucket governor for quota-limited APIs.
+
+    Buckets start from configured hourly limits and are corrected from the
+    upstream's X-RateLimit-Limit / X-RateLimit-Remaining headers. A share of
+    every bucket is reserved for scheduled collectors:
+    - on-demand calls are shed (RateLimitedError) once only the reserve is left
+    - scheduled calls wait briefly for a token, then fail the same way
+
+    A waiting scheduled call reserves its token up front (the bucket may
+    go negative) and sleeps outside the bucket lock, so later callers see
+    the reservation and nobody queues behind a sleeper.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self._limits = limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, base_url: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(base_url)
+        if bucket is None and base_url in self._limits:
+            bucket = TokenBucket(self._limits[base_url])
+            self._buckets[base_url] = bucket
+        return bucket
+
+    async def acquire(self, base_url: str) -> None:
+        """
+        Take one token for a request to base_url.
+
+        Raises:
+            RateLimitedError: If the budget for this priority is exhausted
+        """
+        bucket = self._bucket(base_url)
+        if bucket is None:
+            return
+
+        priority = request_priority_var.get()
+        wait = 0.0
+        async with bucket.lock:
+            bucket.refill()
+
+            if priority == RequestPriority.ON_DEMAND:
+                reserve = bucket.capacity * settings.rate_limit_reserved_fraction
+                if bucket.tokens - 1 < reserve:
+                    bucket.shed += 1
+                    logger.warning(f"Shedding on-demand call to {base_url}: quota reserved")
+                    raise RateLimitedError(
+                        f"Upstream quota for {base_url} is reserved for scheduled collectors"
+                    )
+            else:
+                wait = bucket.seconds_until(1)
+                if wait > settings.rate_limit_max_wait_seconds:
+                    bucket.shed += 1
+                    logger.warning(f"Quota for {base_url} exhausted, next token in {wait:.0f}s")
+                    raise RateLimitedError(f"Upstream quota for {base_url} exhausted")
+                if wait > 0:
+                    bucket.deferred += 1
+
+            bucket.tokens -= 1
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, base_url: str, response: httpx.Response) -> None:
+        """Sync a bucket with the quota headers reported by the upstream."""
+        limit = response.headers.get("X-RateLimit-Limit")
+        remaining = response.headers.get("X-RateLimit-Remaining")
+
+        bucket = self._bucket(base_url)
+        if bucket is None and limit is None:
+            return
+
+        try:
+            if bucket is None:
+                bucket = TokenBucket(int(limit))
+                self._buckets[base_url] = bucket
+            bucket.refill()
+            if limit is not None:
+                bucket.capacity = float(limit)
+            if remaining is not None:
+                bucket.tokens = min(bucket.capacity, float(remaining))
+        except ValueError:
+            logger.debug(f"Ignoring malformed rate limit headers from {base_url}")
+
+        if bucket is not None and response.status_code == 429:
+            bucket.tokens = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Remaining budget per governed upstream."""
+        result = {}
+        for base_url in sorted(set(self._limits) | set(self._buckets)):
+            bucket = self._bucket(base_url)
+            bucket.refill()
+            result[base_url] = {
+                "limit_per_hour": int(bucket.capacity),
+                "remaining": int(bucket.tokens),
+                "reserved": int(bucket.capacity * settings.rate_limit_reserved_fraction),
+                "shed": bucket.shed,
+                "deferred": bucket.deferred,
+            }
+        return result
+
+
+def _configured_limits() -> Dict[str, int]:
+    nasa_urls = [
+        settings.apod_api_url,
+        settings.neo_api_url,
+        settings.donki_flr_url,
+        settings.donki_cme_url,
+    ]
+    limits = {}
+    for url in nasa_urls:
+        parsed = urlsplit(url)
+        limits[f"{parsed.scheme}://{parsed.netloc}"] = settings.nasa_rate_limit_per_hour
+    return limits
+
+
+# Global governor instance
+rate_limit_governor = RateLimitGovernor(_configured_limits())
@@ -0,0 +1,113 @@
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Any
+
+from tenacity import RetryCallState
+from tenacity.retry import retry_base
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class RetryBudget:
+    """
+    Sliding-window retry budget for one upstream host.
+
+    Retries are allowed while retries_in_window stay below
+    retry_budget_ratio * successes_in_window + retry_budget_min_per_window,
+    so a struggling upstream (few successes) quickly stops receiving
+    retries no matter how many callers overlap.
+    """
+
+    def __init__(self):
+        self._successes: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.retries_allowed = 0
+        self.retries_suppressed = 0
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - settings.retry_budget_window_seconds
+        for window in (self._successes, self._retries):
+            while window and window[0] < cutoff:
+                window.popleft()
+
+    def record_success(self) -> None:
+        now = time.monotonic()
+        self._prune(now)
+        self._successes.append(now)
+
+    def available(self) -> float:
+        self._prune(time.monotonic())
+        allowance = (
+            settings.retry_budget_ratio * len(self._successes)
+            + settings.retry_budget_min_per_window
+        )
+        return allowance - len(self._retries)
+
+    def try_spend(self) -> bool:
+        """Consume one retry if the budget allows it."""
+        if self.available() >= 1:
+            self._retries.append(time.monotonic())
+            self.retries_allowed += 1
+            return True
+        self.retries_suppressed += 1
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "available": round(max(self.available(), 0.0), 2),
+            "successes_in_window": len(self._successes),
+            "retries_in_window": len(self._retries),
+            "retries_allowed": self.retries_allowed,
+            "retries_suppressed": self.retries_suppressed,
+        }
+
+
+class RetryBudgetRegistry:
+    """Process-wide retry budgets keyed by upstream base URL."""
+
+    def __init__(self):
+        self._budgets: Dict[str, RetryBudget] = {}
+
+    def budget(self, base_url: str) -> RetryBudget:
+        budget = self._budgets.get(base_url)
+        if budget is None:
+            budget = RetryBudget()
+            self._budgets[base_url] = budget
+        return budget
+
+    def record_success(self, base_url: str) -> None:
+        self.budget(base_url).record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        return {base_url: b.to_dict() for base_url, b in self._budgets.items()}
+
+
+# Global registry instance
+retry_budgets = RetryBudgetRegistry()
+
+
+class retry_if_budget_allows(retry_base):
+    """
+    tenacity predicate: retry only if the client's host has budget left.
+
+    Expects the decorated callable to be a BaseAPIClient method, so the
+    host is taken from the bound instance (args[0].base_url). tenacity
+    evaluates this before its stop condition, so after the last of
+    max_attempts no budget is spent on a retry that would never happen.
+    """
+
+    def __init__(self, max_attempts: int):
+        self.max_attempts = max_attempts
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        if retry_state.attempt_number >= self.max_attempts:
+            return False
+        base_url = retry_state.args[0].base_url
+        if retry_budgets.budget(base_url).try_spend():
+            return True
+        logger.warning(f"Retry budget exhausted for {base_url}, not retrying")
+        return False
@@ -14,9 +14,9 @@ class SpaceXClient(BaseAPIClient):
     No authentication required.
     """
 
-    def __init__(self):
+    def __init__(self, conditional: bool = False):
         base_url, next_path = split_base_and_path(settings.spacex_api_url)
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, conditional=conditional)
         self._next_path = next_path
 
     async def get_next_launch(self) -> Dict[str, Any]:
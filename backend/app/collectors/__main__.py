@@ -0,0 +1,61 @@
+"""
+Standalone collector worker.
+
+Usage:
+    python -m app.collectors
+
+Runs the scheduler and all collectors in their own process (own event
+loop, own DB pool) so collection work never adds latency to API requests.
+Set COLLECTORS_MODE=external on the API processes so they stay pure API
+servers; they learn about new data through Postgres NOTIFY. Several
+workers can run side by side: leader election keeps exactly one active.
+"""
+import asyncio
+import logging
+import signal
+
+from app.clients.http_pool import http_client_registry, upstream_base_urls
+from app.collectors.leader import leader_elector
+from app.collectors.scheduler import shutdown_scheduler
+from app.collectors.startup import stop_initial_collection
+from app.core.config import get_settings
+from app.core.database import engine
+from app.geo.geocoder import reverse_geocoder
+
+logger = logging.getLogger("app.collectors.worker")
+settings = get_settings()
+
+
+async def run_worker() -> None:
+    """Run collectors until SIGINT/SIGTERM."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Starting collector worker")
+    if settings.http_pool_enabled and settings.http_pool_warmup:
+        await http_client_registry.warmup(upstream_base_urls())
+    await asyncio.to_thread(reverse_geocoder.ensure_loaded)
+    await leader_elector.start()
+
+    await stop.wait()
+
+    logger.info("Stopping collector worker")
+    await leader_elector.stop()
+    await stop_initial_collection()
+    shutdown_scheduler()
+    await http_client_registry.aclose()
+    await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
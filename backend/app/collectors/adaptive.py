@@ -0,0 +1,224 @@
+import hashlib
+import logging
+import random
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, timezone, tzinfo
+from typing import Deque, Dict, Any, Optional, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from app.clients import json_codec
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def _zone(name: str, fallback_hours: int) -> tzinfo:
+    """Time zone by name, or a fixed offset when tzdata is not installed."""
+    try:
+        return ZoneInfo(name)
+    except ZoneInfoNotFoundError:
+        return timezone(timedelta(hours=fallback_hours))
+
+
+@dataclass
+class SourcePolicy:
+    """
+    Polling bounds for one source in adaptive mode.
+
+    interval_seconds is the starting interval (the fixed-mode interval);
+    the adaptive interval always stays within [min_seconds, max_seconds],
+    where max_seconds is chosen to keep the cached data within its TTL.
+    publish_time aligns polls to a known daily publish time.
+    """
+
+    interval_seconds: float
+    min_seconds: float
+    max_seconds: float
+    publish_time: Optional[time] = None
+    publish_tz: tzinfo = timezone.utc
+    publish_delay_seconds: float = 900.0
+
+
+@dataclass
+class SourceSchedule:
+    """Learned change behaviour of one source."""
+
+    policy: SourcePolicy
+    interval_seconds: float
+    fingerprint: Optional[str] = None
+    last_change_at: Optional[datetime] = None
+    polls: int = 0
+    changes: int = 0
+    change_gaps: Deque[float] = field(default_factory=lambda: deque(maxlen=10))
+
+    def learned_gap(self) -> Optional[float]:
+        """Median seconds between observed changes, once a few are known."""
+        if len(self.change_gaps) < 3:
+            return None
+        return statistics.median(self.change_gaps)
+
+
+def source_policies() -> Dict[str, SourcePolicy]:
+    """Adaptive bounds per source. ISS always changes and stays on a fixed interval."""
+    short_ttl = settings.cache_ttl_short_hours * 3600
+    long_ttl = settings.cache_ttl_long_hours * 3600
+    return {
+        "osdr": SourcePolicy(settings.osdr_poll_interval_seconds, 300, 3600),
+        # APOD rolls over at midnight US Eastern time
+        "apod": SourcePolicy(
+            24 * 3600, 900, long_ttl / 2,
+            publish_time=time(0, 0),
+            publish_tz=_zone("America/New_York", -5),
+        ),
+        "neo": SourcePolicy(2 * 3600, 1800, short_ttl / 2),
+        "flr": SourcePolicy(3600, 900, short_ttl / 2),
+        "cme": SourcePolicy(3600, 900, short_ttl / 2),
+        "spacex": SourcePolicy(3600, 900, short_ttl / 2),
+    }
+
+
+def fingerprint(payload: Union[bytes, Dict[str, Any], list]) -> str:
+    """Stable digest of a payload (raw bytes or decoded JSON)."""
+    raw = payload if isinstance(payload, bytes) else json_codec.dumps(payload)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ChangeRateTracker:
+    """
+    Learns how often each source changes and derives its next poll time.
+
+    Collectors report every successful poll: either a payload fingerprint
+    or "unchanged" (HTTP 304). An unchanged poll backs the interval off by
+    adaptive_backoff_factor, a change speeds it up by the same factor, and
+    once a few changes have been seen the interval is capped at half the
+    median gap between them. Sources with a publish time are polled just
+    after it and then left alone until the next one.
+    """
+
+    def __init__(self):
+        self._sources: Dict[str, SourceSchedule] = {}
+        self._rng = random.Random()
+
+    def _schedule(self, source: str) -> Optional[SourceSchedule]:
+        schedule = self._sources.get(source)
+        if schedule is None:
+            policy = source_policies().get(source)
+            if policy is None:
+                return None
+            schedule = SourceSchedule(policy, policy.interval_seconds)
+            self._sources[source] = schedule
+        return schedule
+
+    def _adjust(self, schedule: SourceSchedule, changed: bool) -> None:
+        factor = settings.adaptive_backoff_factor
+        interval = schedule.interval_seconds / factor if changed else schedule.interval_seconds * factor
+        learned = schedule.learned_gap()
+        if learned is not None:
+            interval = min(interval, learned / 2)
+        policy = schedule.policy
+        schedule.interval_seconds = min(max(interval, policy.min_seconds), policy.max_seconds)
+
+    def observe(self, source: str, payload: Union[bytes, Dict[str, Any], list]) -> bool:
+        """Record a fetched payload; returns True if it differs from the last one."""
+        schedule = self._schedule(source)
+        if schedule is None:
+            return True
+        now = datetime.now(timezone.utc)
+        digest = fingerprint(payload)
+        changed = digest != schedule.fingerprint
+        schedule.polls += 1
+        if changed:
+            if schedule.last_change_at is not None:
+                schedule.change_gaps.append((now - schedule.last_change_at).total_seconds())
+            schedule.fingerprint = digest
+            schedule.last_change_at = now
+            schedule.changes += 1
+        self._adjust(schedule, changed)
+        return changed
+
+    def observe_unchanged(self, source: str) -> None:
+        """Record a poll answered with 304 Not Modified."""
+        schedule = self._schedule(source)
+        if schedule is None:
+            return
+        schedule.polls += 1
+        self._adjust(schedule, changed=False)
+
+    def restore(
+        self,
+        source: str,
+        fingerprint: Optional[str],
+        last_change_at: Optional[datetime],
+        interval_seconds: Optional[float]
+    ) -> None:
+        """Resume learned state persisted by a previous process."""
+        schedule = self._schedule(source)
+        if schedule is None:
+            return
+        schedule.fingerprint = fingerprint
+        schedule.last_change_at = last_change_at
+        if interval_seconds:
+            policy = schedule.policy
+            schedule.interval_seconds = min(
+                max(interval_seconds, policy.min_seconds), policy.max_seconds
+            )
+
+    def state(self, source: str) -> Dict[str, Any]:
+        """Learned state worth persisting for a source (empty for fixed sources)."""
+        schedule = self._sources.get(source)
+        if schedule is None:
+            return {}
+        return {
+            "fingerprint": schedule.fingerprint,
+            "last_change_at": schedule.last_change_at,
+            "interval_seconds": schedule.interval_seconds,
+        }
+
+    def _last_publish(self, policy: SourcePolicy, now: datetime) -> datetime:
+        local_now = now.astimezone(policy.publish_tz)
+        publish = datetime.combine(local_now.date(), policy.publish_time, policy.publish_tz)
+        publish += timedelta(seconds=policy.publish_delay_seconds)
+        if publish > local_now:
+            publish -= timedelta(days=1)
+        return publish.astimezone(timezone.utc)
+
+    def next_run_time(self, source: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """When to poll the source next, including jitter; None for fixed sources."""
+        schedule = self._schedule(source)
+        if schedule is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        policy = schedule.policy
+        delay = schedule.interval_seconds
+
+        if policy.publish_time is not None:
+            last_publish = self._last_publish(policy, now)
+            if schedule.last_change_at is not None and schedule.last_change_at >= last_publish:
+                # Already have this period's data: wait for the next publish
+                delay = (last_publish + timedelta(days=1) - now).total_seconds()
+            else:
+                # Published but not seen yet: poll at the fastest allowed rate
+                delay = policy.min_seconds
+            delay = min(delay, policy.max_seconds)
+
+        delay += self._rng.uniform(0, settings.collector_jitter_seconds)
+        return now + timedelta(seconds=delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            source: {
+                "interval_seconds": round(s.interval_seconds, 1),
+                "polls": s.polls,
+                "changes": s.changes,
+                "learned_change_gap_seconds": s.learned_gap(),
+                "last_change_at": s.last_change_at.isoformat() if s.last_change_at else None,
+            }
+            for source, s in self._sources.items()
+        }
+
+
+# Global tracker instance
+change_tracker = ChangeRateTracker()
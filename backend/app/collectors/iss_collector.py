@@ -1,7 +1,22 @@
+import asyncio
 import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
 
-from app.clients.iss_client import ISSClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.iss_client import MAX_TIMESTAMPS_PER_REQUEST, ISSClient, upstream_time
+from app.geo.geocoder import reverse_geocoder
+from app.orbit.engine import orbit_engine
+from app.orbit.tle import TLE_SOURCE, parse_tle, read_tle_file
 from app.repositories.iss_repository import ISSRepository
+from app.repositories.iss_rollup_repository import ISSRollupRepository
+from app.repositories.space_cache_repository import SpaceCacheRepository
+from app.services.iss_buffer import iss_position_buffer
+from app.services.orbit_service import OrbitService
+from app.collectors.memory import track_peak_memory
+from app.collectors.notify import notify_update
+from app.collectors.telemetry import record_failure, record_rows, record_unchanged
 from app.core.database import async_session_factory
 from app.core.config import get_settings
 
@@ -13,7 +28,9 @@ async def collect_iss_position() -> None:
     """
     Collector task: Fetch ISS position and store in database.
 
-    Runs every 120 seconds per TASK.md requirements.
+    Runs every 120 seconds per TASK.md requirements. /iss/last is served
+    from orbit propagation, so each poll also checks the prediction
+    against the upstream position.
     On failure, logs error and continues (collector never crashes).
     """
     logger.info("Starting ISS position collection")
@@ -21,34 +38,219 @@ async def collect_iss_position() -> None:
     client = ISSClient()
 
     try:
-        async with async_session_factory() as session:
-            repository = ISSRepository(session)
-
-            # Fetch from API
-            position = await client.get_position()
-
-            # Store in database (append)
-            record = await repository.insert_position(
-                lat=position["latitude"],
-                lon=position["longitude"],
-                alt_km=position["altitude"],
-                velocity_kmh=position["velocity"],
-                source_url=position["source_url"],
-                raw=position["raw"]
-            )
+        with track_peak_memory("iss"):
+            async with async_session_factory() as session:
+                repository = ISSRepository(session)
 
-            logger.info(
-                f"ISS position stored: lat={record.lat:.4f}, lon={record.lon:.4f}, "
-                f"alt={record.alt_km:.2f}km, vel={record.velocity_kmh:.2f}km/h"
-            )
+                # Fetch from API
+                position = await client.get_position()
 
-            # Cleanup old records (retention: 7-14 days)
-            deleted = await repository.cleanup_old_records(settings.iss_retention_days)
-            if deleted > 0:
-                logger.info(f"Cleaned up {deleted} old ISS records")
+                # Store in database (append)
+                record = await repository.insert_position(
+                    lat=position["latitude"],
+                    lon=position["longitude"],
+                    alt_km=position["altitude"],
+                    velocity_kmh=position["velocity"],
+                    source_url=position["source_url"],
+                    raw=position["raw"],
+                    timestamp=position["timestamp"]
+                )
+                if record is None:
+                    record_unchanged()
+                    logger.info(f"ISS position at {position['timestamp'].isoformat()} already stored")
+                else:
+                    record_rows(1)
+                    location = position["raw"].get("location_info") or {}
+                    iss_position_buffer.append((
+                        record.timestamp, record.lat, record.lon, record.alt_km, record.velocity_kmh,
+                        position["visibility"], location.get("country_code"), location.get("timezone_id")
+                    ))
+                    await notify_update(session, "iss")
+
+                    logger.info(
+                        f"ISS position stored: lat={record.lat:.4f}, lon={record.lon:.4f}, "
+                        f"alt={record.alt_km:.2f}km, vel={record.velocity_kmh:.2f}km/h"
+                    )
+                await _check_drift(session, position)
+                # Retention: expired days are dropped by partition maintenance
 
     except Exception as e:
         # Per requirements: collector doesn't crash, just logs error
         logger.exception(f"ISS collection failed: {e}")
+        record_failure(e)
     finally:
         await client.close()
+
+
+async def _check_drift(session: AsyncSession, position: dict) -> None:
+    """Compare a polled position with the SGP4 prediction for its upstream timestamp."""
+    try:
+        await OrbitService(SpaceCacheRepository(session)).ensure_loaded()
+        drift = orbit_engine.check_drift(
+            position["latitude"], position["longitude"], position["timestamp"]
+        )
+    except Exception as e:
+        logger.warning(f"ISS drift check failed: {e}")
+        return
+    if drift is not None:
+        logger.info(f"ISS prediction drift: {drift:.2f} km")
+
+
+async def collect_iss_tle() -> None:
+    """
+    Collector task: refresh the ISS TLE used for orbit propagation.
+
+    Reads ISS_TLE_FILE when set (offline), otherwise the upstream TLE
+    endpoint. Element sets are validated before they are stored, and an
+    unchanged set only bumps the cached row.
+    """
+    logger.info("Starting ISS TLE collection")
+
+    client = ISSClient()
+
+    try:
+        if settings.iss_tle_file:
+            tle = read_tle_file(settings.iss_tle_file)
+        else:
+            data = await client.get_tle()
+            tle = parse_tle(data["line1"], data["line2"], data.get("header") or "ISS (ZARYA)")
+
+        async with async_session_factory() as session:
+            repository = SpaceCacheRepository(session)
+            latest = await repository.get_latest_by_source(TLE_SOURCE)
+            if latest is not None and latest.payload.get("line1") == tle.line1 \
+                    and latest.payload.get("line2") == tle.line2:
+                await repository.touch_latest(TLE_SOURCE)
+                record_unchanged()
+                logger.info("ISS TLE unchanged")
+            else:
+                await repository.cache_data(TLE_SOURCE, tle.to_dict())
+                await repository.cleanup_old_cache(TLE_SOURCE, keep_latest=5)
+                record_rows(1)
+                await notify_update(session, TLE_SOURCE)
+                logger.info(f"ISS TLE stored: epoch {tle.epoch.isoformat()}")
+
+        orbit_engine.load(tle)
+
+    except Exception as e:
+        logger.exception(f"ISS TLE collection failed: {e}")
+        record_failure(e)
+    finally:
+        await client.close()
+
+
+def backfill_timestamps(gaps: List[Tuple[datetime, datetime]], step_seconds: int, limit: int) -> List[int]:
+    """Poll-interval timestamps inside each gap (newest gaps first), at most limit."""
+    timestamps: List[int] = []
+    for before, after in gaps:
+        t = int(before.timestamp()) + step_seconds
+        end = after.timestamp() - step_seconds / 2
+        while t <= end and len(timestamps) < limit:
+            timestamps.append(t)
+            t += step_seconds
+    return timestamps
+
+
+async def _backfill_chunk(client: ISSClient, timestamps: List[int], semaphore: asyncio.Semaphore) -> int:
+    async with semaphore:
+        positions = await client.get_positions(timestamps)
+    locations = (
+        reverse_geocoder.lookup_many((p["latitude"], p["longitude"]) for p in positions)
+        if reverse_geocoder.loaded else [{} for _ in positions]
+    )
+    rows = [
+        {
+            "lat": p["latitude"],
+            "lon": p["longitude"],
+            "alt_km": p["altitude"],
+            "velocity_kmh": p["velocity"],
+            "timestamp": upstream_time(p["timestamp"]),
+            "source_url": f"{settings.iss_api_url.rstrip('/')}/positions",
+            "raw": {**p, "location_info": location, "backfill": True},
+        }
+        for p, location in zip(positions, locations)
+    ]
+    async with async_session_factory() as session:
+        return await ISSRepository(session).insert_positions(rows)
+
+
+async def backfill_iss_gaps() -> None:
+    """
+    Collector task: fill holes in the ISS position history.
+
+    Looks for gaps longer than two poll intervals within the last
+    iss_backfill_lookback_hours and requests the missing positions from
+    the upstream positions endpoint, 10 timestamps per request, with at
+    most iss_backfill_concurrency requests in flight and
+    iss_backfill_max_points positions per run. Rows use upstream
+    timestamps and conflicts are skipped, so reruns are harmless.
+    """
+    step = settings.iss_poll_interval_seconds
+    lookback = min(settings.iss_backfill_lookback_hours, settings.iss_retention_days * 24)
+    since = datetime.now(timezone.utc) - timedelta(hours=lookback)
+
+    client = ISSClient()
+    try:
+        async with async_session_factory() as session:
+            gaps = await ISSRepository(session).find_gaps(since, min_gap_seconds=2 * step)
+        timestamps = backfill_timestamps(gaps, step, settings.iss_backfill_max_points)
+        if not timestamps:
+            record_unchanged()
+            logger.info("ISS history has no gaps to backfill")
+            return
+
+        semaphore = asyncio.Semaphore(settings.iss_backfill_concurrency)
+        chunks = [
+            timestamps[i:i + MAX_TIMESTAMPS_PER_REQUEST]
+            for i in range(0, len(timestamps), MAX_TIMESTAMPS_PER_REQUEST)
+        ]
+        results = await asyncio.gather(
+            *(_backfill_chunk(client, chunk, semaphore) for chunk in chunks),
+            return_exceptions=True
+        )
+        inserted = sum(r for r in results if isinstance(r, int))
+        failures = [r for r in results if isinstance(r, Exception)]
+        record_rows(inserted)
+        if failures:
+            record_failure(failures[0])
+            logger.warning(f"ISS backfill: {len(failures)}/{len(chunks)} requests failed: {failures[0]}")
+        if inserted:
+            async with async_session_factory() as session:
+                # Rows in the past: position buffers rebuild instead of appending
+                await notify_update(session, "iss_backfill")
+        logger.info(f"ISS backfill: {len(gaps)} gaps, {inserted}/{len(timestamps)} positions stored")
+
+    except Exception as e:
+        logger.exception(f"ISS backfill failed: {e}")
+        record_failure(e)
+    finally:
+        await client.close()
+
+
+async def refresh_iss_rollups() -> None:
+    """
+    Collector task: bring the hourly/daily ISS rollups up to date.
+
+    Watermark based: only hours with raw rows inserted since the last
+    refresh (minus iss_rollup_overlap_seconds, for transactions that
+    committed late) are recomputed, including hours in the past filled
+    by the backfill. Days are then recomputed from their hours.
+    """
+    try:
+        async with async_session_factory() as session:
+            repository = ISSRollupRepository(session)
+            watermark = await repository.get_watermark()
+            since = (
+                watermark - timedelta(seconds=settings.iss_rollup_overlap_seconds)
+                if watermark is not None else datetime.fromtimestamp(0, tz=timezone.utc)
+            )
+            refreshed = await repository.refresh(since)
+        if refreshed:
+            record_rows(refreshed)
+            logger.info(f"ISS rollups: {refreshed} hourly buckets refreshed")
+        else:
+            record_unchanged()
+
+    except Exception as e:
+        logger.exception(f"ISS rollup refresh failed: {e}")
+        record_failure(e)
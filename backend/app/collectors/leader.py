@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.database import engine
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class LeaderElector:
+    """
+    Collector leader election through a Postgres session advisory lock.
+
+    Every API process competes for the same lock on a dedicated connection;
+    the holder runs the collector jobs, everyone else stays a pure API
+    server. The lock belongs to the DB session, so a crashed or partitioned
+    leader loses it as soon as its connection drops and a follower picks it
+    up on its next attempt (every leader_election_interval_seconds). The
+    leader pings its connection on the same interval and steps down if it
+    breaks, so two processes never collect at the same time for long.
+    """
+
+    def __init__(
+        self,
+        lock_id: int,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]]
+    ):
+        self.lock_id = lock_id
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.identity = f"{socket.gethostname()}:{os.getpid()}"
+        self.is_leader = False
+        self.leader_since: Optional[datetime] = None
+        self.elections = 0
+        self._decided = False
+        self._conn: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _connect(self) -> AsyncConnection:
+        if self._conn is None or self._conn.closed:
+            conn = await engine.connect()
+            self._conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        return self._conn
+
+    async def _drop_connection(self) -> None:
+        """Close the lock connection for good (never return it to the pool)."""
+        if self._conn is not None:
+            try:
+                await self._conn.invalidate()
+                await self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    async def _try_acquire(self) -> bool:
+        conn = await self._connect()
+        result = await conn.execute(
+            text("SELECT pg_try_advisory_lock(:lock_id)"), {"lock_id": self.lock_id}
+        )
+        return bool(result.scalar())
+
+    async def _heartbeat(self) -> None:
+        await self._conn.execute(text("SELECT 1"))
+
+    async def _promote(self) -> None:
+        self.is_leader = True
+        self.leader_since = datetime.now(timezone.utc)
+        self.elections += 1
+        self._decided = True
+        logger.info(f"{self.identity} elected collector leader")
+        await self.on_elected()
+
+    async def _demote(self, reason: str) -> None:
+        was_leader = self.is_leader
+        self.is_leader = False
+        self.leader_since = None
+        if was_leader:
+            logger.warning(f"{self.identity} lost collector leadership: {reason}")
+        if was_leader or not self._decided:
+            self._decided = True
+            await self.on_demoted()
+
+    async def step(self) -> None:
+        """One election round: heartbeat as leader, try to take the lock otherwise."""
+        try:
+            if self.is_leader:
+                await self._heartbeat()
+            elif await self._try_acquire():
+                await self._promote()
+            else:
+                await self._demote("lock held by another process")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Leader election round failed: {e}")
+            await self._drop_connection()
+            await self._demote(str(e))
+
+    async def _run(self) -> None:
+        while True:
+            await self.step()
+            await asyncio.sleep(settings.leader_election_interval_seconds)
+
+    async def start(self) -> None:
+        """Run the first round now, then keep electing in the background."""
+        if not settings.leader_election_enabled:
+            await self._promote()
+            return
+        await self.step()
+        self._task = asyncio.create_task(self._run(), name="leader_election")
+
+    async def stop(self) -> None:
+        """Stop electing and release the lock so a follower takes over at once."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.is_leader = False
+        self.leader_since = None
+        await self._drop_connection()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": settings.leader_election_enabled,
+            "role": "leader" if self.is_leader else "follower",
+            "identity": self.identity,
+            "leader_since": self.leader_since.isoformat() if self.leader_since else None,
+            "elections": self.elections,
+        }
+
+
+async def _become_leader() -> None:
+    from app.collectors.partition_collector import maintain_partitions
+    from app.collectors.scheduler import JOB_IDS, scheduler, start_scheduler
+    from app.collectors.startup import start_initial_collection
+    from app.collectors.state import restore_collector_state
+    from app.collectors.telemetry import job_telemetry
+
+    # Partitions for today must exist before any collector inserts (the
+    # process may have been down longer than the premade days)
+    async with job_telemetry.track(JOB_IDS["partitions"], trigger="startup"):
+        await maintain_partitions()
+    # Resume the schedule persisted by the previous leader; overdue jobs
+    # run right away. A paused scheduler (re-election) keeps its own jobs.
+    resuming = scheduler.running
+    next_due = await restore_collector_state()
+    start_scheduler(next_due)
+    # Catch up on anything that went stale while no process was leading,
+    # leaving sources with a resumed schedule to the scheduler so none is
+    # fetched twice
+    scheduled = [] if resuming else [source for source, due in next_due.items() if due is not None]
+    start_initial_collection(scheduled=scheduled)
+
+
+async def _become_follower() -> None:
+    from app.collectors.scheduler import pause_scheduler
+    from app.collectors.startup import start_initial_collection, startup_readiness
+
+    pause_scheduler()
+    if not startup_readiness.started:
+        start_initial_collection(collect=False)
+
+
+# Global elector instance
+leader_elector = LeaderElector(
+    settings.leader_lock_id,
+    on_elected=_become_leader,
+    on_demoted=_become_follower
+)
@@ -0,0 +1,39 @@
+import logging
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Peak traced memory (bytes) of the last profiled run per collector
+last_peak_bytes: Dict[str, int] = {}
+
+
+@contextmanager
+def track_peak_memory(name: str) -> Iterator[None]:
+    """
+    Log the peak Python heap allocated during a collector run.
+
+    Disabled unless COLLECTOR_MEMORY_PROFILING is set: tracemalloc slows
+    every allocation in the process. Peaks of collectors that overlap in
+    time include each other's allocations.
+    """
+    if not settings.collector_memory_profiling:
+        yield
+        return
+
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        last_peak_bytes[name] = peak
+        logger.info(f"{name} collector peak memory: {peak / 1024:.1f} KiB")
+        if started_here:
+            tracemalloc.stop()
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.database import engine
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+UPDATES_CHANNEL = "collector_updates"
+
+
+async def notify_update(session: AsyncSession, source: str) -> None:
+    """
+    Announce new data for a source to every API process.
+
+    Uses Postgres NOTIFY, so it works the same whether collectors run in
+    the API process or in the standalone worker. Delivered on commit.
+    """
+    await session.execute(
+        text("SELECT pg_notify(:channel, :source)"),
+        {"channel": UPDATES_CHANNEL, "source": source}
+    )
+    await session.commit()
+
+
+class DataUpdateListener:
+    """
+    LISTENs for collector notifications on a dedicated connection.
+
+    Keeps the last update time per source and calls subscribers with the
+    source name, so in-process caches can refresh as soon as a collector
+    (local or in another process) has written new data.
+    """
+
+    def __init__(self):
+        self.last_updates: Dict[str, datetime] = {}
+        self._subscribers: List[Callable[[str], None]] = []
+        self._conn: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        self._subscribers.append(callback)
+
+    def dispatch(self, source: str) -> None:
+        self.last_updates[source] = datetime.now(timezone.utc)
+        for callback in list(self._subscribers):
+            try:
+                callback(source)
+            except Exception as e:
+                logger.warning(f"Data update subscriber failed for {source}: {e}")
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.dispatch(payload)
+
+    async def _listen(self) -> None:
+        """Keep a LISTEN connection open, reconnecting after failures."""
+        while True:
+            try:
+                self._conn = await engine.connect()
+                raw = await self._conn.get_raw_connection()
+                driver = raw.driver_connection
+                await driver.add_listener(UPDATES_CHANNEL, self._on_notification)
+                logger.info(f"Listening for data updates on '{UPDATES_CHANNEL}'")
+                while not driver.is_closed():
+                    await asyncio.sleep(settings.data_update_listener_check_seconds)
+                logger.warning("Data update listener connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Data update listener failed: {e}")
+            finally:
+                await self._close()
+            await asyncio.sleep(settings.data_update_listener_check_seconds)
+
+    async def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                await self._conn.invalidate()
+                await self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="data_update_listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "listening": self._conn is not None,
+            "last_updates": {
+                source: at.isoformat() for source, at in sorted(self.last_updates.items())
+            },
+        }
+
+
+# Global listener instance
+data_update_listener = DataUpdateListener()
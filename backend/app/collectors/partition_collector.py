@@ -0,0 +1,92 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Collection, List, Tuple
+
+from app.collectors.telemetry import record_failure, record_rows, record_unchanged
+from app.core.config import get_settings
+from app.core.database import async_session_factory
+from app.repositories.partition_repository import PARTITIONED_TABLES, PartitionRepository
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def retention_days(table: str) -> int:
+    """Days of data kept per partitioned table; 0 keeps everything."""
+    return {
+        "iss_fetch_log": settings.iss_retention_days,
+        "telemetry_legacy": settings.telemetry_retention_days,
+    }[table]
+
+
+def partition_plan(
+    partitions: List[Tuple[str, date]],
+    now: datetime,
+    premake_days: int,
+    retention: int,
+    default_days: Collection[date] = ()
+) -> Tuple[List[date], List[str]]:
+    """
+    Days to create (today plus premake_days ahead, plus every day with rows
+    in the DEFAULT partition) and partitions to drop.
+
+    A partition is dropped once its whole day is older than the retention
+    period, so no row younger than retention_days is ever removed.
+    """
+    existing = {day for _, day in partitions}
+    today = now.date()
+    wanted = {today + timedelta(days=offset) for offset in range(premake_days + 1)}
+    create = sorted((wanted | set(default_days)) - existing)
+    drop = []
+    if retention > 0:
+        cutoff = now - timedelta(days=retention)
+        drop = [
+            name for name, day in partitions
+            if datetime.combine(day + timedelta(days=1), time(), tzinfo=timezone.utc) <= cutoff
+        ]
+    return create, drop
+
+
+async def maintain_partitions() -> None:
+    """
+    Collector task: keep daily partitions ahead of time and apply retention.
+
+    Runs every partition_maintenance_interval_seconds and once when a
+    process becomes collector leader, before any collector writes. Replaces
+    row-wise DELETEs of old data: expired days are dropped as whole
+    partitions, which costs the same no matter how many rows they hold.
+    Rows that landed in the DEFAULT partition (e.g. after a long downtime)
+    are moved into their own day's partition.
+    """
+    now = datetime.now(timezone.utc)
+    changes = 0
+
+    try:
+        async with async_session_factory() as session:
+            repository = PartitionRepository(session)
+            for table in PARTITIONED_TABLES:
+                partitions = await repository.list_partitions(table)
+                default_days = await repository.default_days(table)
+                create, drop = partition_plan(
+                    partitions, now, settings.partition_premake_days, retention_days(table),
+                    default_days
+                )
+                for day in create:
+                    await repository.create_partition(table, day, from_default=day in default_days)
+                for name in drop:
+                    await repository.drop_partition(name)
+                if create or drop:
+                    logger.info(
+                        f"{table}: created {len(create)} partitions, dropped {len(drop)} expired"
+                    )
+                changes += len(create) + len(drop)
+            await session.commit()
+
+        if changes:
+            record_rows(changes)
+        else:
+            record_unchanged()
+
+    except Exception as e:
+        logger.exception(f"Partition maintenance failed: {e}")
+        record_failure(e)
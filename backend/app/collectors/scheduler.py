@@ -1,105 +1,84 @@
 import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.collectors.adaptive import change_tracker, source_policies
+from app.collectors.telemetry import job_telemetry
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Global scheduler instance
-scheduler = AsyncIOScheduler()
-
-
-def setup_scheduler() -> None:
-    """Configure all collector jobs with their intervals."""
-    from app.collectors.iss_collector import collect_iss_position
-    from app.collectors.osdr_collector import collect_osdr_datasets
-    from app.collectors.space_cache_collector import (
-        collect_apod,
-        collect_neo,
-        collect_donki_flr,
-        collect_donki_cme,
-        collect_spacex
-    )
-
-    # ISS: every 120 seconds (per TASK.md)
-    scheduler.add_job(
+# Global scheduler instance.
+# One run per job at a time; runs missed while the loop was blocked (or the
+# scheduler paused) collapse into a single catch-up run within the grace time.
+scheduler = AsyncIOScheduler(
+    job_defaults={
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": settings.collector_misfire_grace_seconds,
+    }
+)
+scheduler.add_listener(
+    job_telemetry.listener,
+    EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+)
+
+
+@dataclass
+class CollectorJob:
+    """A collector job and its fixed-mode interval."""
+
+    source: str
+    name: str
+    interval_seconds: int
+
+
+COLLECTOR_JOBS: List[CollectorJob] = [
+    CollectorJob("iss", "ISS Position Collector", settings.iss_poll_interval_seconds),
+    CollectorJob("iss_tle", "ISS TLE Collector", settings.iss_tle_refresh_hours * 3600),
+    CollectorJob("iss_backfill", "ISS Gap Backfill", settings.iss_backfill_interval_seconds),
+    CollectorJob("iss_rollup", "ISS Statistics Rollup", settings.iss_rollup_interval_seconds),
+    CollectorJob("osdr", "OSDR Datasets Collector", settings.osdr_poll_interval_seconds),
+    CollectorJob("apod", "NASA APOD Collector", 24 * 3600),
+    CollectorJob("neo", "NASA NEO Collector", 2 * 3600),
+    CollectorJob("flr", "NASA DONKI FLR Collector", 3600),
+    CollectorJob("cme", "NASA DONKI CME Collector", 3600),
+    CollectorJob("spacex", "SpaceX Launch Collector", 3600),
+    CollectorJob("partitions", "Partition Maintenance", settings.partition_maintenance_interval_seconds),
+]
+
+# Job ids are kept stable across scheduling modes
+JOB_IDS: Dict[str, str] = {
+    "iss": "iss_collector",
+    "iss_tle": "iss_tle_collector",
+    "iss_backfill": "iss_backfill_collector",
+    "iss_rollup": "iss_rollup_collector",
+    "osdr": "osdr_collector",
+    "apod": "apod_collector",
+    "neo": "neo_collector",
+    "flr": "donki_flr_collector",
+    "cme": "donki_cme_collector",
+    "spacex": "spacex_collector",
+    "partitions": "partition_maintenance",
+}
+
+
+def collector_functions() -> Dict[str, Callable[[], Awaitable[None]]]:
+    """Collector coroutine per source."""
+    from app.collectors.iss_collector import (
+        backfill_iss_gaps,
         collect_iss_position,
-        IntervalTrigger(seconds=settings.iss_poll_interval_seconds),
-        id="iss_collector",
-        name="ISS Position Collector",
-        replace_existing=True
+        collect_iss_tle,
+        refresh_iss_rollups
     )
-    logger.info(f"ISS collector scheduled: every {settings.iss_poll_interval_seconds}s")
-
-    # OSDR: every 600 seconds (per TASK.md)
-    scheduler.add_job(
-        collect_osdr_datasets,
-        IntervalTrigger(seconds=settings.osdr_poll_interval_seconds),
-        id="osdr_collector",
-        name="OSDR Datasets Collector",
-        replace_existing=True
-    )
-    logger.info(f"OSDR collector scheduled: every {settings.osdr_poll_interval_seconds}s")
-
-    # APOD: every 24 hours
-    scheduler.add_job(
-        collect_apod,
-        IntervalTrigger(hours=24),
-        id="apod_collector",
-        name="NASA APOD Collector",
-        replace_existing=True
-    )
-    logger.info("APOD collector scheduled: every 24h")
-
-    # NEO: every 2 hours
-    scheduler.add_job(
-        collect_neo,
-        IntervalTrigger(hours=2),
-        id="neo_collector",
-        name="NASA NEO Collector",
-        replace_existing=True
-    )
-    logger.info("NEO collector scheduled: every 2h")
-
-    # DONKI FLR: every 1 hour
-    scheduler.add_job(
-        collect_donki_flr,
-        IntervalTrigger(hours=1),
-        id="donki_flr_collector",
-        name="NASA DONKI FLR Collector",
-        replace_existing=True
-    )
-    logger.info("DONKI FLR collector scheduled: every 1h")
-
-    # DONKI CME: every 1 hour
-    scheduler.add_job(
-        collect_donki_cme,
-        IntervalTrigger(hours=1),
-        id="donki_cme_collector",
-        name="NASA DONKI CME Collector",
-        replace_existing=True
-    )
-    logger.info("DONKI CME collector scheduled: every 1h")
-
-    # SpaceX: every 1 hour
-    scheduler.add_job(
-        collect_spacex,
-        IntervalTrigger(hours=1),
-        id="spacex_collector",
-        name="SpaceX Launch Collector",
-        replace_existing=True
-    )
-    logger.info("SpaceX collector scheduled: every 1h")
-
-    logger.info("All collector jobs configured")
-
-
-async def run_initial_collection() -> None:
-    """Run initial data collection for all sources."""
-    from app.collectors.iss_collector import collect_iss_position
     from app.collectors.osdr_collector import collect_osdr_datasets
+    from app.collectors.partition_collector import maintain_partitions
     from app.collectors.space_cache_collector import (
         collect_apod,
         collect_neo,
@@ -108,30 +87,128 @@ async def run_initial_collection() -> None:
         collect_spacex
     )
 
-    logger.info("Running initial data collection...")
-
-    # Run ISS first (needed immediately)
-    await collect_iss_position()
+    return {
+        "iss": collect_iss_position,
+        "iss_tle": collect_iss_tle,
+        "iss_backfill": backfill_iss_gaps,
+        "iss_rollup": refresh_iss_rollups,
+        "osdr": collect_osdr_datasets,
+        "apod": collect_apod,
+        "neo": collect_neo,
+        "flr": collect_donki_flr,
+        "cme": collect_donki_cme,
+        "spacex": collect_spacex,
+        "partitions": maintain_partitions,
+    }
+
+
+async def run_collector(source: str) -> None:
+    """
+    Job function: run a collector under job telemetry.
+
+    In adaptive mode the job is then moved to the source's next poll time;
+    its own interval trigger (max_seconds of the source policy) only acts
+    as a safety net in case a run never gets to reschedule.
+    """
+    from app.collectors.state import save_collector_state
+
+    job_id = JOB_IDS[source]
+    async with job_telemetry.track(job_id) as run:
+        await collector_functions()[source]()
+
+    job = scheduler.get_job(job_id)
+    if settings.collector_schedule_mode == "adaptive":
+        next_run = change_tracker.next_run_time(source)
+        if next_run is not None and job is not None:
+            job.modify(next_run_time=next_run)
+            logger.info(f"{source} next poll at {next_run.isoformat()}")
+
+    await save_collector_state(source, run, job.next_run_time if job else None)
+
+
+def setup_scheduler(next_due: Optional[Dict[str, Optional[datetime]]] = None) -> None:
+    """
+    Configure all collector jobs.
+
+    next_due holds persisted next run times (see restore_collector_state):
+    those jobs resume where the previous process left off, overdue ones
+    run right away (still staggered).
+
+    Jobs are staggered by collector_stagger_seconds so same-interval jobs
+    do not fire together, and every run gets up to collector_jitter_seconds
+    of jitter. In "adaptive" mode, sources with an adaptive policy are
+    rescheduled after each run from their observed change rate (see
+    ChangeRateTracker); the rest keep their fixed interval.
+    """
+    policies = source_policies()
+    adaptive = settings.collector_schedule_mode == "adaptive"
+    now = datetime.now(timezone.utc)
+
+    for index, job in enumerate(COLLECTOR_JOBS):
+        policy = policies.get(job.source) if adaptive else None
+        stagger = timedelta(seconds=index * settings.collector_stagger_seconds)
+        due = (next_due or {}).get(job.source)
+        if due is not None:
+            start = max(due, now + stagger)
+        else:
+            # First run one interval from now, as the startup collection
+            # already covered this one
+            first_interval = job.interval_seconds
+            if policy is not None:
+                first_interval = min(first_interval, policy.max_seconds)
+            start = now + timedelta(seconds=first_interval) + stagger
+
+        if policy is None:
+            scheduler.add_job(
+                run_collector,
+                IntervalTrigger(
+                    seconds=job.interval_seconds,
+                    start_date=start,
+                    jitter=settings.collector_jitter_seconds
+                ),
+                args=[job.source],
+                id=JOB_IDS[job.source],
+                name=job.name,
+                replace_existing=True
+            )
+            logger.info(f"{job.name} scheduled: every {job.interval_seconds}s")
+        else:
+            scheduler.add_job(
+                run_collector,
+                IntervalTrigger(seconds=policy.max_seconds, start_date=start),
+                args=[job.source],
+                id=JOB_IDS[job.source],
+                name=job.name,
+                replace_existing=True
+            )
+            logger.info(
+                f"{job.name} scheduled adaptively: "
+                f"{policy.min_seconds:.0f}s-{policy.max_seconds:.0f}s"
+            )
 
-    # Run other collectors
-    await collect_osdr_datasets()
-    await collect_apod()
-    await collect_neo()
-    await collect_donki_flr()
-    await collect_donki_cme()
-    await collect_spacex()
-
-    logger.info("Initial data collection complete")
+    logger.info("All collector jobs configured")
 
 
-def start_scheduler() -> None:
-    """Set up and start the scheduler."""
-    setup_scheduler()
+def start_scheduler(next_due: Optional[Dict[str, Optional[datetime]]] = None) -> None:
+    """Set up and start the scheduler, or resume it if it was paused."""
+    if scheduler.running:
+        scheduler.resume()
+        logger.info("Scheduler resumed")
+        return
+    setup_scheduler(next_due)
     scheduler.start()
     logger.info("Scheduler started")
 
 
+def pause_scheduler() -> None:
+    """Stop running collector jobs without discarding them (leadership lost)."""
+    if scheduler.running:
+        scheduler.pause()
+        logger.info("Scheduler paused")
+
+
 def shutdown_scheduler() -> None:
     """Shutdown the scheduler gracefully."""
-    scheduler.shutdown(wait=False)
-    logger.info("Scheduler shut down")
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+        logger.info("Scheduler shut down")
@@ -1,37 +1,85 @@
 import logging
-from typing import Awaitable, Callable, Dict, Any
+from typing import Awaitable, Callable, Dict, Any, Union
 
+from app.clients import json_codec
+from app.clients.http_cache import NotModified, validator_cache
 from app.clients.nasa_client import NASAClient
+from app.clients.rate_limit import on_demand_priority
 from app.clients.spacex_client import SpaceXClient
 from app.repositories.space_cache_repository import SpaceCacheRepository
+from app.collectors.adaptive import change_tracker
+from app.collectors.memory import track_peak_memory
+from app.collectors.notify import notify_update
+from app.collectors.telemetry import record_failure, record_rows, record_unchanged
 from app.core.database import async_session_factory
 
 logger = logging.getLogger(__name__)
 
 
-async def _cache_data(source: str, payload: dict) -> None:
-    """Helper to store data in cache and cleanup old entries."""
+async def _cache_data(source: str, payload: Union[dict, bytes]) -> None:
+    """
+    Helper to store data in cache and cleanup old entries.
+
+    Encoded JSON bytes are passed through to Postgres unchanged.
+    """
     async with async_session_factory() as session:
         repository = SpaceCacheRepository(session)
-        await repository.cache_data(source, payload)
+        if isinstance(payload, bytes):
+            await repository.cache_raw(source, payload)
+        else:
+            await repository.cache_data(source, payload)
         await repository.cleanup_old_cache(source, keep_latest=5)
+        await notify_update(session, source)
+
+
+async def _touch_cache(source: str) -> bool:
+    """Helper to mark cached data as fresh when upstream reports 304."""
+    async with async_session_factory() as session:
+        repository = SpaceCacheRepository(session)
+        return await repository.touch_latest(source)
+
+
+async def _fetch_conditional(source: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run a conditional fetch for a cached source.
+
+    Returns None when upstream data is unchanged and the cached row was
+    bumped. If there is no row to bump (e.g. the table was cleared), the
+    validators are dropped and the payload is fetched unconditionally.
+    """
+    try:
+        return await fetch()
+    except NotModified as exc:
+        if await _touch_cache(source):
+            logger.info(f"{source.upper()} unchanged upstream, freshness bumped")
+            return None
+        validator_cache.discard(exc.cache_key)
+        return await fetch()
 
 
 async def _collect_with_nasa(
     source: str,
     fetcher: Callable[[NASAClient], Awaitable[Any]],
-    payload_builder: Callable[[Any], Dict[str, Any]],
+    payload_builder: Callable[[Any], Union[Dict[str, Any], bytes]],
     log_builder: Callable[[Any], str]
 ) -> None:
     """Execute a NASA collection job with shared boilerplate."""
-    client = NASAClient()
+    client = NASAClient(conditional=True)
     try:
-        data = await fetcher(client)
-        payload = payload_builder(data)
-        await _cache_data(source, payload)
-        logger.info(log_builder(data))
+        with track_peak_memory(source):
+            data = await _fetch_conditional(source, lambda: fetcher(client))
+            if data is None:
+                change_tracker.observe_unchanged(source)
+                record_unchanged()
+                return
+            payload = payload_builder(data)
+            change_tracker.observe(source, payload)
+            await _cache_data(source, payload)
+            record_rows(1)
+            logger.info(log_builder(data))
     except Exception as e:
         logger.exception(f"{source.upper()} collection failed: {e}")
+        record_failure(e)
     finally:
         await client.close()
 
@@ -62,9 +110,9 @@ async def collect_neo() -> None:
 
     await _collect_with_nasa(
         "neo",
-        lambda client: client.get_neo_feed(),
-        lambda data: data,
-        lambda data: f"NEO cached: {data.get('element_count', 0)} objects"
+        lambda client: client.get_neo_feed(raw=True),
+        lambda raw: raw,
+        lambda raw: f"NEO cached: {len(raw)} bytes"
     )
 
 
@@ -78,9 +126,9 @@ async def collect_donki_flr() -> None:
 
     await _collect_with_nasa(
         "flr",
-        lambda client: client.get_donki_flr(),
-        lambda data: {"flares": data},
-        lambda data: f"DONKI FLR cached: {len(data) if isinstance(data, list) else 0} flares"
+        lambda client: client.get_donki_flr(raw=True),
+        lambda raw: json_codec.wrap("flares", raw.strip() or b"[]"),
+        lambda raw: f"DONKI FLR cached: {len(raw)} bytes"
     )
 
 
@@ -94,9 +142,9 @@ async def collect_donki_cme() -> None:
 
     await _collect_with_nasa(
         "cme",
-        lambda client: client.get_donki_cme(),
-        lambda data: {"events": data},
-        lambda data: f"DONKI CME cached: {len(data) if isinstance(data, list) else 0} events"
+        lambda client: client.get_donki_cme(raw=True),
+        lambda raw: json_codec.wrap("events", raw.strip() or b"[]"),
+        lambda raw: f"DONKI CME cached: {len(raw)} bytes"
     )
 
 
@@ -108,13 +156,21 @@ async def collect_spacex() -> None:
     """
     logger.info("Collecting SpaceX launch")
 
-    client = SpaceXClient()
+    client = SpaceXClient(conditional=True)
     try:
-        data = await client.get_next_launch()
-        await _cache_data("spacex", data)
-        logger.info(f"SpaceX cached: {data.get('name', 'Unknown launch')}")
+        with track_peak_memory("spacex"):
+            data = await _fetch_conditional("spacex", client.get_next_launch)
+            if data is None:
+                change_tracker.observe_unchanged("spacex")
+                record_unchanged()
+                return
+            change_tracker.observe("spacex", data)
+            await _cache_data("spacex", data)
+            record_rows(1)
+            logger.info(f"SpaceX cached: {data.get('name', 'Unknown launch')}")
     except Exception as e:
         logger.exception(f"SpaceX collection failed: {e}")
+        record_failure(e)
     finally:
         await client.close()
 
@@ -123,7 +179,8 @@ async def refresh_all_caches() -> dict:
     """
     Trigger refresh of all caches.
 
-    Returns status of each collector.
+    Runs as on-demand traffic so it cannot drain the quota reserved for
+    scheduled collectors. Returns status of each collector.
     """
     results = {}
 
@@ -137,7 +194,8 @@ async def refresh_all_caches() -> dict:
 
     for name, collector in collectors:
         try:
-            await collector()
+            with on_demand_priority():
+                await collector()
             results[name] = "success"
         except Exception as e:
             logger.exception(f"Refresh {name} failed: {e}")
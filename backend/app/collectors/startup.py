@@ -0,0 +1,341 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Awaitable, Callable, Collection, Dict, Any, List, Optional
+
+from app.collectors.scheduler import JOB_IDS, scheduler
+from app.collectors.state import save_collector_state
+from app.collectors.telemetry import job_telemetry
+from app.core.database import async_session_factory
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class SourceState(str, Enum):
+    """Startup state of one data source."""
+    PENDING = "pending"
+    RUNNING = "running"
+    FRESH = "fresh"          # DB data was already within TTL, collection skipped
+    COLLECTED = "collected"  # collected during startup
+    FAILED = "failed"        # collector ran but DB data is still missing/stale
+    TIMED_OUT = "timed_out"  # collector exceeded its startup deadline
+    SKIPPED = "skipped"      # stale, but collecting is left to the leader or the scheduler
+
+
+WARM_STATES = {SourceState.FRESH, SourceState.COLLECTED}
+
+
+class StepState(str, Enum):
+    """State of one process startup step (connection warm-up, geocoder, ...)."""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class StartupSource:
+    """A collector run at startup plus a check whether its DB data is fresh."""
+
+    name: str
+    collect: Callable[[], Awaitable[None]]
+    is_fresh: Callable[[], Awaitable[bool]]
+
+
+@dataclass
+class SourceStatus:
+    state: SourceState = SourceState.PENDING
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def warm(self) -> bool:
+        return self.state in WARM_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "warm": self.warm,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+@dataclass
+class StepStatus:
+    state: StepState = StepState.PENDING
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"state": self.state.value, "duration_ms": self.duration_ms, "error": self.error}
+
+
+class StartupReadiness:
+    """
+    Tracks the background startup steps and startup collection.
+
+    The service is ready once every startup step and every source has
+    settled (warm, failed, timed out or skipped); a single unreachable
+    upstream must not keep the whole API out of rotation. A process that
+    was ready once stays ready while a later catch-up collection runs
+    (e.g. after a leader failover).
+    """
+
+    def __init__(self):
+        self.sources: Dict[str, SourceStatus] = {}
+        self.steps: Dict[str, StepStatus] = {}
+        self.started = False
+        self.finished = False
+        self._was_ready = False
+
+    def reset(self, names: List[str]) -> None:
+        self._was_ready = self._was_ready or self.finished
+        self.sources = {name: SourceStatus() for name in names}
+        self.started = True
+        self.finished = False
+
+    @property
+    def ready(self) -> bool:
+        steps_settled = all(
+            status.state in (StepState.DONE, StepState.FAILED) for status in self.steps.values()
+        )
+        return steps_settled and (self.finished or self._was_ready)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "warm": sorted(n for n, s in self.sources.items() if s.warm),
+            "steps": {name: status.to_dict() for name, status in self.steps.items()},
+            "sources": {name: status.to_dict() for name, status in self.sources.items()},
+        }
+
+
+# Global readiness instance
+startup_readiness = StartupReadiness()
+
+_initial_task: Optional[asyncio.Task] = None
+_steps_task: Optional[asyncio.Task] = None
+
+
+async def _iss_is_fresh() -> bool:
+    from app.repositories.iss_repository import ISSRepository
+
+    async with async_session_factory() as session:
+        latest = await ISSRepository(session).get_latest()
+    if latest is None:
+        return False
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=settings.iss_freshness_minutes)
+    return latest.timestamp.replace(tzinfo=timezone.utc) >= cutoff
+
+
+async def _osdr_is_fresh() -> bool:
+    # OSDR rows are served regardless of age, so any data counts as warm;
+    # the scheduler refreshes them within osdr_poll_interval_seconds.
+    from app.repositories.osdr_repository import OSDRRepository
+
+    async with async_session_factory() as session:
+        return await OSDRRepository(session).count_datasets() > 0
+
+
+def _space_cache_is_fresh(
+    source: str,
+    ttl_hours: Optional[int] = None
+) -> Callable[[], Awaitable[bool]]:
+    async def is_fresh() -> bool:
+        from app.repositories.space_cache_repository import SpaceCacheRepository
+        from app.services.space_cache_service import SOURCE_TTL
+
+        async with async_session_factory() as session:
+            cached = await SpaceCacheRepository(session).get_fresh_by_source(
+                source, ttl_hours=ttl_hours or SOURCE_TTL[source]
+            )
+        return cached is not None
+
+    return is_fresh
+
+
+def startup_sources() -> List[StartupSource]:
+    """All collectors run at startup, ISS first."""
+    from app.collectors.iss_collector import collect_iss_position, collect_iss_tle
+    from app.collectors.osdr_collector import collect_osdr_datasets
+    from app.collectors.space_cache_collector import (
+        collect_apod,
+        collect_neo,
+        collect_donki_flr,
+        collect_donki_cme,
+        collect_spacex
+    )
+
+    return [
+        StartupSource("iss", collect_iss_position, _iss_is_fresh),
+        StartupSource(
+            "iss_tle", collect_iss_tle,
+            _space_cache_is_fresh("iss_tle", ttl_hours=settings.iss_tle_refresh_hours)
+        ),
+        StartupSource("osdr", collect_osdr_datasets, _osdr_is_fresh),
+        StartupSource("apod", collect_apod, _space_cache_is_fresh("apod")),
+        StartupSource("neo", collect_neo, _space_cache_is_fresh("neo")),
+        StartupSource("flr", collect_donki_flr, _space_cache_is_fresh("flr")),
+        StartupSource("cme", collect_donki_cme, _space_cache_is_fresh("cme")),
+        StartupSource("spacex", collect_spacex, _space_cache_is_fresh("spacex")),
+    ]
+
+
+async def check_fresh(source: StartupSource) -> bool:
+    try:
+        return await source.is_fresh()
+    except Exception as e:
+        logger.warning(f"Freshness check for {source.name} failed: {e}")
+        return False
+
+
+async def _warm_source(
+    source: StartupSource,
+    semaphore: asyncio.Semaphore,
+    collect: bool,
+    persist_state: bool
+) -> None:
+    status = startup_readiness.sources[source.name]
+
+    if await check_fresh(source):
+        status.state = SourceState.FRESH
+        logger.info(f"Startup: {source.name} data is within TTL, skipping collection")
+        return
+    if not collect:
+        status.state = SourceState.SKIPPED
+        return
+
+    async with semaphore:
+        status.state = SourceState.RUNNING
+        started = time.perf_counter()
+        try:
+            async with job_telemetry.track(JOB_IDS[source.name], trigger="startup") as run:
+                await asyncio.wait_for(
+                    source.collect(),
+                    timeout=settings.startup_source_deadline_seconds
+                )
+        except asyncio.TimeoutError:
+            status.state = SourceState.TIMED_OUT
+            status.error = f"Exceeded {settings.startup_source_deadline_seconds}s deadline"
+            logger.warning(f"Startup: {source.name} collection timed out")
+            return
+        except Exception as e:
+            status.state = SourceState.FAILED
+            status.error = str(e)
+            logger.warning(f"Startup: {source.name} collection failed: {e}")
+            return
+        finally:
+            status.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    # Collectors log and swallow their own errors, so success is judged by
+    # whether fresh data actually landed in the DB.
+    if await check_fresh(source):
+        status.state = SourceState.COLLECTED
+    else:
+        status.state = SourceState.FAILED
+        status.error = "No fresh data after collection"
+
+    if persist_state:
+        job = scheduler.get_job(JOB_IDS[source.name])
+        await save_collector_state(source.name, run, job.next_run_time if job else None)
+
+
+async def run_initial_collection(
+    sources: Optional[List[StartupSource]] = None,
+    collect: bool = True,
+    persist_state: bool = True,
+    scheduled: Collection[str] = ()
+) -> None:
+    """
+    Warm all sources concurrently.
+
+    Sources whose DB data is still within TTL are skipped; the rest run
+    with at most startup_collection_concurrency collectors at a time and
+    each is cut off after startup_source_deadline_seconds. With
+    collect=False (follower processes) freshness is only checked, as it
+    is for the scheduled sources: their jobs resume from a persisted next
+    run time and overdue ones already run right away.
+    """
+    sources = sources if sources is not None else startup_sources()
+    startup_readiness.reset([source.name for source in sources])
+    semaphore = asyncio.Semaphore(settings.startup_collection_concurrency)
+
+    logger.info("Running initial data collection...")
+    try:
+        await asyncio.gather(*(
+            _warm_source(source, semaphore, collect and source.name not in scheduled, persist_state)
+            for source in sources
+        ))
+    finally:
+        startup_readiness.finished = True
+
+    snapshot = startup_readiness.snapshot()
+    logger.info(
+        f"Initial data collection complete: {len(snapshot['warm'])}/{len(sources)} sources warm"
+    )
+
+
+def start_initial_collection(
+    collect: bool = True,
+    scheduled: Collection[str] = ()
+) -> asyncio.Task:
+    """Run the initial collection in the background so startup does not block."""
+    global _initial_task
+    if _initial_task is not None and not _initial_task.done():
+        _initial_task.cancel()
+    _initial_task = asyncio.create_task(
+        run_initial_collection(collect=collect, scheduled=scheduled), name="initial_collection"
+    )
+    return _initial_task
+
+
+async def stop_initial_collection() -> None:
+    """Cancel a still-running initial collection (shutdown)."""
+    if _initial_task is not None and not _initial_task.done():
+        _initial_task.cancel()
+        await asyncio.gather(_initial_task, return_exceptions=True)
+
+
+async def _run_step(name: str, step: Callable[[], Awaitable[None]]) -> None:
+    status = startup_readiness.steps[name]
+    status.state = StepState.RUNNING
+    started = time.perf_counter()
+    try:
+        await step()
+        status.state = StepState.DONE
+    except Exception as e:
+        status.state = StepState.FAILED
+        status.error = str(e)
+        logger.warning(f"Startup step {name} failed: {e}")
+    finally:
+        status.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def run_startup_steps(stages: List[Dict[str, Callable[[], Awaitable[None]]]]) -> None:
+    """
+    Run process startup steps: stages one after another, the steps of a
+    stage concurrently. A failed step is logged and does not stop the rest.
+    """
+    startup_readiness.steps = {name: StepStatus() for stage in stages for name in stage}
+    for stage in stages:
+        await asyncio.gather(*(_run_step(name, step) for name, step in stage.items()))
+
+
+def start_startup_steps(stages: List[Dict[str, Callable[[], Awaitable[None]]]]) -> asyncio.Task:
+    """Run the startup steps in the background so the app starts serving at once."""
+    global _steps_task
+    _steps_task = asyncio.create_task(run_startup_steps(stages), name="startup_steps")
+    return _steps_task
+
+
+async def stop_startup_steps() -> None:
+    """Cancel startup steps that are still running (shutdown)."""
+    if _steps_task is not None and not _steps_task.done():
+        _steps_task.cancel()
+        await asyncio.gather(_steps_task, return_exceptions=True)
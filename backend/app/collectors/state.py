@@ -0,0 +1,86 @@
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.clients.http_cache import validator_cache
+from app.collectors.adaptive import change_tracker
+from app.collectors.telemetry import JobRun
+from app.core.database import async_session_factory
+from app.core.config import get_settings
+from app.repositories.collector_state_repository import CollectorStateRepository
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def source_urls() -> Dict[str, str]:
+    """
+    Upstream URL per source; validator cache keys of a source start with it.
+
+    Jobs without an upstream (rollups, partition maintenance) have no entry.
+    """
+    return {
+        "iss": settings.iss_api_url,
+        "iss_tle": f"{settings.iss_api_url.rstrip('/')}/tles",
+        "iss_backfill": f"{settings.iss_api_url.rstrip('/')}/positions",
+        "osdr": settings.osdr_api_url,
+        "apod": settings.apod_api_url,
+        "neo": settings.neo_api_url,
+        "flr": settings.donki_flr_url,
+        "cme": settings.donki_cme_url,
+        "spacex": settings.spacex_api_url,
+    }
+
+
+async def restore_collector_state() -> Dict[str, Optional[datetime]]:
+    """
+    Load persisted collector state after a (re)start.
+
+    Validators go back into the validator cache and learned change rates
+    into the change tracker. Returns the next due time per source so the
+    scheduler can resume instead of restarting every interval from zero.
+    A missing table or unreachable DB just means a cold start.
+    """
+    try:
+        async with async_session_factory() as session:
+            states = await CollectorStateRepository(session).get_states()
+    except Exception as e:
+        logger.warning(f"Could not load collector state, starting cold: {e}")
+        return {}
+
+    next_due: Dict[str, Optional[datetime]] = {}
+    for source, state in states.items():
+        if state.validators:
+            validator_cache.restore(state.validators)
+        change_tracker.restore(
+            source, state.fingerprint, state.last_change_at, state.interval_seconds
+        )
+        next_due[source] = state.next_due_at
+
+    logger.info(f"Restored collector state for {len(states)} sources")
+    return next_due
+
+
+async def save_collector_state(
+    source: str,
+    run: JobRun,
+    next_due_at: Optional[datetime]
+) -> None:
+    """Persist the outcome of a run plus what the next process needs to resume."""
+    url = source_urls().get(source)
+    values = {
+        "last_attempt_at": run.started_at,
+        "last_outcome": run.outcome,
+        "last_error": run.error,
+        "next_due_at": next_due_at,
+        "validators": validator_cache.export(url) if url else {},
+        **change_tracker.state(source),
+    }
+    if run.outcome in ("success", "unchanged"):
+        values["last_success_at"] = run.started_at
+
+    try:
+        async with async_session_factory() as session:
+            await CollectorStateRepository(session).upsert_state(source, **values)
+    except Exception as e:
+        logger.warning(f"Could not save collector state for {source}: {e}")
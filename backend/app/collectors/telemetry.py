@@ -0,0 +1,210 @@
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import AsyncIterator, Deque, Dict, Any, List, Optional
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobRun:
+    """One execution of a collector job."""
+
+    job_id: str
+    started_at: datetime
+    trigger: str = "scheduled"  # "scheduled", "startup" or "on_demand"
+    scheduled_at: Optional[datetime] = None
+    duration_ms: float = 0.0
+    outcome: str = "running"  # "success", "unchanged", "error" or "cancelled"
+    rows_written: int = 0
+    error: Optional[str] = None
+
+    @property
+    def lag_ms(self) -> Optional[float]:
+        """How late the run started compared to its scheduled time."""
+        if self.scheduled_at is None:
+            return None
+        return max((self.started_at - self.scheduled_at).total_seconds() * 1000, 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat()
+        data["scheduled_at"] = self.scheduled_at.isoformat() if self.scheduled_at else None
+        data["lag_ms"] = round(self.lag_ms, 1) if self.lag_ms is not None else None
+        return data
+
+
+@dataclass
+class JobStats:
+    """Aggregated counters for one job."""
+
+    runs: int = 0
+    successes: int = 0
+    unchanged: int = 0
+    failures: int = 0
+    cancelled: int = 0
+    overlaps: int = 0
+    misfires: int = 0
+    skipped_max_instances: int = 0
+    running: int = 0
+    total_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    last_attempt_at: Optional[datetime] = None
+    last_success_at: Optional[datetime] = None
+    history: Deque[JobRun] = field(default_factory=lambda: deque(maxlen=20))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "successes": self.successes,
+            "unchanged": self.unchanged,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "overlaps": self.overlaps,
+            "misfires": self.misfires,
+            "skipped_max_instances": self.skipped_max_instances,
+            "running": self.running,
+            "avg_duration_ms": round(self.total_duration_ms / self.runs, 1) if self.runs else 0.0,
+            "max_duration_ms": round(self.max_duration_ms, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+            "last_attempt_at": self.last_attempt_at.isoformat() if self.last_attempt_at else None,
+            "last_success_at": self.last_success_at.isoformat() if self.last_success_at else None,
+        }
+
+
+# Run of the job executing in the current task (None outside scheduled jobs)
+current_run_var: ContextVar[Optional[JobRun]] = ContextVar("current_run", default=None)
+
+
+def record_rows(count: int) -> None:
+    """Report rows written by the current job run."""
+    run = current_run_var.get()
+    if run is not None:
+        run.rows_written += count
+
+
+def record_unchanged() -> None:
+    """Report that upstream data was unchanged (e.g. HTTP 304)."""
+    run = current_run_var.get()
+    if run is not None and run.outcome == "running":
+        run.outcome = "unchanged"
+
+
+def record_failure(exc: BaseException) -> None:
+    """Report an error a collector caught and logged instead of raising."""
+    run = current_run_var.get()
+    if run is not None:
+        run.outcome = "error"
+        run.error = f"{type(exc).__name__}: {exc}"
+
+
+class JobTelemetry:
+    """
+    Per-job instrumentation for the collector scheduler.
+
+    Runs are wrapped with track(); misfires, max_instances skips and
+    scheduled run times come from APScheduler events (see listener()).
+    Collectors swallow their exceptions, so they report outcome and rows
+    through record_failure() / record_unchanged() / record_rows().
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, JobStats] = {}
+        self._scheduled: Dict[str, Deque[datetime]] = {}
+
+    def stats_for(self, job_id: str) -> JobStats:
+        stats = self._jobs.get(job_id)
+        if stats is None:
+            stats = JobStats()
+            self._jobs[job_id] = stats
+        return stats
+
+    def listener(self, event: Any) -> None:
+        """APScheduler listener for submitted, missed and max_instances events."""
+        if event.code == EVENT_JOB_SUBMITTED:
+            pending = self._scheduled.setdefault(event.job_id, deque(maxlen=10))
+            pending.extend(event.scheduled_run_times)
+        elif event.code == EVENT_JOB_MISSED:
+            self.stats_for(event.job_id).misfires += 1
+            logger.warning(f"Job {event.job_id} misfired (scheduled {event.scheduled_run_time})")
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            self.stats_for(event.job_id).skipped_max_instances += 1
+            logger.warning(f"Job {event.job_id} skipped: previous run still in progress")
+
+    @asynccontextmanager
+    async def track(self, job_id: str, trigger: str = "scheduled") -> AsyncIterator[JobRun]:
+        """
+        Time one run of a job and record its outcome.
+
+        Startup and on-demand runs of the same collector are tracked too,
+        so overlaps with scheduled runs show up in the counters.
+        """
+        stats = self.stats_for(job_id)
+        pending = self._scheduled.get(job_id) if trigger == "scheduled" else None
+        run = JobRun(
+            job_id=job_id,
+            started_at=datetime.now(timezone.utc),
+            trigger=trigger,
+            scheduled_at=pending.popleft() if pending else None,
+        )
+        if stats.running:
+            stats.overlaps += 1
+        stats.running += 1
+        stats.last_attempt_at = run.started_at
+        token = current_run_var.set(run)
+        started = time.perf_counter()
+        try:
+            yield run
+        except Exception as e:
+            record_failure(e)
+            raise
+        except BaseException:
+            # Cancelled (shutdown, lost leadership): neither success nor failure
+            run.outcome = "cancelled"
+            raise
+        finally:
+            current_run_var.reset(token)
+            stats.running -= 1
+            run.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            if run.outcome == "running":
+                run.outcome = "success"
+            self._finish(stats, run)
+
+    def _finish(self, stats: JobStats, run: JobRun) -> None:
+        stats.runs += 1
+        stats.total_duration_ms += run.duration_ms
+        stats.max_duration_ms = max(stats.max_duration_ms, run.duration_ms)
+        if run.lag_ms is not None:
+            stats.max_lag_ms = max(stats.max_lag_ms, run.lag_ms)
+        if run.outcome == "error":
+            stats.failures += 1
+        elif run.outcome == "cancelled":
+            stats.cancelled += 1
+        else:
+            stats.last_success_at = run.started_at
+            if run.outcome == "unchanged":
+                stats.unchanged += 1
+            else:
+                stats.successes += 1
+        stats.history.append(run)
+
+    def snapshot(self, job_id: str, history: int = 10) -> Dict[str, Any]:
+        stats = self.stats_for(job_id)
+        return {
+            **stats.to_dict(),
+            "history": [run.to_dict() for run in list(stats.history)[-history:]],
+        }
+
+    def job_ids(self) -> List[str]:
+        return list(self._jobs)
+
+
+# Global telemetry instance
+job_telemetry = JobTelemetry()
@@ -18,6 +18,8 @@ class Settings(BaseSettings):
 
     # NASA API
     nasa_api_key: str = "DEMO_KEY"
+    # Hourly quota assumed until X-RateLimit-* headers are seen (DEMO_KEY: 30)
+    nasa_rate_limit_per_hour: int = 30
 
     # JWST API
     jwst_api_key: str = ""
@@ -31,6 +33,38 @@ class Settings(BaseSettings):
     iss_poll_interval_seconds: int = 120
     iss_freshness_minutes: int = 10
     iss_retention_days: int = 14
+    # Gap backfill through the upstream positions endpoint (10 timestamps/request)
+    iss_backfill_interval_seconds: int = 900
+    iss_backfill_lookback_hours: int = 24
+    iss_backfill_max_points: int = 300
+    iss_backfill_concurrency: int = 2
+    # Hourly/daily rollups (/iss/stats), refreshed from rows inserted since the last run
+    iss_rollup_interval_seconds: int = 300
+    iss_rollup_overlap_seconds: int = 300
+    # Orbit propagation: /iss/last is computed from the latest TLE with SGP4
+    # (needs numpy + sgp4); upstream polls only check the prediction
+    iss_propagation_enabled: bool = True
+    iss_tle_refresh_hours: int = 6
+    # Read the TLE from this file instead of the upstream (offline setups)
+    iss_tle_file: str = ""
+    iss_tle_max_age_hours: float = 72.0
+    iss_tle_check_seconds: float = 600.0
+    iss_drift_threshold_km: float = 50.0
+    # Predicted tracks/passes kept per TLE epoch (LRU)
+    orbit_prediction_cache_size: int = 64
+    # Ground tracks are computed once per window and shared by all requests in it
+    iss_groundtrack_window_seconds: int = 600
+    # Pass predictions are shared per ~11 km cell and hourly window
+    iss_pass_location_precision_deg: float = 0.1
+    iss_pass_window_seconds: int = 3600
+
+    # Offline reverse geocoding (country / time zone of ISS positions).
+    # GeoJSON boundaries, or an index prebuilt from them (python -m app.geo build);
+    # without either, the upstream /v1/coordinates lookup is used
+    geocoder_countries_file: str = ""
+    geocoder_timezones_file: str = ""
+    geocoder_index_file: str = ""
+    geocoder_cell_deg: float = 0.5
 
     # NASA API URLs
     osdr_api_url: str = "https://visualization.osdr.nasa.gov/biodata/api/v2/datasets/"
@@ -56,6 +90,66 @@ class Settings(BaseSettings):
     http_timeout_seconds: int = 30
     http_max_retries: int = 3
 
+    # HTTP connection pools (shared by all upstream clients)
+    http_pool_enabled: bool = True
+    http_pool_max_connections: int = 20
+    http_pool_max_keepalive: int = 10
+    http_pool_keepalive_expiry_seconds: float = 300.0
+    http_pool_warmup: bool = True
+    http_pool_warmup_timeout_seconds: float = 5.0
+    http2_enabled: bool = False
+
+    # Upstream rate-limit governor
+    rate_limit_reserved_fraction: float = 0.25
+    rate_limit_max_wait_seconds: float = 5.0
+
+    # Circuit breakers and bulkheads (per upstream host)
+    circuit_failure_rate_threshold: float = 0.5
+    circuit_min_calls: int = 5
+    circuit_window_seconds: float = 60.0
+    circuit_open_seconds: float = 30.0
+    circuit_half_open_max_calls: int = 1
+    upstream_max_concurrency: int = 4
+    upstream_bulkhead_wait_seconds: float = 1.0
+
+    # Latency tracking, adaptive timeouts and hedged requests
+    latency_window_size: int = 200
+    latency_min_samples: int = 20
+    adaptive_timeouts_enabled: bool = True
+    adaptive_timeout_multiplier: float = 2.0
+    adaptive_timeout_min_seconds: float = 2.0
+    hedging_enabled: bool = True
+
+    # Retry budget (per upstream host, sliding window)
+    retry_budget_ratio: float = 0.2
+    retry_budget_min_per_window: int = 3
+    retry_budget_window_seconds: float = 60.0
+
+    # Collectors
+    # "embedded": API processes run collectors (leader-elected);
+    # "external": only `python -m app.collectors` workers do
+    collectors_mode: str = "embedded"
+    data_update_listener_check_seconds: float = 5.0
+    collector_memory_profiling: bool = False
+    startup_collection_concurrency: int = 3
+    startup_source_deadline_seconds: float = 45.0
+    # "fixed" intervals or "adaptive" (learned from upstream change rate)
+    collector_schedule_mode: str = "fixed"
+    collector_stagger_seconds: float = 20.0
+    collector_jitter_seconds: float = 30.0
+    adaptive_backoff_factor: float = 1.5
+    collector_misfire_grace_seconds: int = 300
+    # Daily partitions (iss_fetch_log, telemetry_legacy): created this many
+    # days ahead; expired days are dropped as whole partitions
+    partition_maintenance_interval_seconds: int = 3600
+    partition_premake_days: int = 7
+    # 0 keeps all legacy telemetry
+    telemetry_retention_days: int = 0
+    # Only the holder of this Postgres advisory lock runs collector jobs
+    leader_election_enabled: bool = True
+    leader_lock_id: int = 727001
+    leader_election_interval_seconds: float = 5.0
+
     # CORS
     cors_origins: List[str] = ["http://localhost:3000"]
     cors_allow_credentials: bool = False
@@ -33,6 +33,14 @@ class UpstreamError(SpaceDashboardError):
         self.status_code = status_code
 
 
+class CircuitOpenError(UpstreamError):
+    """Raised when calls to an upstream are short-circuited by its breaker."""
+
+    def __init__(self, host: str):
+        super().__init__(503, f"Upstream {host} is unavailable (circuit open)")
+        self.host = host
+
+
 class RateLimitedError(SpaceDashboardError):
     """Raised when rate limited by upstream API."""
 
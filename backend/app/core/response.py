@@ -1,6 +1,10 @@
 from typing import Any, Optional, Union
 from enum import Enum
 
+from fastapi.responses import Response
+
+from app.clients import json_codec
+
 
 class ErrorCode(str, Enum):
     """Error codes for API responses."""
@@ -26,6 +30,17 @@ def success_response(data: Any, trace_id: str) -> dict:
     }
 
 
+def encoded_success_response(data: bytes, trace_id: str) -> Response:
+    """
+    success_response for data that is already encoded JSON.
+
+    The envelope is assembled around the bytes, so large pre-serialized
+    payloads are not decoded and re-encoded.
+    """
+    body = b'{"ok":true,"data":' + data + b',"trace_id":' + json_codec.dumps(trace_id) + b'}'
+    return Response(body, media_type="application/json")
+
+
 def error_response(code: Union[ErrorCode, str], message: str, trace_id: str) -> dict:
     """
     Create an error API response.
@@ -0,0 +1 @@
+# Offline reverse geocoding
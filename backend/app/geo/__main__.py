@@ -0,0 +1,52 @@
+"""
+Build the offline reverse geocoder index.
+
+Usage:
+    python -m app.geo build --countries countries.geojson \
+        --timezones timezones.geojson --out geocoder_index.json [--cell-deg 0.5]
+    python -m app.geo lookup LAT LON
+
+Input: GeoJSON boundaries, e.g. Natural Earth admin-0 countries (ISO_A2)
+and timezone-boundary-builder (tzid), ideally simplified. Point
+GEOCODER_INDEX_FILE at the output so processes load it at startup
+instead of building the grid from the GeoJSON files.
+"""
+import argparse
+import logging
+
+from app.core.config import get_settings
+from app.geo.geocoder import ReverseGeocoder, reverse_geocoder
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(prog="python -m app.geo")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="build a prebuilt index from GeoJSON boundaries")
+    build.add_argument("--countries", default=settings.geocoder_countries_file)
+    build.add_argument("--timezones", default=settings.geocoder_timezones_file)
+    build.add_argument("--out", default=settings.geocoder_index_file or "geocoder_index.json")
+    build.add_argument("--cell-deg", type=float, default=settings.geocoder_cell_deg)
+
+    lookup = sub.add_parser("lookup", help="look up one point with the configured data")
+    lookup.add_argument("lat", type=float)
+    lookup.add_argument("lon", type=float)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "build":
+        if not args.countries and not args.timezones:
+            parser.error("need --countries and/or --timezones")
+        geocoder = ReverseGeocoder()
+        geocoder.build(args.countries, args.timezones, args.cell_deg)
+        geocoder.save(args.out)
+        print(f"Wrote {args.out}: {geocoder.stats()}")
+    else:
+        reverse_geocoder.ensure_loaded()
+        print(reverse_geocoder.lookup(args.lat, args.lon))
+
+
+if __name__ == "__main__":
+    main()
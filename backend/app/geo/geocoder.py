@@ -0,0 +1,274 @@
+import logging
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from app.clients import json_codec
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Property names tried in order (Natural Earth, timezone-boundary-builder, own files)
+COUNTRY_KEYS = ("country_code", "ISO_A2_EH", "ISO_A2", "iso_a2")
+TIMEZONE_KEYS = ("timezone_id", "tzid")
+INVALID_VALUES = {"", "-99"}
+
+Edge = Tuple[float, float, float, float]
+Ring = Sequence[Sequence[float]]
+
+
+def nautical_timezone(lon: float) -> str:
+    """Etc/GMT zone for open water (15 degree bands; Etc signs are inverted)."""
+    offset = int(math.floor((lon + 7.5) / 15.0))
+    offset = max(-12, min(12, offset))
+    if offset == 0:
+        return "Etc/GMT"
+    return f"Etc/GMT{'-' if offset > 0 else '+'}{abs(offset)}"
+
+
+class GeoLayer:
+    """
+    Polygons carrying one property (country code or time zone) on a grid.
+
+    The world is cut into cell_deg cells. Cells crossed by no polygon
+    edge resolve to a single value (or nothing) with one dict lookup.
+    Cells on a boundary keep their candidate polygons and are resolved
+    exactly by ray casting, using only the edges of that polygon that
+    overlap the cell's latitude band, so even large countries cost a
+    handful of edge tests per lookup.
+    """
+
+    def __init__(self, cell_deg: float):
+        self.cell_deg = cell_deg
+        self.rows = int(math.ceil(180.0 / cell_deg))
+        self.cols = int(math.ceil(360.0 / cell_deg))
+        self.values: List[str] = []
+        # cell key -> polygon index (interior) or tuple of candidate indexes (boundary)
+        self.cells: Dict[int, Union[int, Tuple[int, ...]]] = {}
+        # (polygon index, row) -> edges overlapping that latitude band
+        self.band_edges: Dict[Tuple[int, int], List[Edge]] = {}
+
+    def _row(self, lat: float) -> int:
+        return min(max(int((lat + 90.0) / self.cell_deg), 0), self.rows - 1)
+
+    def _col(self, lon: float) -> int:
+        return min(max(int((lon + 180.0) / self.cell_deg), 0), self.cols - 1)
+
+    def build(self, polygons: Iterable[Tuple[str, List[Ring]]]) -> None:
+        """Index (value, rings) pairs; every ring of a feature counts even-odd."""
+        boundary: Dict[int, set] = {}
+        extents: List[Tuple[int, int]] = []
+
+        for value, rings in polygons:
+            index = len(self.values)
+            self.values.append(value)
+            row_min, row_max = self.rows, -1
+            for ring in rings:
+                for (x1, y1), (x2, y2) in zip(ring, list(ring[1:]) + [ring[0]]):
+                    if (x1, y1) == (x2, y2):
+                        continue
+                    r0, r1 = self._row(min(y1, y2)), self._row(max(y1, y2))
+                    c0, c1 = self._col(min(x1, x2)), self._col(max(x1, x2))
+                    row_min, row_max = min(row_min, r0), max(row_max, r1)
+                    for row in range(r0, r1 + 1):
+                        self.band_edges.setdefault((index, row), []).append((x1, y1, x2, y2))
+                        for col in range(c0, c1 + 1):
+                            boundary.setdefault(row * self.cols + col, set()).add(index)
+            extents.append((row_min, row_max))
+
+        # Scanline fill of cell centers inside each polygon, away from edges
+        for index, (row_min, row_max) in enumerate(extents):
+            for row in range(row_min, row_max + 1):
+                y = -90.0 + (row + 0.5) * self.cell_deg
+                crossings = sorted(
+                    x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                    for x1, y1, x2, y2 in self.band_edges.get((index, row), ())
+                    if (y1 > y) != (y2 > y)
+                )
+                for start, end in zip(crossings[::2], crossings[1::2]):
+                    first = int(math.ceil((start + 180.0) / self.cell_deg - 0.5))
+                    last = int(math.floor((end + 180.0) / self.cell_deg - 0.5))
+                    for col in range(max(first, 0), min(last, self.cols - 1) + 1):
+                        key = row * self.cols + col
+                        if key not in boundary:
+                            self.cells[key] = index
+
+        for key, candidates in boundary.items():
+            self.cells[key] = tuple(sorted(candidates))
+
+    def _contains(self, index: int, row: int, lon: float, lat: float) -> bool:
+        inside = False
+        for x1, y1, x2, y2 in self.band_edges.get((index, row), ()):
+            if (y1 > lat) != (y2 > lat) and x1 + (lat - y1) * (x2 - x1) / (y2 - y1) > lon:
+                inside = not inside
+        return inside
+
+    def lookup(self, lat: float, lon: float) -> Optional[str]:
+        row = self._row(lat)
+        entry = self.cells.get(row * self.cols + self._col(lon))
+        if entry is None:
+            return None
+        if isinstance(entry, int):
+            return self.values[entry]
+        for index in entry:
+            if self._contains(index, row, lon, lat):
+                return self.values[index]
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "values": self.values,
+            "cells": [[key, list(entry) if isinstance(entry, tuple) else entry]
+                      for key, entry in self.cells.items()],
+            "band_edges": [[index, row, [c for edge in edges for c in edge]]
+                           for (index, row), edges in self.band_edges.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, cell_deg: float, data: Dict[str, Any]) -> "GeoLayer":
+        layer = cls(cell_deg)
+        layer.values = data["values"]
+        layer.cells = {
+            key: tuple(entry) if isinstance(entry, list) else entry
+            for key, entry in data["cells"]
+        }
+        layer.band_edges = {
+            (index, row): [tuple(flat[i:i + 4]) for i in range(0, len(flat), 4)]
+            for index, row, flat in data["band_edges"]
+        }
+        return layer
+
+
+def _feature_polygons(path: Union[str, Path], keys: Sequence[str]) -> List[Tuple[str, List[Ring]]]:
+    """(value, rings) per GeoJSON Polygon/MultiPolygon feature with a usable property."""
+    collection = json_codec.loads(Path(path).read_bytes())
+    polygons = []
+    for feature in collection.get("features", []):
+        properties = feature.get("properties") or {}
+        value = next(
+            (str(properties[k]) for k in keys if str(properties.get(k, "")) not in INVALID_VALUES),
+            None
+        )
+        geometry = feature.get("geometry") or {}
+        if value is None or geometry.get("type") not in ("Polygon", "MultiPolygon"):
+            continue
+        parts = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        polygons.append((value, [ring for part in parts for ring in part]))
+    return polygons
+
+
+class ReverseGeocoder:
+    """
+    Offline country / time zone lookup for coordinates.
+
+    Loaded once per process from a prebuilt index (geocoder_index_file,
+    see python -m app.geo) or built from the GeoJSON boundary files.
+    Without boundary data, loaded is False and callers keep using the
+    upstream /v1/coordinates lookup.
+    """
+
+    def __init__(self):
+        self.countries: Optional[GeoLayer] = None
+        self.timezones: Optional[GeoLayer] = None
+        self.load_ms: Optional[float] = None
+        self.lookups = 0
+        self._load_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.countries is not None or self.timezones is not None
+
+    def build(
+        self,
+        countries_file: Optional[str],
+        timezones_file: Optional[str],
+        cell_deg: float
+    ) -> None:
+        countries = timezones = None
+        if countries_file:
+            countries = GeoLayer(cell_deg)
+            countries.build(_feature_polygons(countries_file, COUNTRY_KEYS))
+        if timezones_file:
+            timezones = GeoLayer(cell_deg)
+            timezones.build(_feature_polygons(timezones_file, TIMEZONE_KEYS))
+        # Published together, so a concurrent reader never sees half an index
+        self.countries, self.timezones = countries, timezones
+
+    def save(self, path: Union[str, Path]) -> None:
+        cell_deg = (self.countries or self.timezones).cell_deg
+        data = {
+            "cell_deg": cell_deg,
+            "countries": self.countries.to_dict() if self.countries else None,
+            "timezones": self.timezones.to_dict() if self.timezones else None,
+        }
+        Path(path).write_bytes(json_codec.dumps(data))
+
+    def load_index(self, path: Union[str, Path]) -> None:
+        data = json_codec.loads(Path(path).read_bytes())
+        cell_deg = data["cell_deg"]
+        self.countries, self.timezones = (
+            GeoLayer.from_dict(cell_deg, data["countries"]) if data["countries"] else None,
+            GeoLayer.from_dict(cell_deg, data["timezones"]) if data["timezones"] else None,
+        )
+
+    def ensure_loaded(self) -> bool:
+        """
+        Load boundary data once, from the prebuilt index if there is one.
+
+        Blocking (run it in a thread); concurrent callers wait for the
+        first load instead of building the index again.
+        """
+        if self.loaded or self.load_ms is not None:
+            return self.loaded
+        with self._load_lock:
+            if self.loaded or self.load_ms is not None:
+                return self.loaded
+            started = time.perf_counter()
+            try:
+                if settings.geocoder_index_file and Path(settings.geocoder_index_file).exists():
+                    self.load_index(settings.geocoder_index_file)
+                elif settings.geocoder_countries_file or settings.geocoder_timezones_file:
+                    self.build(
+                        settings.geocoder_countries_file,
+                        settings.geocoder_timezones_file,
+                        settings.geocoder_cell_deg
+                    )
+            except Exception as e:
+                logger.warning(f"Could not load geocoder boundaries: {e}")
+                self.countries = self.timezones = None
+            self.load_ms = round((time.perf_counter() - started) * 1000, 1)
+        if self.loaded:
+            logger.info(f"Reverse geocoder ready in {self.load_ms} ms")
+        return self.loaded
+
+    def lookup(self, lat: float, lon: float) -> Dict[str, Optional[str]]:
+        """country_code (None over open water) and timezone_id for a point."""
+        self.lookups += 1
+        timezone_id = self.timezones.lookup(lat, lon) if self.timezones else None
+        return {
+            "country_code": self.countries.lookup(lat, lon) if self.countries else None,
+            "timezone_id": timezone_id or nautical_timezone(lon),
+        }
+
+    def lookup_many(
+        self,
+        points: Iterable[Tuple[float, float]]
+    ) -> List[Dict[str, Optional[str]]]:
+        """Batch lookup of (lat, lon) pairs, e.g. for backfills."""
+        return [self.lookup(lat, lon) for lat, lon in points]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "load_ms": self.load_ms,
+            "countries": len(self.countries.values) if self.countries else 0,
+            "timezones": len(self.timezones.values) if self.timezones else 0,
+            "lookups": self.lookups,
+        }
+
+
+# Global geocoder instance
+reverse_geocoder = ReverseGeocoder()
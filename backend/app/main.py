@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -7,8 +8,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.router import api_router
 from app.middleware.trace_id import TraceIdMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
-from app.collectors.scheduler import start_scheduler, shutdown_scheduler, run_initial_collection
+from app.collectors.leader import leader_elector
+from app.collectors.notify import data_update_listener
+from app.collectors.scheduler import shutdown_scheduler
+from app.collectors.startup import (
+    start_initial_collection,
+    start_startup_steps,
+    stop_initial_collection,
+    stop_startup_steps,
+)
+from app.clients.http_pool import http_client_registry, upstream_base_urls
 from app.core.config import get_settings
+from app.geo.geocoder import reverse_geocoder
+from app.core.database import async_session_factory
+from app.orbit.engine import orbit_engine
+from app.repositories.iss_repository import ISSRepository
+from app.services.iss_buffer import iss_position_buffer
 
 # Configure logging
 logging.basicConfig(
@@ -20,32 +35,66 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+async def _load_iss_buffer() -> None:
+    async with async_session_factory() as session:
+        await iss_position_buffer.ensure_current(ISSRepository(session))
+
+
+async def _start_collectors() -> None:
+    if settings.collectors_mode == "external":
+        start_initial_collection(collect=False)
+    else:
+        await leader_elector.start()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan handler.
 
-    Startup:
-    - Start background scheduler
-    - Run initial data collection
+    Startup (in the background, progress reported by /api/ready):
+    - Warm pooled upstream HTTP connections, load the offline reverse
+      geocoder (if boundary data is configured) and the ISS position buffer
+    - Then join collector leader election; only the leader process starts
+      the scheduler and collects, followers just check data freshness.
+      With COLLECTORS_MODE=external collectors run in the separate worker
+      (python -m app.collectors) and this process never collects.
+    - Initial data collection runs in the background as well
+    Listening for data update notifications from collectors (e.g. a new
+    ISS TLE reloads the orbit engine, new positions sync the ISS position
+    buffer) starts right away.
 
     Shutdown:
+    - Cancel startup steps if still running
+    - Stop listening for data updates
+    - Leave leader election (releases the lock for a fast failover)
+    - Cancel initial collection if still running
     - Stop scheduler gracefully
+    - Close pooled HTTP connections
     """
     # Startup
     logger.info(f"Starting {settings.app_name}")
-    start_scheduler()
+    data_update_listener.subscribe(orbit_engine.on_data_update)
+    data_update_listener.subscribe(iss_position_buffer.on_data_update)
+    data_update_listener.start()
 
-    # Run initial collection to populate data
-    try:
-        await run_initial_collection()
-    except Exception as e:
-        logger.warning(f"Initial collection failed: {e}")
+    preparation = {
+        "geocoder": lambda: asyncio.to_thread(reverse_geocoder.ensure_loaded),
+        "iss_buffer": _load_iss_buffer,
+    }
+    if settings.http_pool_enabled and settings.http_pool_warmup:
+        preparation["http_warmup"] = lambda: http_client_registry.warmup(upstream_base_urls())
+    start_startup_steps([preparation, {"collectors": _start_collectors}])
 
     yield
 
     # Shutdown
+    await stop_startup_steps()
+    await data_update_listener.stop()
+    await leader_elector.stop()
+    await stop_initial_collection()
     shutdown_scheduler()
+    await http_client_registry.aclose()
     logger.info(f"{settings.app_name} shut down")
 
 
@@ -1,7 +1,9 @@
 # SQLAlchemy models
+from app.models.collector_state import CollectorState
 from app.models.iss import ISSFetchLog
+from app.models.iss_rollup import ISSRollup
 from app.models.osdr import OSDRItem
 from app.models.space_cache import SpaceCache
 from app.models.telemetry import TelemetryLegacy
 
-__all__ = ["ISSFetchLog", "OSDRItem", "SpaceCache", "TelemetryLegacy"]
+__all__ = ["CollectorState", "ISSFetchLog", "ISSRollup", "OSDRItem", "SpaceCache", "TelemetryLegacy"]
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime, timezone
+
+from app.core.database import Base
+
+
+class CollectorState(Base):
+    """
+    Persisted scheduling state per collector source.
+
+    Lets a restarted process resume the schedule instead of re-polling
+    every source: last attempt/success, when the source is next due,
+    conditional GET validators and the learned adaptive interval.
+    """
+    __tablename__ = "collector_state"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source = Column(String(50), unique=True, nullable=False, comment="Collector source (iss, osdr, apod, ...)")
+    last_attempt_at = Column(DateTime(timezone=True), nullable=True, comment="Start of the last run")
+    last_success_at = Column(DateTime(timezone=True), nullable=True, comment="Start of the last successful run")
+    last_outcome = Column(String(20), nullable=True, comment="success, unchanged or error")
+    last_error = Column(Text, nullable=True, comment="Error of the last failed run")
+    next_due_at = Column(DateTime(timezone=True), nullable=True, comment="Next scheduled run")
+    validators = Column(JSONB, nullable=True, comment="ETag/Last-Modified validators per request key")
+    fingerprint = Column(String(64), nullable=True, comment="Digest of the last fetched payload")
+    last_change_at = Column(DateTime(timezone=True), nullable=True, comment="When the payload last changed")
+    interval_seconds = Column(Float, nullable=True, comment="Learned adaptive poll interval")
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        comment="Last update timestamp"
+    )
+
+    def __repr__(self) -> str:
+        return f"<CollectorState(source={self.source}, next_due_at={self.next_due_at})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, Index
+from sqlalchemy import Column, Integer, Float, String, DateTime, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime, timezone
 
@@ -9,8 +9,12 @@ class ISSFetchLog(Base):
     """
     ISS position fetch log table.
 
-    Stores ISS position data fetched every 120 seconds.
-    Data is append-only with 7-14 days retention.
+    Stores ISS position data fetched every 120 seconds, plus positions
+    backfilled into gaps. timestamp is the upstream position time and is
+    unique, so polls and backfills never store a position twice.
+    Data is append-only with 7-14 days retention. The table is range
+    partitioned by day on timestamp (see partition_collector), so the
+    primary key includes timestamp and retention drops whole partitions.
     """
     __tablename__ = "iss_fetch_log"
 
@@ -21,8 +25,9 @@ class ISSFetchLog(Base):
     velocity_kmh = Column(Float, nullable=False, comment="Velocity in km/h")
     timestamp = Column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
-        comment="Timestamp of the position"
+        comment="Upstream timestamp of the position"
     )
     source_url = Column(String(500), nullable=False, comment="API source URL")
     raw = Column(JSONB, nullable=True, comment="Raw API response")
@@ -34,7 +39,10 @@ class ISSFetchLog(Base):
     )
 
     __table_args__ = (
-        Index("ix_iss_fetch_log_timestamp", "timestamp"),
+        UniqueConstraint("timestamp", name="uq_iss_fetch_log_timestamp"),
+        # Rows inserted since the rollup watermark (backfills insert old timestamps)
+        Index("ix_iss_fetch_log_inserted_at", "inserted_at"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,48 @@
+from sqlalchemy import Column, Integer, Float, String, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime, timezone
+
+from app.core.database import Base
+
+
+class ISSRollup(Base):
+    """
+    Hourly and daily ISS position statistics.
+
+    One row per (granularity, UTC bucket start), refreshed from
+    iss_fetch_log by the rollup job: hours whose raw rows changed are
+    recomputed from raw rows, days from their hourly rollups. Sums are
+    stored instead of averages so buckets combine exactly. Rollups are
+    not subject to the raw data retention.
+    """
+    __tablename__ = "iss_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    granularity = Column(String(8), nullable=False, comment="hour or day")
+    bucket = Column(DateTime(timezone=True), nullable=False, comment="Bucket start (UTC)")
+    samples = Column(Integer, nullable=False, comment="Positions in the bucket")
+    alt_sum = Column(Float, nullable=False, comment="Sum of altitudes (km)")
+    alt_min = Column(Float, nullable=False, comment="Minimum altitude (km)")
+    alt_max = Column(Float, nullable=False, comment="Maximum altitude (km)")
+    velocity_sum = Column(Float, nullable=False, comment="Sum of velocities (km/h)")
+    velocity_min = Column(Float, nullable=False, comment="Minimum velocity (km/h)")
+    velocity_max = Column(Float, nullable=False, comment="Maximum velocity (km/h)")
+    countries = Column(JSONB, nullable=False, comment="Samples per overflown country code")
+    source_inserted_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Latest inserted_at of the raw rows included (refresh watermark)"
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        comment="Last refresh time"
+    )
+
+    __table_args__ = (
+        UniqueConstraint("granularity", "bucket", name="uq_iss_rollups_granularity_bucket"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ISSRollup(granularity={self.granularity}, bucket={self.bucket}, samples={self.samples})>"
@@ -10,12 +10,14 @@ class TelemetryLegacy(Base):
 
     Stores CSV data generated by the legacy CLI service.
     Replaces the Pascal-based telemetry generator.
+    Range partitioned by day on recorded_at, like iss_fetch_log.
     """
     __tablename__ = "telemetry_legacy"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     recorded_at = Column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         index=True,
         comment="Time when telemetry was recorded"
@@ -28,5 +30,9 @@ class TelemetryLegacy(Base):
         comment="Source CSV file name"
     )
 
+    __table_args__ = (
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
+
     def __repr__(self) -> str:
         return f"<TelemetryLegacy(id={self.id}, recorded_at={self.recorded_at}, voltage={self.voltage}, temp={self.temp})>"
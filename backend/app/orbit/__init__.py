@@ -0,0 +1 @@
+# Orbit propagation (SGP4) for the ISS
@@ -0,0 +1,230 @@
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Sequence
+
+try:
+    import numpy as np
+    from sgp4.api import Satrec
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    Satrec = None
+
+from app.core.config import get_settings
+from app.orbit.tle import TLE
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# WGS84 ellipsoid (km)
+WGS84_A = 6378.137
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+EARTH_MEAN_RADIUS_KM = 6371.0
+
+UNIX_EPOCH_JD = 2440587.5
+
+
+def orbit_engine_available() -> bool:
+    """Whether numpy and sgp4 are installed."""
+    return np is not None and Satrec is not None
+
+
+def unix_seconds(at: datetime) -> float:
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return at.timestamp()
+
+
+def julian_dates(unix: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+    """Split unix seconds into whole and fractional Julian dates (keeps precision)."""
+    days = unix / 86400.0
+    whole = np.floor(days)
+    return UNIX_EPOCH_JD + whole, days - whole
+
+
+def gmst(unix: "np.ndarray") -> "np.ndarray":
+    """Greenwich mean sidereal time in radians (IAU 1982, UT1 ~ UTC)."""
+    jd_whole, jd_frac = julian_dates(unix)
+    t = (jd_whole - 2451545.0 + jd_frac) / 36525.0
+    seconds = (
+        67310.54841
+        + (876600.0 * 3600.0 + 8640184.812866) * t
+        + 0.093104 * t ** 2
+        - 6.2e-6 * t ** 3
+    )
+    return np.radians(np.mod(seconds, 86400.0) / 240.0)
+
+
+def teme_to_ecef(r_teme: "np.ndarray", unix: "np.ndarray") -> "np.ndarray":
+    """Rotate TEME positions (n, 3) into the Earth-fixed frame (polar motion ignored)."""
+    theta = gmst(unix)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    x, y, z = r_teme[:, 0], r_teme[:, 1], r_teme[:, 2]
+    return np.column_stack((cos_t * x + sin_t * y, -sin_t * x + cos_t * y, z))
+
+
+def ecef_to_geodetic(r_ecef: "np.ndarray") -> "tuple[np.ndarray, np.ndarray, np.ndarray]":
+    """WGS84 latitude/longitude in degrees and altitude in km for ECEF positions (n, 3)."""
+    x, y, z = r_ecef[:, 0], r_ecef[:, 1], r_ecef[:, 2]
+    lon = np.arctan2(y, x)
+    p = np.hypot(x, y)
+    lat = np.arctan2(z, p * (1 - WGS84_E2))
+    for _ in range(5):
+        sin_lat = np.sin(lat)
+        n = WGS84_A / np.sqrt(1 - WGS84_E2 * sin_lat ** 2)
+        alt = p / np.cos(lat) - n
+        lat = np.arctan2(z, p * (1 - WGS84_E2 * n / (n + alt)))
+    sin_lat = np.sin(lat)
+    n = WGS84_A / np.sqrt(1 - WGS84_E2 * sin_lat ** 2)
+    alt = p / np.cos(lat) - n
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def great_circle_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance on a spherical Earth."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_MEAN_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class OrbitEngine:
+    """
+    SGP4 propagation of the ISS from its latest TLE.
+
+    Positions are computed for whole arrays of timestamps at once: SGP4
+    itself runs vectorized in sgp4's C extension, the frame conversion
+    to latitude/longitude/altitude in NumPy. Upstream polls are compared
+    against the prediction (check_drift); while the drift exceeds
+    iss_drift_threshold_km the engine is not trusted for serving.
+    """
+
+    def __init__(self):
+        self.tle: Optional[TLE] = None
+        self._satrec: Any = None
+        self.loaded_at: Optional[datetime] = None
+        self.checked_at: Optional[datetime] = None
+        self.reload_requested = False
+        self.drifted = False
+        self.last_drift_km: Optional[float] = None
+        self.last_drift_at: Optional[datetime] = None
+        self.propagated_points = 0
+
+    @property
+    def available(self) -> bool:
+        return orbit_engine_available()
+
+    def load(self, tle: TLE) -> bool:
+        """Switch to a new element set; returns True if the epoch changed."""
+        if not self.available:
+            return False
+        self.checked_at = datetime.now(timezone.utc)
+        self.reload_requested = False
+        if self.tle is not None and self.tle.line1 == tle.line1 and self.tle.line2 == tle.line2:
+            return False
+        self._satrec = Satrec.twoline2rv(tle.line1, tle.line2)
+        self.tle = tle
+        self.loaded_at = self.checked_at
+        self.drifted = False
+        logger.info(f"Orbit engine loaded TLE with epoch {tle.epoch.isoformat()}")
+        return True
+
+    def request_reload(self) -> None:
+        """Ask for the TLE to be re-read from the DB (a collector stored a new one)."""
+        self.reload_requested = True
+
+    def on_data_update(self, source: str) -> None:
+        """data_update_listener subscriber."""
+        if source == "iss_tle":
+            self.request_reload()
+
+    def needs_reload(self, now: Optional[datetime] = None) -> bool:
+        if not self.available:
+            return False
+        if self.tle is None or self.reload_requested or self.checked_at is None:
+            return True
+        now = now or datetime.now(timezone.utc)
+        return now - self.checked_at >= timedelta(seconds=settings.iss_tle_check_seconds)
+
+    def is_current(self, now: Optional[datetime] = None) -> bool:
+        """Loaded, not drifted, and the TLE epoch is close enough to trust SGP4."""
+        if self._satrec is None or self.drifted:
+            return False
+        now = now or datetime.now(timezone.utc)
+        return abs(now - self.tle.epoch) <= timedelta(hours=settings.iss_tle_max_age_hours)
+
+    def propagate(self, unix: Sequence[float]) -> Dict[str, "np.ndarray"]:
+        """
+        Positions for an array of unix timestamps.
+
+        Returns arrays keyed latitude, longitude (degrees), altitude_km,
+        velocity_kmh (inertial speed, as the upstream reports it) and
+        ecef (n, 3, km). Timestamps SGP4 cannot propagate come back as NaN.
+        """
+        if self._satrec is None:
+            raise RuntimeError("No TLE loaded")
+        unix = np.asarray(unix, dtype=float)
+        jd, fr = julian_dates(unix)
+        errors, r_teme, v_teme = self._satrec.sgp4_array(jd, fr)
+        failed = errors != 0
+        r_teme[failed] = np.nan
+        v_teme[failed] = np.nan
+
+        ecef = teme_to_ecef(r_teme, unix)
+        lat, lon, alt = ecef_to_geodetic(ecef)
+        self.propagated_points += len(unix)
+        return {
+            "latitude": lat,
+            "longitude": lon,
+            "altitude_km": alt,
+            "velocity_kmh": np.linalg.norm(v_teme, axis=1) * 3600.0,
+            "ecef": ecef,
+        }
+
+    def position_at(self, at: datetime) -> Dict[str, Any]:
+        """Position at a single instant, formatted like a stored poll."""
+        state = self.propagate([unix_seconds(at)])
+        return {
+            "latitude": round(float(state["latitude"][0]), 6),
+            "longitude": round(float(state["longitude"][0]), 6),
+            "altitude_km": round(float(state["altitude_km"][0]), 3),
+            "velocity_kmh": round(float(state["velocity_kmh"][0]), 3),
+        }
+
+    def check_drift(self, lat: float, lon: float, at: datetime) -> Optional[float]:
+        """
+        Compare an upstream poll with the prediction for the same instant.
+
+        Returns the ground distance in km (None if nothing is loaded).
+        """
+        if self._satrec is None:
+            return None
+        predicted = self.position_at(at)
+        drift = great_circle_km(lat, lon, predicted["latitude"], predicted["longitude"])
+        self.last_drift_km = round(drift, 3)
+        self.last_drift_at = datetime.now(timezone.utc)
+        was_drifted = self.drifted
+        self.drifted = drift > settings.iss_drift_threshold_km
+        if self.drifted and not was_drifted:
+            logger.warning(
+                f"ISS prediction drifted {drift:.1f} km from upstream, serving polls until a new TLE"
+            )
+        return drift
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "available": self.available,
+            "current": self.is_current(),
+            "tle_epoch": self.tle.epoch.isoformat() if self.tle else None,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "drifted": self.drifted,
+            "last_drift_km": self.last_drift_km,
+            "last_drift_at": self.last_drift_at.isoformat() if self.last_drift_at else None,
+            "propagated_points": self.propagated_points,
+        }
+
+
+# Global engine instance
+orbit_engine = OrbitEngine()
@@ -0,0 +1,58 @@
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from app.core.config import get_settings
+from app.orbit.cache import PredictionCache
+from app.orbit.engine import OrbitEngine
+
+settings = get_settings()
+
+# Global cache: (tle epoch, step, orbits, window start) -> response data
+groundtrack_cache = PredictionCache(settings.orbit_prediction_cache_size)
+
+
+def split_antimeridian(lat: "np.ndarray", lon: "np.ndarray") -> List[List[List[float]]]:
+    """
+    Split a track into [lon, lat] line segments at the antimeridian.
+
+    A segment ends where consecutive longitudes jump by more than 180
+    degrees. The crossing latitude is interpolated, so each segment ends
+    exactly at +/-180 and the next one starts on the opposite edge.
+    Points that could not be propagated (NaN) are dropped.
+    """
+    valid = np.isfinite(lat) & np.isfinite(lon)
+    lat, lon = lat[valid], lon[valid]
+    if len(lat) == 0:
+        return []
+
+    breaks = np.nonzero(np.abs(np.diff(lon)) > 180.0)[0] + 1
+    # Crossing point between the last point before and the first after each break
+    lon_before, lon_after = lon[breaks - 1], lon[breaks]
+    lat_before, lat_after = lat[breaks - 1], lat[breaks]
+    edge = np.where(lon_before > 0, 180.0, -180.0)
+    unwrapped_after = lon_after + 2 * edge
+    fraction = (edge - lon_before) / (unwrapped_after - lon_before)
+    lat_crossing = np.round(lat_before + fraction * (lat_after - lat_before), 4)
+
+    points = np.round(np.column_stack((lon, lat)), 4)
+    segments = [part.tolist() for part in np.split(points, breaks)]
+    for i, (edge_lon, crossing) in enumerate(zip(edge.tolist(), lat_crossing.tolist())):
+        segments[i].append([edge_lon, crossing])
+        segments[i + 1].insert(0, [-edge_lon, crossing])
+    return segments
+
+
+def ground_track(
+    engine: OrbitEngine,
+    start_unix: float,
+    end_unix: float,
+    step_seconds: float
+) -> List[List[List[float]]]:
+    """Propagate [start, end] at step_seconds in one batch and split it for map rendering."""
+    times = np.arange(start_unix, end_unix + step_seconds, step_seconds, dtype=float)
+    state = engine.propagate(times)
+    return split_antimeridian(state["latitude"], state["longitude"])
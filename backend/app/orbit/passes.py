@@ -0,0 +1,201 @@
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from app.core.config import get_settings
+from app.orbit.cache import PredictionCache
+from app.orbit.engine import (
+    EARTH_MEAN_RADIUS_KM,
+    WGS84_A,
+    WGS84_E2,
+    OrbitEngine,
+    julian_dates,
+    teme_to_ecef,
+    unix_seconds,
+)
+
+settings = get_settings()
+
+# Global cache: (tle epoch, quantized location, window, ...) -> passes
+pass_cache = PredictionCache(settings.orbit_prediction_cache_size)
+
+# Coarse search step; shorter than any pass worth reporting
+COARSE_STEP_SECONDS = 30.0
+# Bisection halves the bracket each time: 30 s / 2**16 < 1 ms
+REFINE_ITERATIONS = 16
+# Sun below this elevation counts as dark enough to see the ISS
+TWILIGHT_ELEVATION_DEG = -6.0
+
+
+class Observer:
+    """Observer on the WGS84 ellipsoid with a local east/north/up frame."""
+
+    def __init__(self, latitude: float, longitude: float, elevation_m: float = 0.0):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.elevation_m = elevation_m
+        lat, lon = np.radians(latitude), np.radians(longitude)
+        n = WGS84_A / np.sqrt(1 - WGS84_E2 * np.sin(lat) ** 2)
+        h = elevation_m / 1000.0
+        self.ecef = np.array([
+            (n + h) * np.cos(lat) * np.cos(lon),
+            (n + h) * np.cos(lat) * np.sin(lon),
+            (n * (1 - WGS84_E2) + h) * np.sin(lat),
+        ])
+        self.east = np.array([-np.sin(lon), np.cos(lon), 0.0])
+        self.north = np.array([-np.sin(lat) * np.cos(lon), -np.sin(lat) * np.sin(lon), np.cos(lat)])
+        self.up = np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+    def look_angles(self, targets_ecef: "np.ndarray") -> "tuple[np.ndarray, np.ndarray]":
+        """Elevation and azimuth in degrees of ECEF positions (n, 3)."""
+        rho = targets_ecef - self.ecef
+        up = rho @ self.up
+        elevation = np.degrees(np.arcsin(up / np.linalg.norm(rho, axis=1)))
+        azimuth = np.mod(np.degrees(np.arctan2(rho @ self.east, rho @ self.north)), 360.0)
+        return elevation, azimuth
+
+
+def sun_direction_ecef(unix: "np.ndarray") -> "np.ndarray":
+    """
+    Unit vectors towards the Sun in the Earth-fixed frame (n, 3).
+
+    Low-precision solar coordinates (Astronomical Almanac, ~0.01 deg),
+    plenty for shadow and twilight checks.
+    """
+    jd_whole, jd_frac = julian_dates(unix)
+    n = jd_whole - 2451545.0 + jd_frac
+    mean_lon = np.radians(280.460 + 0.9856474 * n)
+    anomaly = np.radians(357.528 + 0.9856003 * n)
+    ecliptic_lon = mean_lon + np.radians(1.915 * np.sin(anomaly) + 0.020 * np.sin(2 * anomaly))
+    obliquity = np.radians(23.439 - 0.0000004 * n)
+    inertial = np.column_stack((
+        np.cos(ecliptic_lon),
+        np.cos(obliquity) * np.sin(ecliptic_lon),
+        np.sin(obliquity) * np.sin(ecliptic_lon),
+    ))
+    return teme_to_ecef(inertial, unix)
+
+
+def is_sunlit(sat_ecef: "np.ndarray", sun_ecef: "np.ndarray") -> "np.ndarray":
+    """Cylindrical Earth shadow: dark only behind the Earth and within its radius."""
+    along = np.sum(sat_ecef * sun_ecef, axis=1)
+    across = np.linalg.norm(sat_ecef - along[:, None] * sun_ecef, axis=1)
+    return (along > 0) | (across > EARTH_MEAN_RADIUS_KM)
+
+
+def visibility_at(engine: OrbitEngine, at: datetime) -> str:
+    """Satellite illumination at one instant, as the upstream reports it: daylight or eclipsed."""
+    unix = np.array([unix_seconds(at)])
+    sunlit = is_sunlit(engine.propagate(unix)["ecef"], sun_direction_ecef(unix))
+    return "daylight" if sunlit[0] else "eclipsed"
+
+
+def _bisect(
+    f: Callable[["np.ndarray"], "np.ndarray"],
+    lo: "np.ndarray",
+    hi: "np.ndarray"
+) -> "np.ndarray":
+    """
+    Refine many brackets at once.
+
+    f(lo) and f(hi) have opposite signs for every bracket; each iteration
+    evaluates f for all midpoints in one batch.
+    """
+    lo, hi = lo.copy(), hi.copy()
+    lo_positive = f(lo) > 0
+    for _ in range(REFINE_ITERATIONS):
+        mid = (lo + hi) / 2
+        same_side = (f(mid) > 0) == lo_positive
+        lo = np.where(same_side, mid, lo)
+        hi = np.where(same_side, hi, mid)
+    return (lo + hi) / 2
+
+
+def _iso(unix: float) -> str:
+    return datetime.fromtimestamp(unix, tz=timezone.utc).isoformat()
+
+
+def predict_passes(
+    engine: OrbitEngine,
+    observer: Observer,
+    start_unix: float,
+    end_unix: float,
+    min_elevation: float = 10.0
+) -> List[Dict[str, Any]]:
+    """
+    Passes of the satellite over an observer between start and end.
+
+    Rise and set are where the elevation crosses 0 degrees. They are
+    found on a coarse grid and refined by vectorized bisection, as is
+    the culmination (sign change of the elevation rate). Passes peaking
+    below min_elevation are dropped. A pass is "visible" when at some
+    point the ISS is above the horizon and sunlit while the observer
+    is in darkness (Sun below -6 degrees).
+    """
+    def elevation(times: "np.ndarray") -> "np.ndarray":
+        return observer.look_angles(engine.propagate(times)["ecef"])[0]
+
+    times = np.arange(start_unix, end_unix + COARSE_STEP_SECONDS, COARSE_STEP_SECONDS)
+    coarse_ecef = engine.propagate(times)["ecef"]
+    coarse_elevation = observer.look_angles(coarse_ecef)[0]
+    above = coarse_elevation > 0
+    rising = np.nonzero(~above[:-1] & above[1:])[0]
+    setting = np.nonzero(above[:-1] & ~above[1:])[0]
+    # Only complete passes: drop a set before the first rise and a trailing rise
+    if len(setting) and len(rising) and setting[0] < rising[0]:
+        setting = setting[1:]
+    rising = rising[:len(setting)]
+    count = len(rising)
+    if count == 0:
+        return []
+
+    rise = _bisect(elevation, times[rising], times[rising + 1])
+    set_ = _bisect(elevation, times[setting], times[setting + 1])
+
+    # Coarse samples above the horizon per pass; the peak is bracketed
+    # by one step on each side of the highest one
+    sample_index = [np.arange(r + 1, s + 1) for r, s in zip(rising, setting)]
+    peaks = np.array([idx[np.argmax(coarse_elevation[idx])] for idx in sample_index])
+    lo = np.maximum(times[peaks] - COARSE_STEP_SECONDS, rise)
+    hi = np.minimum(times[peaks] + COARSE_STEP_SECONDS, set_)
+    culmination = _bisect(lambda t: elevation(t + 0.5) - elevation(t - 0.5), lo, hi)
+
+    key_ecef = engine.propagate(np.concatenate((rise, culmination, set_)))["ecef"]
+    elevations, azimuths = observer.look_angles(key_ecef)
+    max_elevation = elevations[count:2 * count]
+
+    # Sunlit / visible over the coarse samples of each pass plus its peak
+    samples = np.concatenate(sample_index)
+    sample_times = np.concatenate((times[samples], culmination))
+    sample_ecef = np.concatenate((coarse_ecef[samples], key_ecef[count:2 * count]))
+    sample_pass = np.concatenate(
+        [np.full(len(idx), i) for i, idx in enumerate(sample_index)] + [np.arange(count)]
+    )
+    sun = sun_direction_ecef(sample_times)
+    sunlit = is_sunlit(sample_ecef, sun)
+    # Sun elevation at the observer (the Sun is effectively at infinity)
+    dark = observer.look_angles(observer.ecef + sun * 1.0e8)[0] < TWILIGHT_ELEVATION_DEG
+
+    passes = []
+    for i in range(count):
+        if max_elevation[i] < min_elevation:
+            continue
+        in_pass = sample_pass == i
+        passes.append({
+            "rise": {"time": _iso(rise[i]), "azimuth": round(float(azimuths[i]), 1)},
+            "culmination": {
+                "time": _iso(culmination[i]),
+                "elevation": round(float(max_elevation[i]), 1),
+                "azimuth": round(float(azimuths[count + i]), 1),
+            },
+            "set": {"time": _iso(set_[i]), "azimuth": round(float(azimuths[2 * count + i]), 1)},
+            "max_elevation": round(float(max_elevation[i]), 1),
+            "duration_seconds": round(float(set_[i] - rise[i]), 1),
+            "sunlit": bool(np.any(sunlit[in_pass])),
+            "visible": bool(np.any(sunlit[in_pass] & dark[in_pass])),
+        })
+    return passes
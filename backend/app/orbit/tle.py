@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Any, Union
+
+# space_cache source the TLE collector stores element sets under
+TLE_SOURCE = "iss_tle"
+
+
+def _checksum(line: str) -> int:
+    """TLE line checksum: sum of digits, '-' counts as 1, modulo 10."""
+    total = 0
+    for char in line[:68]:
+        if char.isdigit():
+            total += int(char)
+        elif char == "-":
+            total += 1
+    return total % 10
+
+
+@dataclass(frozen=True)
+class TLE:
+    """A two-line element set."""
+
+    name: str
+    line1: str
+    line2: str
+
+    @property
+    def norad_id(self) -> int:
+        return int(self.line1[2:7])
+
+    @property
+    def epoch(self) -> datetime:
+        """Epoch encoded in line 1 (two-digit year, fractional day of year)."""
+        year = int(self.line1[18:20])
+        year += 2000 if year < 57 else 1900
+        day = float(self.line1[20:32])
+        return datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(days=day - 1)
+
+    @property
+    def mean_motion(self) -> float:
+        """Revolutions per day."""
+        return float(self.line2[52:63])
+
+    @property
+    def period_seconds(self) -> float:
+        return 86400.0 / self.mean_motion
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "line1": self.line1,
+            "line2": self.line2,
+            "epoch": self.epoch.isoformat(),
+        }
+
+
+def parse_tle(line1: str, line2: str, name: str = "ISS (ZARYA)") -> TLE:
+    """
+    Validate and build a TLE.
+
+    Raises ValueError for malformed lines or checksum mismatches, so a
+    corrupt upstream response never replaces a good element set.
+    """
+    line1, line2 = line1.strip(), line2.strip()
+    for number, line in ((1, line1), (2, line2)):
+        if len(line) != 69 or not line.startswith(f"{number} "):
+            raise ValueError(f"Malformed TLE line {number}: {line!r}")
+        if not line[68].isdigit() or _checksum(line) != int(line[68]):
+            raise ValueError(f"TLE line {number} checksum mismatch")
+    if line1[2:7] != line2[2:7]:
+        raise ValueError("TLE lines belong to different satellites")
+    return TLE(name=name.strip(), line1=line1, line2=line2)
+
+
+def parse_tle_text(text: str) -> TLE:
+    """Parse a TLE from text with two lines or three (name line first)."""
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    if len(lines) == 2:
+        return parse_tle(lines[0], lines[1])
+    if len(lines) == 3:
+        return parse_tle(lines[1], lines[2], name=lines[0])
+    raise ValueError(f"Expected 2 or 3 TLE lines, got {len(lines)}")
+
+
+def read_tle_file(path: Union[str, Path]) -> TLE:
+    """Read a TLE from a file (offline setups, see ISS_TLE_FILE)."""
+    return parse_tle_text(Path(path).read_text())
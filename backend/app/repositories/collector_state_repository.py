@@ -0,0 +1,31 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from app.models.collector_state import CollectorState
+from app.repositories.base import BaseRepository
+
+
+class CollectorStateRepository(BaseRepository[CollectorState]):
+    """Repository for persisted collector scheduling state."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, CollectorState)
+
+    async def get_states(self) -> Dict[str, CollectorState]:
+        """Get the state of every source, keyed by source."""
+        result = await self.session.execute(select(CollectorState))
+        return {state.source: state for state in result.scalars().all()}
+
+    async def upsert_state(self, source: str, **values: Any) -> None:
+        """Insert or update the state row of a source (only the given columns)."""
+        values["updated_at"] = datetime.now(timezone.utc)
+        stmt = insert(CollectorState).values(source=source, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["source"],
+            set_={key: stmt.excluded[key] for key in values}
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
@@ -1,7 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List, Sequence, Tuple
 
 from app.models.iss import ISSFetchLog
 from app.repositories.base import BaseRepository
@@ -33,6 +34,58 @@ class ISSRepository(BaseRepository[ISSFetchLog]):
         )
         return list(result.scalars().all())
 
+    async def get_buffer_rows(self, since: datetime) -> List[Tuple]:
+        """
+        Positions after a point in time, oldest first, as plain tuples.
+
+        Only the columns the in-memory buffer keeps are selected; the
+        fields it needs from raw are extracted by Postgres, so no ORM
+        objects or JSONB documents are materialized.
+        """
+        result = await self.session.execute(
+            select(
+                ISSFetchLog.timestamp,
+                ISSFetchLog.lat,
+                ISSFetchLog.lon,
+                ISSFetchLog.alt_km,
+                ISSFetchLog.velocity_kmh,
+                ISSFetchLog.raw["visibility"].astext,
+                ISSFetchLog.raw[("location_info", "country_code")].astext,
+                ISSFetchLog.raw[("location_info", "timezone_id")].astext,
+            )
+            .where(ISSFetchLog.timestamp > since)
+            .order_by(ISSFetchLog.timestamp)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def stream_positions(
+        self,
+        since: datetime,
+        chunk_size: int = 1000
+    ) -> AsyncIterator[Sequence[Tuple]]:
+        """
+        Positions since a point in time, newest first, in chunks of plain tuples.
+
+        Rows come from a server-side cursor (yield_per), so memory use
+        does not depend on how many rows match.
+        """
+        result = await self.session.stream(
+            select(
+                ISSFetchLog.timestamp,
+                ISSFetchLog.lat,
+                ISSFetchLog.lon,
+                ISSFetchLog.alt_km,
+                ISSFetchLog.velocity_kmh,
+                ISSFetchLog.raw["visibility"].astext,
+                ISSFetchLog.raw[("location_info", "country_code")].astext,
+            )
+            .where(ISSFetchLog.timestamp >= since)
+            .order_by(ISSFetchLog.timestamp.desc())
+            .execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
     async def insert_position(
         self,
         lat: float,
@@ -40,31 +93,74 @@ class ISSRepository(BaseRepository[ISSFetchLog]):
         alt_km: float,
         velocity_kmh: float,
         source_url: str,
-        raw: Optional[dict] = None
-    ) -> ISSFetchLog:
-        """Insert a new ISS position record."""
-        log = ISSFetchLog(
-            lat=lat,
-            lon=lon,
-            alt_km=alt_km,
-            velocity_kmh=velocity_kmh,
-            timestamp=datetime.now(timezone.utc),
-            source_url=source_url,
-            raw=raw
+        raw: Optional[dict] = None,
+        timestamp: Optional[datetime] = None
+    ) -> Optional[ISSFetchLog]:
+        """
+        Insert a new ISS position record.
+
+        timestamp is the upstream position time (defaults to now). Returns
+        None if a position with that timestamp is already stored.
+        """
+        result = await self.session.scalars(
+            insert(ISSFetchLog)
+            .values(
+                lat=lat,
+                lon=lon,
+                alt_km=alt_km,
+                velocity_kmh=velocity_kmh,
+                timestamp=timestamp or datetime.now(timezone.utc),
+                source_url=source_url,
+                raw=raw,
+                inserted_at=datetime.now(timezone.utc)
+            )
+            .on_conflict_do_nothing(index_elements=["timestamp"])
+            .returning(ISSFetchLog)
         )
-        self.session.add(log)
+        record = result.one_or_none()
         await self.session.commit()
-        await self.session.refresh(log)
-        return log
+        return record
 
-    async def cleanup_old_records(self, retention_days: int = 14) -> int:
+    async def insert_positions(self, rows: List[Dict[str, Any]]) -> int:
         """
-        Delete records older than retention period.
-        Returns the number of deleted records.
+        Bulk insert positions (backfill), skipping timestamps already stored.
+
+        Each row has lat, lon, alt_km, velocity_kmh, timestamp, source_url
+        and raw. Returns the number of rows inserted.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        if not rows:
+            return 0
+        now = datetime.now(timezone.utc)
         result = await self.session.execute(
-            delete(ISSFetchLog).where(ISSFetchLog.timestamp < cutoff)
+            insert(ISSFetchLog)
+            .values([{**row, "inserted_at": now} for row in rows])
+            .on_conflict_do_nothing(index_elements=["timestamp"])
+            .returning(ISSFetchLog.id)
         )
+        inserted = len(result.all())
         await self.session.commit()
-        return result.rowcount
+        return inserted
+
+    async def find_gaps(
+        self,
+        since: datetime,
+        min_gap_seconds: float
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Find holes in the position history since a point in time.
+
+        Returns (last position before, first position after) pairs for
+        consecutive positions more than min_gap_seconds apart, newest first.
+        """
+        previous = func.lag(ISSFetchLog.timestamp).over(order_by=ISSFetchLog.timestamp)
+        ordered = (
+            select(ISSFetchLog.timestamp.label("ts"), previous.label("prev_ts"))
+            .where(ISSFetchLog.timestamp >= since)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(ordered.c.prev_ts, ordered.c.ts)
+            .where(ordered.c.ts - ordered.c.prev_ts > timedelta(seconds=min_gap_seconds))
+            .order_by(ordered.c.ts.desc())
+        )
+        return [(row.prev_ts, row.ts) for row in result.all()]
@@ -0,0 +1,138 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, text
+from datetime import datetime
+from typing import List, Optional
+
+from app.models.iss_rollup import ISSRollup
+from app.repositories.base import BaseRepository
+
+# Hours touched by raw rows inserted after :since are recomputed from raw rows
+_REFRESH_HOURLY = text("""
+WITH touched AS (
+    SELECT DISTINCT date_trunc('hour', "timestamp", 'UTC') AS bucket
+    FROM iss_fetch_log
+    WHERE inserted_at > :since
+),
+positions AS (
+    SELECT t.bucket, l.alt_km, l.velocity_kmh, l.inserted_at,
+           l.raw #>> '{location_info,country_code}' AS country
+    FROM touched t
+    JOIN iss_fetch_log l
+      ON l."timestamp" >= t.bucket AND l."timestamp" < t.bucket + interval '1 hour'
+),
+countries AS (
+    SELECT bucket, jsonb_object_agg(country, samples) AS countries
+    FROM (
+        SELECT bucket, country, count(*) AS samples
+        FROM positions
+        WHERE country IS NOT NULL
+        GROUP BY bucket, country
+    ) per_country
+    GROUP BY bucket
+)
+INSERT INTO iss_rollups (
+    granularity, bucket, samples, alt_sum, alt_min, alt_max,
+    velocity_sum, velocity_min, velocity_max, countries, source_inserted_at, updated_at
+)
+SELECT 'hour', p.bucket, count(*), sum(p.alt_km), min(p.alt_km), max(p.alt_km),
+       sum(p.velocity_kmh), min(p.velocity_kmh), max(p.velocity_kmh),
+       coalesce(c.countries, '{}'::jsonb), max(p.inserted_at), now()
+FROM positions p
+LEFT JOIN countries c ON c.bucket = p.bucket
+GROUP BY p.bucket, c.countries
+ON CONFLICT (granularity, bucket) DO UPDATE SET
+    samples = EXCLUDED.samples,
+    alt_sum = EXCLUDED.alt_sum,
+    alt_min = EXCLUDED.alt_min,
+    alt_max = EXCLUDED.alt_max,
+    velocity_sum = EXCLUDED.velocity_sum,
+    velocity_min = EXCLUDED.velocity_min,
+    velocity_max = EXCLUDED.velocity_max,
+    countries = EXCLUDED.countries,
+    source_inserted_at = EXCLUDED.source_inserted_at,
+    updated_at = EXCLUDED.updated_at
+RETURNING bucket
+""")
+
+# Days containing the given hours are recomputed from their hourly rollups
+_REFRESH_DAILY = text("""
+WITH hours AS (
+    SELECT date_trunc('day', bucket, 'UTC') AS day, *
+    FROM iss_rollups
+    WHERE granularity = 'hour'
+      AND date_trunc('day', bucket, 'UTC') IN (
+          SELECT DISTINCT date_trunc('day', h, 'UTC') FROM unnest(CAST(:hours AS timestamptz[])) AS h
+      )
+),
+countries AS (
+    SELECT day, jsonb_object_agg(country, samples) AS countries
+    FROM (
+        SELECT day, e.key AS country, sum(e.value::int) AS samples
+        FROM hours, jsonb_each_text(hours.countries) AS e
+        GROUP BY day, e.key
+    ) per_country
+    GROUP BY day
+)
+INSERT INTO iss_rollups (
+    granularity, bucket, samples, alt_sum, alt_min, alt_max,
+    velocity_sum, velocity_min, velocity_max, countries, source_inserted_at, updated_at
+)
+SELECT 'day', h.day, sum(h.samples), sum(h.alt_sum), min(h.alt_min), max(h.alt_max),
+       sum(h.velocity_sum), min(h.velocity_min), max(h.velocity_max),
+       coalesce(c.countries, '{}'::jsonb), max(h.source_inserted_at), now()
+FROM hours h
+LEFT JOIN countries c ON c.day = h.day
+GROUP BY h.day, c.countries
+ON CONFLICT (granularity, bucket) DO UPDATE SET
+    samples = EXCLUDED.samples,
+    alt_sum = EXCLUDED.alt_sum,
+    alt_min = EXCLUDED.alt_min,
+    alt_max = EXCLUDED.alt_max,
+    velocity_sum = EXCLUDED.velocity_sum,
+    velocity_min = EXCLUDED.velocity_min,
+    velocity_max = EXCLUDED.velocity_max,
+    countries = EXCLUDED.countries,
+    source_inserted_at = EXCLUDED.source_inserted_at,
+    updated_at = EXCLUDED.updated_at
+""")
+
+
+class ISSRollupRepository(BaseRepository[ISSRollup]):
+    """
+    Repository for hourly/daily ISS rollups.
+
+    Refreshes are idempotent upserts of whole buckets, so re-processing
+    rows (e.g. the overlap before the watermark) is harmless.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ISSRollup)
+
+    async def get_watermark(self) -> Optional[datetime]:
+        """Latest raw inserted_at already included in the hourly rollups."""
+        result = await self.session.execute(
+            select(func.max(ISSRollup.source_inserted_at)).where(ISSRollup.granularity == "hour")
+        )
+        return result.scalar()
+
+    async def refresh(self, since: datetime) -> int:
+        """
+        Recompute rollups for raw rows inserted after since.
+
+        Returns the number of hourly buckets refreshed.
+        """
+        result = await self.session.execute(_REFRESH_HOURLY, {"since": since})
+        hours = [row.bucket for row in result.all()]
+        if hours:
+            await self.session.execute(_REFRESH_DAILY, {"hours": hours})
+        await self.session.commit()
+        return len(hours)
+
+    async def get_rollups(self, granularity: str, since: datetime) -> List[ISSRollup]:
+        """Rollups of one granularity from a bucket start on, oldest first."""
+        result = await self.session.execute(
+            select(ISSRollup)
+            .where(ISSRollup.granularity == granularity, ISSRollup.bucket >= since)
+            .order_by(ISSRollup.bucket)
+        )
+        return list(result.scalars().all())
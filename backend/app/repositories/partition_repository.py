@@ -0,0 +1,100 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Tables range-partitioned by day (migration 005) and their partition key
+PARTITIONED_TABLES: Dict[str, str] = {
+    "iss_fetch_log": "timestamp",
+    "telemetry_legacy": "recorded_at",
+}
+
+
+def partition_name(table: str, day: date) -> str:
+    """Name of a table's partition for one UTC day, e.g. iss_fetch_log_p20261017."""
+    return f"{table}_p{day:%Y%m%d}"
+
+
+def default_partition_name(table: str) -> str:
+    """Name of a table's DEFAULT partition, catching rows of days without one."""
+    return f"{table}_default"
+
+
+def partition_day(table: str, name: str) -> Optional[date]:
+    """Day of a partition named by partition_name, None for other partitions."""
+    prefix = f"{table}_p"
+    if not name.startswith(prefix):
+        return None
+    try:
+        return datetime.strptime(name[len(prefix):], "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+class PartitionRepository:
+    """
+    Daily range partitions of the time-partitioned tables.
+
+    Partitions cover one UTC day each. Creating partitions ahead of time
+    and dropping whole expired ones keeps retention a catalog operation,
+    independent of the number of rows. Table names only ever come from
+    PARTITIONED_TABLES.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_partitions(self, table: str) -> List[Tuple[str, date]]:
+        """(name, day) of the daily partitions of a table, oldest first."""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table"
+            ),
+            {"table": table}
+        )
+        partitions = []
+        for (name,) in result.all():
+            day = partition_day(table, name)
+            if day is not None:
+                partitions.append((name, day))
+        return sorted(partitions, key=lambda p: p[1])
+
+    async def default_days(self, table: str) -> List[date]:
+        """UTC days of the rows that landed in a table's DEFAULT partition."""
+        column = PARTITIONED_TABLES[table]
+        result = await self.session.execute(text(
+            f"SELECT DISTINCT (\"{column}\" AT TIME ZONE 'UTC')::date AS day "
+            f"FROM {default_partition_name(table)} ORDER BY day"
+        ))
+        return [day for (day,) in result.all()]
+
+    async def create_partition(self, table: str, day: date, from_default: bool = False) -> None:
+        """
+        Create the partition of a table for one UTC day (if missing).
+
+        Postgres refuses to create a partition while the DEFAULT partition
+        holds rows for its range, so with from_default the DEFAULT partition
+        is detached for the move and its rows of that day are copied into
+        the new partition.
+        """
+        start = f"{day.isoformat()} 00:00:00+00"
+        end = f"{(day + timedelta(days=1)).isoformat()} 00:00:00+00"
+        default = default_partition_name(table)
+        if from_default:
+            await self.session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+        await self.session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table, day)} "
+            f"PARTITION OF {table} FOR VALUES FROM ('{start}') TO ('{end}')"
+        ))
+        if from_default:
+            column = PARTITIONED_TABLES[table]
+            in_day = f"\"{column}\" >= '{start}' AND \"{column}\" < '{end}'"
+            await self.session.execute(text(f"INSERT INTO {table} SELECT * FROM {default} WHERE {in_day}"))
+            await self.session.execute(text(f"DELETE FROM {default} WHERE {in_day}"))
+            await self.session.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+
+    async def drop_partition(self, name: str) -> None:
+        await self.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
@@ -1,11 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update, insert, cast, bindparam, func, LargeBinary
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from app.core.exceptions import UpstreamError
 from app.models.space_cache import SpaceCache
 from app.repositories.base import BaseRepository
 
+# invalid_text_representation (bad JSON) and character_not_in_repertoire (bad UTF-8)
+_INVALID_PAYLOAD_SQLSTATES = {"22P02", "22021"}
+
 
 class SpaceCacheRepository(BaseRepository[SpaceCache]):
     """
@@ -60,6 +66,56 @@ class SpaceCacheRepository(BaseRepository[SpaceCache]):
         await self.session.refresh(cache)
         return cache
 
+    async def cache_raw(self, source: str, raw: bytes) -> None:
+        """
+        Store an already-encoded JSON body in cache.
+
+        The bytes are sent as bytea and converted to JSONB by Postgres, so
+        large payloads are never decoded into Python objects or strings.
+
+        Raises:
+            UpstreamError: If Postgres rejects the body as JSON (502)
+        """
+        payload = cast(func.convert_from(bindparam("raw_payload", raw, type_=LargeBinary), "UTF8"), JSONB)
+        try:
+            await self.session.execute(
+                insert(SpaceCache).values(
+                    source=source,
+                    fetched_at=datetime.now(timezone.utc),
+                    payload=payload
+                )
+            )
+        except DBAPIError as e:
+            # asyncpg errors surface as a generic DBAPIError; the SQLSTATE
+            # tells a malformed body apart from a DB failure
+            await self.session.rollback()
+            if getattr(e.orig, "sqlstate", None) in _INVALID_PAYLOAD_SQLSTATES:
+                raise UpstreamError(502, f"Upstream {source} body is not valid JSON: {e.orig}")
+            raise
+        await self.session.commit()
+
+    async def touch_latest(self, source: str) -> bool:
+        """
+        Bump fetched_at of the latest entry without rewriting its payload.
+
+        Used when the upstream confirms (304) that data is unchanged.
+        Returns False if there is no entry to touch.
+        """
+        latest_id = (
+            select(SpaceCache.id)
+            .where(SpaceCache.source == source)
+            .order_by(SpaceCache.fetched_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            update(SpaceCache)
+            .where(SpaceCache.id == latest_id)
+            .values(fetched_at=datetime.now(timezone.utc))
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
     async def cleanup_old_cache(
         self,
         source: str,
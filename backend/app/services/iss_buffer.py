@@ -0,0 +1,272 @@
+import asyncio
+import logging
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.clients import json_codec
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# (timestamp, lat, lon, alt_km, velocity_kmh, visibility, country_code, timezone_id)
+PositionRow = Tuple[datetime, float, float, float, float, Optional[str], Optional[str], Optional[str]]
+
+
+# Below this many points per bucket, array calls cost more than they save
+LTTB_VECTOR_BUCKET_SIZE = 32
+
+
+def lttb(x: Sequence[float], y: Sequence[float], threshold: int) -> "np.ndarray":
+    """
+    Largest-Triangle-Three-Buckets: indexes of threshold points keeping the shape.
+
+    First and last points are always kept. The rest are split into
+    threshold - 2 equal buckets; from each the point forming the largest
+    triangle with the previously kept point and the average of the next
+    bucket is kept. Bucket averages come from one cumulative sum and each
+    bucket's triangle areas are computed as one array operation (for
+    buckets of at least LTTB_VECTOR_BUCKET_SIZE points); only the walk
+    from bucket to bucket (each depends on the previous pick) is a loop.
+    threshold must be at least 3.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Bucket i spans edges[i]:edges[i + 1]; the last edge closes the final point
+    every = (n - 2) / (threshold - 2)
+    edges = np.minimum((np.arange(threshold) * every).astype(np.int64) + 1, n)
+    sum_x = np.concatenate(([0.0], np.cumsum(x)))
+    sum_y = np.concatenate(([0.0], np.cumsum(y)))
+    next_start, next_end = edges[1:-1], edges[2:]
+    avg_x = (sum_x[next_end] - sum_x[next_start]) / (next_end - next_start)
+    avg_y = (sum_y[next_end] - sum_y[next_start]) / (next_end - next_start)
+
+    # Twice the triangle area, expanded to |p * y + q * x - c| per bucket
+    vectorized = every >= LTTB_VECTOR_BUCKET_SIZE
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    xs, ys = x.tolist(), y.tolist()
+    ax, ay = xs[0], ys[0]
+    buckets = zip(edges[:-2].tolist(), edges[1:-1].tolist(), avg_x.tolist(), avg_y.tolist())
+    for i, (start, end, bx, by) in enumerate(buckets, start=1):
+        p, q = ax - bx, by - ay
+        c = p * ay + q * ax
+        if vectorized:
+            a = start + int(np.abs(y[start:end] * p + x[start:end] * q - c).argmax())
+        else:
+            a, best = start, -1.0
+            for j in range(start, end):
+                area = abs(ys[j] * p + xs[j] * q - c)
+                if area > best:
+                    a, best = j, area
+        kept[i] = a
+        ax, ay = xs[a], ys[a]
+    return kept
+
+
+def buffer_capacity() -> int:
+    """Positions in the retention window at poll cadence, plus headroom."""
+    per_day = 86400 / settings.iss_poll_interval_seconds
+    return int(settings.iss_retention_days * per_day * 1.1) + 1
+
+
+class PositionBuffer:
+    """
+    In-process ring buffer of recent ISS positions, stored column-wise.
+
+    Numeric columns are array('d'); each row also keeps its API
+    representation already encoded as JSON, so /trend is a binary search
+    on the timestamp column plus a join of pre-serialized rows. Rows are
+    appended in timestamp order (the collector appends every poll); a
+    notification for new rows triggers one incremental DB read, a
+    backfill (rows in the past) a full rebuild.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ts = array("d", [0.0]) * capacity
+        self._lat = array("d", [0.0]) * capacity
+        self._lon = array("d", [0.0]) * capacity
+        self._alt = array("d", [0.0]) * capacity
+        self._vel = array("d", [0.0]) * capacity
+        self._text: List[Tuple[Optional[str], Optional[str], Optional[str]]] = [(None, None, None)] * capacity
+        self._encoded: List[bytes] = [b""] * capacity
+        self._start = 0
+        self.size = 0
+        self.loaded = False
+        self._stale = False
+        self._rebuild_requested = False
+        self._synced_at = 0.0
+        self._lock = asyncio.Lock()
+        self.rebuilds = 0
+        self.syncs = 0
+
+    def _index(self, logical: int) -> int:
+        return (self._start + logical) % self.capacity
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self._ts[self._index(self.size - 1)] if self.size else None
+
+    def clear(self) -> None:
+        self._start = 0
+        self.size = 0
+
+    def append(self, row: PositionRow) -> bool:
+        """Append a position newer than the last one; returns False otherwise."""
+        timestamp, lat, lon, alt_km, velocity_kmh, visibility, country_code, timezone_id = row
+        ts = timestamp.timestamp()
+        if self.size and ts <= self.last_timestamp:
+            return False
+        if self.size < self.capacity:
+            index = self._index(self.size)
+            self.size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        self._ts[index] = ts
+        self._lat[index] = lat
+        self._lon[index] = lon
+        self._alt[index] = alt_km
+        self._vel[index] = velocity_kmh
+        self._text[index] = (visibility, country_code, timezone_id)
+        self._encoded[index] = json_codec.dumps(self._format(index))
+        return True
+
+    def extend(self, rows: Sequence[PositionRow]) -> int:
+        return sum(1 for row in rows if self.append(row))
+
+    def _format(self, index: int) -> Dict[str, Any]:
+        """Same shape as ISSService._format_position."""
+        visibility, country_code, timezone_id = self._text[index]
+        return {
+            "latitude": self._lat[index],
+            "longitude": self._lon[index],
+            "altitude_km": self._alt[index],
+            "velocity_kmh": self._vel[index],
+            "visibility": visibility,
+            "timestamp": datetime.fromtimestamp(self._ts[index], tz=timezone.utc).isoformat(),
+            "country_code": country_code,
+            "timezone_id": timezone_id,
+        }
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        return self._format(self._index(self.size - 1)) if self.size else None
+
+    def _first_at_or_after(self, ts: float) -> int:
+        """Logical index of the first position at or after ts (binary search)."""
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ts[self._index(mid)] < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def trend_json(self, since: datetime, limit: int) -> Tuple[bytes, int]:
+        """Encoded JSON array of up to limit positions since a time, newest first."""
+        first = max(self._first_at_or_after(since.timestamp()), self.size - limit)
+        rows = [self._encoded[self._index(i)] for i in range(self.size - 1, first - 1, -1)]
+        return b"[" + b",".join(rows) + b"]", len(rows)
+
+    def downsample_json(self, since: datetime, points: int) -> Tuple[bytes, int, int]:
+        """
+        The whole window since a time reduced to at most points positions (LTTB).
+
+        The ground track is treated as a line in the (longitude, latitude)
+        plane with longitude unwrapped across the antimeridian, so the
+        kept points follow the shape of the track on a map. Returns the
+        encoded JSON array (newest first), its length and the number of
+        positions in the window.
+        """
+        first = self._first_at_or_after(since.timestamp())
+        count = self.size - first
+        if count <= 0:
+            return b"[]", 0, 0
+        indexes = (self._start + first + np.arange(count)) % self.capacity
+        lat = np.frombuffer(self._lat, dtype=np.float64)[indexes]
+        lon = np.frombuffer(self._lon, dtype=np.float64)[indexes]
+        # Unwrap: shift by 360 degrees after every jump across the antimeridian
+        jumps = np.diff(lon)
+        lon[1:] += 360.0 * np.cumsum((jumps < -180.0).astype(np.float64) - (jumps > 180.0))
+
+        kept = indexes[lttb(lon, lat, points)[::-1]]
+        rows = [self._encoded[i] for i in kept.tolist()]
+        return b"[" + b",".join(rows) + b"]", len(rows), count
+
+    def on_data_update(self, source: str) -> None:
+        """data_update_listener subscriber."""
+        if source == "iss":
+            self._stale = True
+        elif source == "iss_backfill":
+            self._rebuild_requested = True
+
+    async def ensure_current(self, repository: Any) -> None:
+        """
+        Bring the buffer up to date with the DB when needed.
+
+        Full load on first use or after a backfill; otherwise an
+        incremental read of newer rows when notified or once per poll
+        interval (in case a notification was missed). Requests between
+        those never touch the DB.
+        """
+        if self.loaded and not self._stale and not self._rebuild_requested \
+                and time.monotonic() - self._synced_at < settings.iss_poll_interval_seconds:
+            return
+        async with self._lock:
+            rebuild = not self.loaded or self._rebuild_requested
+            if not rebuild and not self._stale \
+                    and time.monotonic() - self._synced_at < settings.iss_poll_interval_seconds:
+                return
+            # Cleared before reading: a notification arriving during the
+            # read marks the buffer stale again instead of being lost
+            self._rebuild_requested = False
+            self._stale = False
+            self._synced_at = time.monotonic()
+            try:
+                if rebuild:
+                    since = datetime.now(timezone.utc) - timedelta(days=settings.iss_retention_days)
+                    rows = await repository.get_buffer_rows(since)
+                    self.clear()
+                    self.extend(rows)
+                    self.loaded = True
+                    self.rebuilds += 1
+                    logger.info(f"ISS position buffer rebuilt with {self.size} positions")
+                else:
+                    last = self.last_timestamp
+                    since = (
+                        datetime.fromtimestamp(last, tz=timezone.utc) if last is not None
+                        else datetime.now(timezone.utc) - timedelta(days=settings.iss_retention_days)
+                    )
+                    self.extend(await repository.get_buffer_rows(since))
+                    self.syncs += 1
+            except BaseException:
+                # Retry on the next request
+                self._rebuild_requested = self._rebuild_requested or rebuild
+                self._stale = True
+                raise
+
+    def stats(self) -> Dict[str, Any]:
+        last = self.last_timestamp
+        return {
+            "loaded": self.loaded,
+            "size": self.size,
+            "capacity": self.capacity,
+            "latest": datetime.fromtimestamp(last, tz=timezone.utc).isoformat() if last else None,
+            "rebuilds": self.rebuilds,
+            "syncs": self.syncs,
+        }
+
+
+# Global buffer instance
+iss_position_buffer = PositionBuffer(buffer_capacity())
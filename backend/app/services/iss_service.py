@@ -1,74 +1,89 @@
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Optional
+import csv
+import io
 import logging
 
+from app.clients.rate_limit import on_demand_priority
 from app.repositories.iss_repository import ISSRepository
+from app.services.iss_buffer import iss_position_buffer
+from app.services.orbit_service import OrbitService
 from app.core.config import get_settings
+from app.core.database import async_session_factory
 from app.core.exceptions import NoDataError
 from app.models.iss import ISSFetchLog
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+CSV_COLUMNS = ["timestamp", "latitude", "longitude", "altitude_km", "velocity_kmh", "visibility", "country_code"]
+# Rows fetched from the cursor and written to the response at a time
+EXPORT_CHUNK_ROWS = 1000
+
 
 class ISSService:
     """
     Service for ISS position business logic.
 
     Key requirement: ISS data must be fresher than 10 minutes,
-    otherwise NO_DATA error is returned.
+    otherwise NO_DATA error is returned. With a current TLE the latest
+    position is propagated for "now" instead of read from stored polls.
+    Recent polls are served from the in-memory iss_position_buffer.
     """
 
-    def __init__(self, repository: ISSRepository):
+    def __init__(self, repository: ISSRepository, orbit: Optional[OrbitService] = None):
         self.repository = repository
+        self.orbit = orbit
 
     async def get_latest_position(self) -> Dict[str, Any]:
         """
         Get the latest ISS position.
 
-        If data is stale (> 10 mins) or missing, triggers immediate refresh.
+        Served from SGP4 propagation when a current TLE is loaded and the
+        last drift check passed. Otherwise falls back to stored polls:
+        if those are stale (> 10 mins) or missing, triggers immediate refresh.
         Raises NoDataError if data is still unavailable/stale after refresh attempt.
         """
         # Import here to avoid potential circular imports with scheduler/collector setup
         from app.collectors.iss_collector import collect_iss_position
+        from app.collectors.telemetry import job_telemetry
 
-        latest = await self.repository.get_latest()
-        
-        freshness_cutoff = datetime.now(timezone.utc) - timedelta(
-            minutes=settings.iss_freshness_minutes
-        )
+        if self.orbit is not None and settings.iss_propagation_enabled:
+            predicted = await self.orbit.current_position()
+            if predicted is not None:
+                return predicted
 
-        is_stale = False
-        if latest is None:
-            is_stale = True
-        elif latest.timestamp.replace(tzinfo=timezone.utc) < freshness_cutoff:
-            is_stale = True
+        await iss_position_buffer.ensure_current(self.repository)
+
+        freshness_cutoff = (
+            datetime.now(timezone.utc) - timedelta(minutes=settings.iss_freshness_minutes)
+        ).timestamp()
 
-        if is_stale:
+        last = iss_position_buffer.last_timestamp
+        if last is None or last < freshness_cutoff:
             logger.warning("ISS data is stale or missing. Triggering on-demand refresh.")
             try:
-                # Trigger collection (uses its own DB session)
-                await collect_iss_position()
-                
-                # Re-query DB (assumes transaction isolation allows reading committed data)
-                # In some cases we might need to refresh/expire current session, 
-                # but usually a new query fetches fresh data.
-                latest = await self.repository.get_latest()
+                # Trigger collection (uses its own DB session and appends to the buffer)
+                with on_demand_priority():
+                    async with job_telemetry.track("iss_collector", trigger="on_demand"):
+                        await collect_iss_position()
+                await iss_position_buffer.ensure_current(self.repository)
             except Exception as e:
                 logger.error(f"On-demand refresh failed: {e}")
                 # We will fall through to check 'latest' again, if it's still stale we raise error.
 
+        latest = iss_position_buffer.latest()
         if latest is None:
              raise NoDataError("No ISS position data available")
 
         # Check freshness again
-        if latest.timestamp.replace(tzinfo=timezone.utc) < freshness_cutoff:
+        if iss_position_buffer.last_timestamp < freshness_cutoff:
             raise NoDataError(
-                f"ISS data is stale (last update: {latest.timestamp.isoformat()}). "
+                f"ISS data is stale (last update: {latest['timestamp']}). "
                 f"Data must be fresher than {settings.iss_freshness_minutes} minutes."
             )
 
-        return self._format_position(latest)
+        return {**latest, "source": "poll"}
 
     async def get_trend(
         self,
@@ -90,6 +105,58 @@ class ISSService:
             "hours": hours
         }
 
+    async def get_trend_json(
+        self,
+        hours: int = 24,
+        limit: int = 100,
+        points: Optional[int] = None
+    ) -> bytes:
+        """
+        get_trend's data, already encoded as JSON, served from the in-memory buffer.
+
+        Binary search for the window start plus a join of pre-serialized
+        positions; the DB is only read when the buffer needs syncing.
+        With points, the whole window is downsampled (LTTB) instead of
+        returning the newest limit positions.
+        """
+        await iss_position_buffer.ensure_current(self.repository)
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        if points is None:
+            positions, count = iss_position_buffer.trend_json(since, limit)
+            extra = b""
+        else:
+            positions, count, total = iss_position_buffer.downsample_json(since, points)
+            extra = b',"points":' + str(points).encode() + b',"total":' + str(total).encode()
+        return (
+            b'{"positions":' + positions
+            + b',"count":' + str(count).encode()
+            + b',"hours":' + str(hours).encode() + extra + b'}'
+        )
+
+    async def export_csv(self, hours: int = 24) -> AsyncIterator[bytes]:
+        """
+        ISS position history as CSV, encoded chunk by chunk, newest first.
+
+        Reads through a server-side cursor on its own session (the
+        response is still streaming after the request's session is
+        released), so memory stays flat and there is no row cap.
+        """
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(CSV_COLUMNS)
+        yield output.getvalue().encode()
+
+        async with async_session_factory() as session:
+            async for rows in ISSRepository(session).stream_positions(since, EXPORT_CHUNK_ROWS):
+                output.seek(0)
+                output.truncate()
+                writer.writerows(
+                    (timestamp.isoformat(), lat, lon, alt_km, velocity_kmh, visibility, country_code)
+                    for timestamp, lat, lon, alt_km, velocity_kmh, visibility, country_code in rows
+                )
+                yield output.getvalue().encode()
+
     def _format_position(self, record: ISSFetchLog) -> Dict[str, Any]:
         """Format ISS position record for API response."""
         raw = record.raw or {}
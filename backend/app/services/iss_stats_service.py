@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List
+
+from app.core.exceptions import ValidationError
+from app.models.iss_rollup import ISSRollup
+from app.repositories.iss_rollup_repository import ISSRollupRepository
+
+# Hourly buckets are served for shorter ranges than daily ones
+MAX_DAYS = {"hour": 31, "day": 366}
+
+
+def _range(total: float, low: float, high: float, samples: int) -> Dict[str, float]:
+    return {"min": round(low, 3), "avg": round(total / samples, 3), "max": round(high, 3)}
+
+
+def summarize(rollups: List[ISSRollup]) -> Dict[str, Any]:
+    """Combine rollups (exactly, from sums/min/max/counts) into one summary."""
+    samples = sum(r.samples for r in rollups)
+    if not samples:
+        return {"samples": 0, "altitude_km": None, "velocity_kmh": None, "countries": {}}
+    countries: Dict[str, int] = {}
+    for r in rollups:
+        for code, count in r.countries.items():
+            countries[code] = countries.get(code, 0) + count
+    return {
+        "samples": samples,
+        "altitude_km": _range(
+            sum(r.alt_sum for r in rollups),
+            min(r.alt_min for r in rollups),
+            max(r.alt_max for r in rollups),
+            samples
+        ),
+        "velocity_kmh": _range(
+            sum(r.velocity_sum for r in rollups),
+            min(r.velocity_min for r in rollups),
+            max(r.velocity_max for r in rollups),
+            samples
+        ),
+        "countries": dict(sorted(countries.items(), key=lambda item: -item[1])),
+    }
+
+
+def _format_rollup(rollup: ISSRollup) -> Dict[str, Any]:
+    return {
+        "bucket": rollup.bucket.isoformat(),
+        "samples": rollup.samples,
+        "altitude_km": _range(rollup.alt_sum, rollup.alt_min, rollup.alt_max, rollup.samples),
+        "velocity_kmh": _range(rollup.velocity_sum, rollup.velocity_min, rollup.velocity_max, rollup.samples),
+        "countries": rollup.countries,
+    }
+
+
+class ISSStatsService:
+    """
+    ISS statistics over long ranges, read from the hourly/daily rollups.
+
+    Never scans iss_fetch_log, and keeps working for ranges whose raw
+    positions have already been dropped by retention.
+    """
+
+    def __init__(self, repository: ISSRollupRepository):
+        self.repository = repository
+
+    async def get_stats(self, granularity: str = "day", days: int = 7) -> Dict[str, Any]:
+        """Per-bucket statistics for the last days plus a summary of the range."""
+        if days > MAX_DAYS[granularity]:
+            raise ValidationError(f"At most {MAX_DAYS[granularity]} days of {granularity} buckets")
+
+        now = datetime.now(timezone.utc)
+        if granularity == "day":
+            since = datetime.combine(now.date(), datetime.min.time(), tzinfo=timezone.utc) - timedelta(days=days - 1)
+        else:
+            since = now.replace(minute=0, second=0, microsecond=0) - timedelta(days=days) + timedelta(hours=1)
+        rollups = await self.repository.get_rollups(granularity, since)
+
+        return {
+            "granularity": granularity,
+            "days": days,
+            "from": since.isoformat(),
+            "summary": summarize(rollups),
+            "buckets": [_format_rollup(r) for r in rollups],
+            "count": len(rollups),
+        }
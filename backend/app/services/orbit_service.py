@@ -0,0 +1,171 @@
+import logging
+import math
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+from app.core.config import get_settings
+from app.core.exceptions import NoDataError
+from app.geo.geocoder import reverse_geocoder
+from app.orbit.engine import orbit_engine
+from app.orbit.groundtrack import ground_track, groundtrack_cache
+from app.orbit.passes import Observer, pass_cache, predict_passes, visibility_at
+from app.orbit.tle import TLE_SOURCE, parse_tle
+from app.repositories.space_cache_repository import SpaceCacheRepository
+from app.services.iss_buffer import iss_position_buffer
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class OrbitService:
+    """
+    Keeps the process-wide orbit engine on the latest stored ISS TLE.
+
+    The TLE collector stores element sets in space_cache (source
+    "iss_tle"), so API processes pick them up whether the collector ran
+    locally or in the worker. The DB is only read when a notification
+    arrived or iss_tle_check_seconds have passed.
+    """
+
+    def __init__(self, repository: SpaceCacheRepository):
+        self.repository = repository
+
+    async def ensure_loaded(self) -> bool:
+        """Reload the TLE if due; returns whether the engine can serve now."""
+        if orbit_engine.needs_reload():
+            try:
+                cached = await self.repository.get_latest_by_source(TLE_SOURCE)
+                if cached is not None:
+                    payload = cached.payload
+                    orbit_engine.load(parse_tle(payload["line1"], payload["line2"], payload["name"]))
+                else:
+                    orbit_engine.checked_at = datetime.now(timezone.utc)
+            except Exception as e:
+                logger.warning(f"Could not load ISS TLE: {e}")
+        return orbit_engine.is_current()
+
+    async def current_position(self) -> Optional[Dict[str, Any]]:
+        """
+        Propagated ISS position for now, or None if the engine cannot serve.
+
+        Without the offline geocoder, country_code and timezone_id are those
+        of the latest stored poll (at most a few minutes old).
+        """
+        if not await self.ensure_loaded():
+            return None
+        now = datetime.now(timezone.utc)
+        position = orbit_engine.position_at(now)
+        if reverse_geocoder.loaded:
+            location = reverse_geocoder.lookup(position["latitude"], position["longitude"])
+        else:
+            latest = iss_position_buffer.latest() or {}
+            location = {
+                "country_code": latest.get("country_code"),
+                "timezone_id": latest.get("timezone_id"),
+            }
+        return {
+            **position,
+            "visibility": visibility_at(orbit_engine, now),
+            "timestamp": now.isoformat(),
+            **location,
+            "source": "sgp4",
+            "tle_epoch": orbit_engine.tle.epoch.isoformat(),
+        }
+
+    async def get_groundtrack(self, orbits: int, step_seconds: int) -> Dict[str, Any]:
+        """
+        Predicted ground track for the next orbits, split at the antimeridian.
+
+        The window starts at "now" floored to iss_groundtrack_window_seconds
+        and is extended by one window, so every request inside a window
+        shares one cached computation (per TLE epoch and resolution) that
+        still covers the requested number of orbits from now.
+        """
+        if not await self.ensure_loaded():
+            raise NoDataError("No current ISS TLE available for prediction")
+
+        tle = orbit_engine.tle
+        window = settings.iss_groundtrack_window_seconds
+        now = datetime.now(timezone.utc).timestamp()
+        start = math.floor(now / window) * window
+        key = (tle.epoch, step_seconds, orbits, start)
+
+        cached = groundtrack_cache.get(key)
+        if cached is not None:
+            return cached
+
+        end = start + orbits * tle.period_seconds + window
+        segments = ground_track(orbit_engine, start, end, step_seconds)
+        data = {
+            "tle_epoch": tle.epoch.isoformat(),
+            "start": datetime.fromtimestamp(start, tz=timezone.utc).isoformat(),
+            "end": datetime.fromtimestamp(end, tz=timezone.utc).isoformat(),
+            "valid_until": datetime.fromtimestamp(start + window, tz=timezone.utc).isoformat(),
+            "orbits": orbits,
+            "step_seconds": step_seconds,
+            "period_minutes": round(tle.period_seconds / 60, 2),
+            "track": {"type": "MultiLineString", "coordinates": segments},
+        }
+        groundtrack_cache.put(key, data)
+        return data
+
+    async def get_passes(
+        self,
+        latitude: float,
+        longitude: float,
+        elevation_m: float = 0.0,
+        days: int = 3,
+        min_elevation: float = 10.0,
+        visible_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Upcoming ISS passes over an observer.
+
+        The location is quantized to iss_pass_location_precision_deg
+        (and elevation to 100 m) and the search window starts at "now"
+        floored to iss_pass_window_seconds, so nearby users within one
+        window share a single cached prediction per TLE epoch. Passes that
+        have already set are filtered out when serving from the cache.
+        """
+        if not await self.ensure_loaded():
+            raise NoDataError("No current ISS TLE available for prediction")
+
+        precision = settings.iss_pass_location_precision_deg
+        lat = round(round(latitude / precision) * precision, 6)
+        lon = round(round(longitude / precision) * precision, 6)
+        elevation_m = round(elevation_m, -2)
+        window = settings.iss_pass_window_seconds
+        now = datetime.now(timezone.utc).timestamp()
+        start = math.floor(now / window) * window
+        key = (orbit_engine.tle.epoch, lat, lon, elevation_m, days, min_elevation, start)
+
+        predicted = pass_cache.get(key)
+        if predicted is None:
+            passes = predict_passes(
+                orbit_engine,
+                Observer(lat, lon, elevation_m),
+                start,
+                start + days * 86400 + window,
+                min_elevation=min_elevation
+            )
+            predicted = [
+                (datetime.fromisoformat(p["rise"]["time"]).timestamp(),
+                 datetime.fromisoformat(p["set"]["time"]).timestamp(),
+                 p)
+                for p in passes
+            ]
+            pass_cache.put(key, predicted)
+
+        horizon = now + days * 86400
+        passes = [
+            p for rise, set_, p in predicted
+            if set_ >= now and rise <= horizon and (p["visible"] or not visible_only)
+        ]
+        return {
+            "observer": {"latitude": lat, "longitude": lon, "elevation_m": elevation_m},
+            "tle_epoch": orbit_engine.tle.epoch.isoformat(),
+            "days": days,
+            "min_elevation": min_elevation,
+            "passes": passes,
+            "count": len(passes),
+        }
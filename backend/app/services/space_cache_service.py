@@ -1,6 +1,9 @@
 import logging
 from typing import Dict, Any, Set, Callable, Awaitable, Optional
 
+from app.clients.rate_limit import on_demand_priority
+from app.collectors.scheduler import JOB_IDS
+from app.collectors.telemetry import job_telemetry
 from app.repositories.space_cache_repository import SpaceCacheRepository
 from app.core.config import get_settings
 from app.core.exceptions import NoDataError
@@ -128,14 +131,17 @@ class SpaceCacheService:
         """
         Trigger a collector for the specific source when cache is empty.
 
-        Returns None if success, otherwise the exception.
+        Runs as on-demand traffic, so it is shed first when the upstream
+        quota is low. Returns None if success, otherwise the exception.
         """
         collector = COLLECTORS.get(source)
         if collector is None:
             return Exception(f"No collector for source {source}")
 
         try:
-            await collector()
+            with on_demand_priority():
+                async with job_telemetry.track(JOB_IDS.get(source, source), trigger="on_demand"):
+                    await collector()
             return None
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.warning(
@@ -0,0 +1,34 @@
+# Local upstream stand-in (record/replay + fault injection)
+from typing import Dict
+from urllib.parse import urlsplit
+
+from app.core.config import Settings
+from app.standin.server import create_app, StandinSettings, FaultProfile
+
+_URL_SETTINGS = [
+    "iss_api_url",
+    "osdr_api_url",
+    "apod_api_url",
+    "neo_api_url",
+    "donki_flr_url",
+    "donki_cme_url",
+    "spacex_api_url",
+    "jwst_api_url",
+    "astronomy_api_url",
+    "astronomy_positions_api_url",
+]
+
+
+def standin_env(base_url: str = "http://127.0.0.1:8099") -> Dict[str, str]:
+    """
+    Environment overrides that point every upstream URL setting at the
+    stand-in, keeping each upstream's original path.
+    """
+    env = {}
+    for name in _URL_SETTINGS:
+        parsed = urlsplit(Settings.model_fields[name].default)
+        env[name.upper()] = f"{base_url.rstrip('/')}{parsed.path}"
+    return env
+
+
+__all__ = ["create_app", "standin_env", "StandinSettings", "FaultProfile"]
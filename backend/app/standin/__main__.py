@@ -0,0 +1,50 @@
+"""
+Local stand-in for the upstream APIs.
+
+Usage:
+    python -m app.standin serve [--port 8099]   # replay recorded fixtures
+    python -m app.standin record [fixture]      # re-record from real upstreams
+    python -m app.standin env [--port 8099]     # print *_API_URL overrides
+
+Fault defaults come from STANDIN_* variables (STANDIN_LATENCY_MS,
+STANDIN_ERROR_RATE, STANDIN_RATE_LIMIT_RATE, STANDIN_SLOW_BODY_MS, ...)
+and can be changed at runtime via POST /_standin/config.
+"""
+import argparse
+import logging
+
+from app.standin import create_app, standin_env
+from app.standin.record import record
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.standin")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="serve recorded fixtures")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8099)
+
+    rec = sub.add_parser("record", help="record fixtures from real upstreams")
+    rec.add_argument("fixture", nargs="?")
+
+    env = sub.add_parser("env", help="print settings pointing the API at the stand-in")
+    env.add_argument("--host", default="127.0.0.1")
+    env.add_argument("--port", type=int, default=8099)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "serve":
+        import uvicorn
+        uvicorn.run(create_app(), host=args.host, port=args.port)
+    elif args.command == "record":
+        for name, outcome in record(args.fixture).items():
+            print(f"{name}: {outcome}")
+    else:
+        for key, value in standin_env(f"http://{args.host}:{args.port}").items():
+            print(f"{key}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import logging
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import Settings, get_settings
+from app.standin.server import FIXTURES_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def _default(name: str) -> str:
+    """Real upstream URL, even when settings point at the stand-in."""
+    return Settings.model_fields[name].default
+
+
+def recording_targets() -> Dict[str, Tuple[str, Dict[str, str], Dict[str, str]]]:
+    """Fixture name -> (URL, query params, headers) on the real upstreams."""
+    settings = get_settings()
+    nasa = {"api_key": settings.nasa_api_key}
+    jwst_base = _default("jwst_api_url").rstrip("/")
+    jwst_headers = {"x-api-key": settings.jwst_api_key}
+    spacex_base = _default("spacex_api_url").rsplit("/", 1)[0]
+
+    return {
+        "iss_position": (_default("iss_api_url"), {}, {}),
+        "iss_tle": (f"{_default('iss_api_url')}/tles", {}, {}),
+        "iss_positions": (
+            f"{_default('iss_api_url')}/positions",
+            {"timestamps": "1364069476,1364069596", "units": "kilometers"},
+            {}
+        ),
+        "iss_coordinates": ("https://api.wheretheiss.at/v1/coordinates/50.11,118.07", {}, {}),
+        "osdr_datasets": (_default("osdr_api_url"), {"format": "json", "limit": "100"}, {}),
+        "apod": (_default("apod_api_url"), nasa, {}),
+        "neo_feed": (_default("neo_api_url"), nasa, {}),
+        "donki_flr": (_default("donki_flr_url"), nasa, {}),
+        "donki_cme": (_default("donki_cme_url"), nasa, {}),
+        "spacex_next": (f"{spacex_base}/next", {}, {}),
+        "spacex_latest": (f"{spacex_base}/latest", {}, {}),
+        "spacex_upcoming": (f"{spacex_base}/upcoming", {}, {}),
+        "jwst_all": (f"{jwst_base}/all", {"page": "1", "perPage": "20"}, jwst_headers),
+        "jwst_suffix": (f"{jwst_base}/suffix/jpg", {"page": "1", "perPage": "20"}, jwst_headers),
+        "jwst_programs": (f"{jwst_base}/program/list", {}, jwst_headers),
+    }
+
+
+def record(only: Optional[str] = None) -> Dict[str, str]:
+    """
+    Fetch every target from the real upstreams and overwrite its fixture.
+
+    Failures are reported and leave the existing fixture untouched.
+    Returns fixture name -> outcome.
+    """
+    results: Dict[str, str] = {}
+    with httpx.Client(timeout=30, follow_redirects=True) as client:
+        for name, (url, params, headers) in recording_targets().items():
+            if only and name != only:
+                continue
+            try:
+                response = client.get(url, params=params, headers=headers)
+                response.raise_for_status()
+                data = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                logger.warning(f"Recording {name} failed: {e}")
+                results[name] = f"error: {e}"
+                continue
+
+            (FIXTURES_DIR / f"{name}.json").write_text(json.dumps(data, indent=2) + "\n")
+            results[name] = "recorded"
+            logger.info(f"Recorded {name} from {url}")
+    return results
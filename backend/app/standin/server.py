@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass, field, asdict
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Pattern, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Every upstream path used by the API clients -> recorded fixture name
+ROUTES: List[Tuple[Pattern[str], str]] = [
+    (re.compile(r"^/v1/satellites/25544/?$"), "iss_position"),
+    (re.compile(r"^/v1/satellites/25544/tles$"), "iss_tle"),
+    (re.compile(r"^/v1/satellites/25544/positions$"), "iss_positions"),
+    (re.compile(r"^/v1/coordinates/[^/]+$"), "iss_coordinates"),
+    (re.compile(r"^/biodata/api/v2/datasets/?$"), "osdr_datasets"),
+    (re.compile(r"^/planetary/apod$"), "apod"),
+    (re.compile(r"^/neo/rest/v1/feed$"), "neo_feed"),
+    (re.compile(r"^/DONKI/FLR$"), "donki_flr"),
+    (re.compile(r"^/DONKI/CME$"), "donki_cme"),
+    (re.compile(r"^/v4/launches/next$"), "spacex_next"),
+    (re.compile(r"^/v4/launches/latest$"), "spacex_latest"),
+    (re.compile(r"^/v4/launches/upcoming$"), "spacex_upcoming"),
+    (re.compile(r"^/all$"), "jwst_all"),
+    (re.compile(r"^/suffix/[^/]+$"), "jwst_suffix"),
+    (re.compile(r"^/id/[^/]+$"), "jwst_id"),
+    (re.compile(r"^/program/list$"), "jwst_programs"),
+    (re.compile(r"^/api/v2/bodies/events$"), "astronomy_events"),
+    (re.compile(r"^/api/v2/bodies/positions$"), "astronomy_positions"),
+]
+
+
+class StandinSettings(BaseSettings):
+    """Default fault profile, loaded from STANDIN_* environment variables."""
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    rate_limit_per_hour: int = 1000
+    slow_body_ms: float = 0.0
+    etag: bool = True
+    seed: Optional[int] = None
+
+    model_config = SettingsConfigDict(env_prefix="STANDIN_", extra="ignore")
+
+
+@dataclass
+class FaultProfile:
+    """
+    Fault injection knobs applied to a response.
+
+    - latency_ms / latency_jitter_ms: delay before the status line
+    - error_rate: share of requests answered with 503
+    - rate_limit_rate: share of requests answered with 429
+    - slow_body_ms: delay between body chunks (trickled responses)
+    - etag: send ETag/Last-Modified and honour conditional requests
+    """
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    slow_body_ms: float = 0.0
+    etag: bool = True
+
+    def updated(self, changes: Dict[str, Any]) -> "FaultProfile":
+        values = asdict(self)
+        values.update({k: v for k, v in changes.items() if k in values})
+        return FaultProfile(**values)
+
+
+@dataclass
+class StandinState:
+    """Mutable server state: default faults, per-path overrides, counters."""
+
+    faults: FaultProfile
+    overrides: Dict[str, FaultProfile] = field(default_factory=dict)
+    rate_limit_per_hour: int = 1000
+    quota_used: int = 0
+    quota_window_started: float = field(default_factory=time.monotonic)
+    requests: Dict[str, int] = field(default_factory=dict)
+    responses: Dict[int, int] = field(default_factory=dict)
+
+    def faults_for(self, path: str) -> FaultProfile:
+        """Longest matching path-prefix override wins."""
+        matches = [prefix for prefix in self.overrides if path.startswith(prefix)]
+        if not matches:
+            return self.faults
+        return self.overrides[max(matches, key=len)]
+
+
+def load_fixture(name: str) -> bytes:
+    return (FIXTURES_DIR / f"{name}.json").read_bytes()
+
+
+def match_fixture(path: str) -> Optional[str]:
+    for pattern, name in ROUTES:
+        if pattern.match(path):
+            return name
+    return None
+
+
+def create_app(standin_settings: Optional[StandinSettings] = None) -> FastAPI:
+    """
+    Build the upstream stand-in ASGI app.
+
+    Serves recorded fixtures for every path used by the API clients, on a
+    single host, so all *_API_URL settings can point at it. Faults can be
+    changed at runtime through /_standin/config.
+    """
+    cfg = standin_settings or StandinSettings()
+    rng = random.Random(cfg.seed)
+    state = StandinState(
+        faults=FaultProfile(
+            latency_ms=cfg.latency_ms,
+            latency_jitter_ms=cfg.latency_jitter_ms,
+            error_rate=cfg.error_rate,
+            rate_limit_rate=cfg.rate_limit_rate,
+            slow_body_ms=cfg.slow_body_ms,
+            etag=cfg.etag,
+        ),
+        rate_limit_per_hour=cfg.rate_limit_per_hour,
+    )
+    fixtures: Dict[str, bytes] = {}
+
+    app = FastAPI(title="Upstream stand-in", docs_url=None, redoc_url=None)
+    app.state.standin = state
+
+    @app.get("/_standin/config")
+    async def get_config():
+        return {
+            "faults": asdict(state.faults),
+            "overrides": {prefix: asdict(p) for prefix, p in state.overrides.items()},
+            "rate_limit_per_hour": state.rate_limit_per_hour,
+        }
+
+    @app.post("/_standin/config")
+    async def set_config(request: Request):
+        """
+        Update faults. Body: {"faults": {...}, "overrides": {"/DONKI": {...}},
+        "rate_limit_per_hour": N, "reset": bool}
+        """
+        body = await request.json()
+        if body.get("reset"):
+            state.overrides.clear()
+            state.quota_used = 0
+            state.requests.clear()
+            state.responses.clear()
+        if "faults" in body:
+            state.faults = state.faults.updated(body["faults"])
+        for prefix, changes in (body.get("overrides") or {}).items():
+            if changes is None:
+                state.overrides.pop(prefix, None)
+            else:
+                state.overrides[prefix] = state.faults.updated(changes)
+        if "rate_limit_per_hour" in body:
+            state.rate_limit_per_hour = int(body["rate_limit_per_hour"])
+        return await get_config()
+
+    @app.get("/_standin/stats")
+    async def get_stats():
+        return {
+            "requests": state.requests,
+            "responses": {str(k): v for k, v in state.responses.items()},
+            "quota_used": state.quota_used,
+        }
+
+    def _respond(status_code: int, response: Response) -> Response:
+        state.responses[status_code] = state.responses.get(status_code, 0) + 1
+        return response
+
+    @app.api_route("/{path:path}", methods=["GET", "HEAD", "POST"])
+    async def serve(path: str, request: Request):
+        path = f"/{path}"
+        name = match_fixture(path)
+        if name is None:
+            return _respond(404, JSONResponse({"error": f"No fixture for {path}"}, 404))
+
+        state.requests[name] = state.requests.get(name, 0) + 1
+        faults = state.faults_for(path)
+
+        delay = faults.latency_ms + rng.uniform(0, faults.latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if time.monotonic() - state.quota_window_started >= 3600:
+            state.quota_window_started = time.monotonic()
+            state.quota_used = 0
+        state.quota_used += 1
+        remaining = max(state.rate_limit_per_hour - state.quota_used, 0)
+        quota_headers = {
+            "X-RateLimit-Limit": str(state.rate_limit_per_hour),
+            "X-RateLimit-Remaining": str(remaining),
+        }
+
+        if state.quota_used > state.rate_limit_per_hour or rng.random() < faults.rate_limit_rate:
+            return _respond(429, JSONResponse(
+                {"error": {"code": "OVER_RATE_LIMIT"}}, 429, headers=quota_headers
+            ))
+        if rng.random() < faults.error_rate:
+            return _respond(503, JSONResponse({"error": "Injected failure"}, 503))
+
+        if name not in fixtures:
+            fixtures[name] = load_fixture(name)
+        body = fixtures[name]
+
+        headers = dict(quota_headers)
+        if faults.etag:
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            headers["ETag"] = etag
+            headers["Last-Modified"] = formatdate(
+                (FIXTURES_DIR / f"{name}.json").stat().st_mtime, usegmt=True
+            )
+            if request.headers.get("If-None-Match") == etag:
+                return _respond(304, Response(status_code=304, headers=headers))
+
+        if request.method == "HEAD":
+            return _respond(200, Response(status_code=200, headers=headers))
+
+        if faults.slow_body_ms > 0:
+            async def trickle():
+                chunk_size = max(len(body) // 10, 1)
+                for start in range(0, len(body), chunk_size):
+                    await asyncio.sleep(faults.slow_body_ms / 1000)
+                    yield body[start:start + chunk_size]
+
+            return _respond(200, StreamingResponse(
+                trickle(), media_type="application/json", headers=headers
+            ))
+
+        return _respond(200, Response(body, media_type="application/json", headers=headers))
+
+    return app
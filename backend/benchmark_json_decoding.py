@@ -0,0 +1,83 @@
+"""
+Compare peak memory of the old and new upstream payload paths.
+
+before: response.json() -> Python objects -> json.dumps() by SQLAlchemy (JSONB bind)
+after:  raw bytes -> bytea bind parameter, convert_from(..., 'UTF8')::jsonb in Postgres
+
+Uses a synthetic NEO feed shaped like api.nasa.gov/neo/rest/v1/feed.
+Run: python benchmark_json_decoding.py [objects_per_day]
+"""
+import json
+import sys
+import tracemalloc
+
+from app.clients import json_codec
+
+
+def build_neo_feed(objects_per_day: int, days: int = 7) -> bytes:
+    near_earth_objects = {}
+    for day in range(days):
+        date = f"2025-01-{day + 1:02d}"
+        near_earth_objects[date] = [
+            {
+                "id": str(2000000 + day * objects_per_day + i),
+                "name": f"({2000 + i} XY{i})",
+                "absolute_magnitude_h": 20.1 + i / 100,
+                "estimated_diameter": {
+                    unit: {"estimated_diameter_min": 0.1 * i, "estimated_diameter_max": 0.2 * i}
+                    for unit in ("kilometers", "meters", "miles", "feet")
+                },
+                "is_potentially_hazardous_asteroid": i % 7 == 0,
+                "close_approach_data": [{
+                    "close_approach_date": date,
+                    "relative_velocity": {"kilometers_per_second": str(10.5 + i)},
+                    "miss_distance": {"kilometers": str(4500000.25 * (i + 1))},
+                    "orbiting_body": "Earth",
+                }],
+            }
+            for i in range(objects_per_day)
+        ]
+    feed = {"element_count": days * objects_per_day, "near_earth_objects": near_earth_objects}
+    return json.dumps(feed).encode()
+
+
+def measure(label: str, body: bytes, func) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} peak {peak / 1024:>10.1f} KiB")
+    return peak
+
+
+def before(body: bytes) -> None:
+    data = json.loads(body.decode())
+    json.dumps(data)
+
+
+def after_decoded(body: bytes) -> None:
+    json_codec.loads(body)
+
+
+def after_passthrough(body: bytes) -> None:
+    # The bytea bind hands the bytes to asyncpg as-is; its only copy is the
+    # one into the protocol write buffer
+    bytearray(body)
+
+
+def main() -> None:
+    objects_per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    body = build_neo_feed(objects_per_day)
+    print(f"NEO feed payload: {len(body) / 1024:.1f} KiB")
+
+    baseline = measure("before (json.loads + json.dumps)", body, before)
+    decoded = measure("after, decoded (json_codec.loads)", body, after_decoded)
+    passthrough = measure("after, raw pass-through", body, after_passthrough)
+
+    print(f"decoded path uses {decoded / baseline:.0%} of baseline peak")
+    print(f"pass-through uses {passthrough / baseline:.0%} of baseline peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,20 @@
 import pytest
 import asyncio
+import httpx
 from httpx import AsyncClient, ASGITransport
+from tenacity import wait_none
+from types import SimpleNamespace
 from typing import AsyncGenerator, Generator
 
 from app.main import app
+from app.clients.base_client import BaseAPIClient
+from app.clients.circuit_breaker import UpstreamGuard
+from app.clients.http_cache import ValidatorCache
+from app.clients.http_pool import HTTPClientRegistry
+from app.clients.latency import LatencyTracker
+from app.clients.metrics import UpstreamInstrumentation
+from app.clients.rate_limit import RateLimitGovernor
+from app.clients.retry_budget import RetryBudgetRegistry
 from app.core.database import get_session
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from app.core.config import get_settings
@@ -40,3 +51,39 @@ def override_get_db(mock_db_session):
     app.dependency_overrides[get_session] = _get_db
     yield
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def upstream(mocker):
+    """
+    Route every BaseAPIClient request to a test handler with fresh per-host state.
+
+    Call it with a request handler (or a ready httpx transport). It swaps in
+    a new pooled-client registry, circuit breakers, retry budgets, latency
+    tracker, instrumentation, rate-limit governor and validator cache, and
+    makes retries not wait. Returns those objects for assertions.
+    """
+    def install(handler):
+        transport = handler if isinstance(handler, httpx.AsyncBaseTransport) else httpx.MockTransport(handler)
+        state = SimpleNamespace(
+            registry=HTTPClientRegistry(transport=transport),
+            guard=UpstreamGuard(),
+            budgets=RetryBudgetRegistry(),
+            latency=LatencyTracker(),
+            metrics=UpstreamInstrumentation(),
+            governor=RateLimitGovernor(),
+            validators=ValidatorCache(),
+        )
+        mocker.patch("app.clients.base_client.http_client_registry", state.registry)
+        mocker.patch("app.clients.base_client.upstream_guard", state.guard)
+        mocker.patch("app.clients.base_client.retry_budgets", state.budgets)
+        mocker.patch("app.clients.retry_budget.retry_budgets", state.budgets)
+        mocker.patch("app.clients.base_client.latency_tracker", state.latency)
+        mocker.patch("app.clients.base_client.upstream_metrics", state.metrics)
+        mocker.patch("app.clients.base_client.rate_limit_governor", state.governor)
+        mocker.patch("app.clients.base_client.validator_cache", state.validators)
+        for method in (BaseAPIClient._get_response, BaseAPIClient.post):
+            mocker.patch.object(method.retry, "wait", wait_none())
+        return state
+
+    return install
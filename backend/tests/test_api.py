@@ -56,3 +56,99 @@ async def test_iss_api_endpoint(client, mocker):
         assert json_data["data"]["latitude"] == 10.0
     finally:
         app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoints(client):
+    """Upstream metrics are exposed as Prometheus text and as JSON."""
+    response = await client.get("/api/metrics")
+    assert response.status_code == 200
+    assert "upstream_request_duration_ms" in response.text
+
+    response = await client.get("/api/metrics/upstream")
+    assert response.json()["ok"] is True
+
+
+@pytest.mark.asyncio
+async def test_iss_stats_endpoint_reads_rollups(client, mocker):
+    """/iss/stats combines rollups exactly and validates the range."""
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+    from app.api.iss import get_iss_stats_service
+    from app.services.iss_stats_service import ISSStatsService
+
+    def rollup(day, samples, alt_sum, alt_min, alt_max, countries):
+        return SimpleNamespace(
+            bucket=datetime(2026, 10, day, tzinfo=timezone.utc), samples=samples,
+            alt_sum=alt_sum, alt_min=alt_min, alt_max=alt_max,
+            velocity_sum=27600.0 * samples, velocity_min=27500.0, velocity_max=27700.0,
+            countries=countries
+        )
+
+    repository = mocker.AsyncMock()
+    repository.get_rollups.return_value = [
+        rollup(15, 2, 840.0, 419.0, 421.0, {"US": 1}),
+        rollup(16, 3, 1263.0, 420.0, 422.0, {"US": 1, "BR": 2}),
+    ]
+    app.dependency_overrides[get_iss_stats_service] = lambda: ISSStatsService(repository)
+
+    try:
+        response = await client.get("/api/iss/stats", params={"granularity": "day", "days": 2})
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["count"] == 2
+        assert data["summary"]["samples"] == 5
+        assert data["summary"]["altitude_km"] == {"min": 419.0, "avg": 420.6, "max": 422.0}
+        assert data["summary"]["countries"] == {"US": 2, "BR": 2}
+        assert data["buckets"][1]["altitude_km"]["avg"] == 421.0
+        assert repository.get_rollups.call_args.args[0] == "day"
+
+        response = await client.get("/api/iss/stats", params={"granularity": "hour", "days": 60})
+        assert response.json()["ok"] is False
+        assert response.json()["error"]["code"] == ErrorCode.VALIDATION_ERROR.value
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_iss_csv_export_streams_every_chunk(client, mocker):
+    """The CSV export writes cursor chunks as they arrive, without a row cap."""
+    from contextlib import asynccontextmanager
+    from datetime import datetime, timedelta, timezone
+    from app.api.iss import get_iss_service
+    from app.services.iss_service import ISSService
+
+    base = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    chunks = [
+        [(base - timedelta(minutes=2 * (c * 3 + i)), 1.5, 2.5, 420.0, 27600.0, "daylight", "US")
+         for i in range(3)]
+        for c in range(4)
+    ]
+    chunks[-1][-1] = chunks[-1][-1][:5] + (None, None)
+
+    class FakeRepository:
+        def __init__(self, session):
+            pass
+
+        async def stream_positions(self, since, chunk_size):
+            for chunk in chunks:
+                yield chunk
+
+    @asynccontextmanager
+    async def fake_session_factory():
+        yield None
+
+    mocker.patch("app.services.iss_service.ISSRepository", FakeRepository)
+    mocker.patch("app.services.iss_service.async_session_factory", fake_session_factory)
+    app.dependency_overrides[get_iss_service] = lambda: ISSService(mocker.AsyncMock())
+
+    try:
+        response = await client.get("/api/iss/export/csv", params={"hours": 336})
+        assert response.status_code == 200
+        lines = response.text.strip().splitlines()
+        assert lines[0] == "timestamp,latitude,longitude,altitude_km,velocity_kmh,visibility,country_code"
+        assert len(lines) == 13
+        assert lines[1] == f"{base.isoformat()},1.5,2.5,420.0,27600.0,daylight,US"
+        assert lines[-1].endswith(",27600.0,,")
+    finally:
+        app.dependency_overrides.clear()
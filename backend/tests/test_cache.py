@@ -2,7 +2,10 @@ import pytest
 from datetime import datetime, timedelta, timezone
 from app.services.space_cache_service import SpaceCacheService
 from app.models.space_cache import SpaceCache
-from app.core.exceptions import NoDataError
+from app.core.exceptions import NoDataError, UpstreamError
+from app.repositories.space_cache_repository import SpaceCacheRepository
+from sqlalchemy.exc import DBAPIError
+from types import SimpleNamespace
 
 @pytest.mark.asyncio
 async def test_cache_hit_fresh(mocker):
@@ -87,3 +90,20 @@ async def test_no_data_error(mocker):
     
     with pytest.raises(NoDataError):
         await service.get_latest("test_source")
+
+
+@pytest.mark.asyncio
+async def test_cache_raw_maps_invalid_json_to_upstream_error(mocker):
+    """Postgres rejecting the body as JSON is an upstream problem; other DB errors propagate."""
+    session = mocker.AsyncMock()
+    repository = SpaceCacheRepository(session)
+
+    session.execute.side_effect = DBAPIError("INSERT", {}, SimpleNamespace(sqlstate="22P02"))
+    with pytest.raises(UpstreamError):
+        await repository.cache_raw("neo", b"{broken")
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+
+    session.execute.side_effect = DBAPIError("INSERT", {}, SimpleNamespace(sqlstate="57P01"))
+    with pytest.raises(DBAPIError):
+        await repository.cache_raw("neo", b"{}")
@@ -0,0 +1,326 @@
+import asyncio
+import httpx
+import pytest
+
+from app.clients import json_codec
+from app.clients.base_client import UPSTREAM_ATTEMPTS, BaseAPIClient
+from app.clients.http_cache import NotModified
+from app.clients.latency import path_template
+from app.clients.rate_limit import RateLimitGovernor, on_demand_priority
+from app.core.config import get_settings
+from app.core.exceptions import CircuitOpenError, RateLimitedError, UpstreamError
+from app.middleware.trace_id import trace_id_var
+
+settings = get_settings()
+
+
+def _json_handler(payload, status_code=200, headers=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json=payload, headers=headers)
+    return handler
+
+
+def _refuse(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        raise httpx.ConnectError("connection refused", request=request)
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_client_per_host(upstream):
+    """Clients for the same host borrow one pooled httpx client."""
+    registry = upstream(_json_handler({"ok": 1})).registry
+
+    first = BaseAPIClient("https://example.test", headers={"x-api-key": "a"})
+    second = BaseAPIClient("https://example.test")
+
+    assert await first._get_client() is await second._get_client()
+
+    assert await first.get("/a") == {"ok": 1}
+    assert await second.get("/b") == {"ok": 1}
+    await first.close()
+    assert not (await second._get_client()).is_closed
+
+    stats = registry.stats("https://example.test")
+    assert stats["requests"] == 2
+
+    await registry.aclose()
+    assert registry.stats() == {"https://example.test": stats}
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_raises_not_modified(upstream):
+    """A stored ETag is revalidated and a 304 surfaces as NotModified."""
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"title": "APOD"}, headers={"ETag": '"v1"'})
+
+    cache = upstream(handler).validators
+    client = BaseAPIClient("https://example.test", conditional=True)
+
+    assert await client.get("/apod", params={"api_key": "k"}) == {"title": "APOD"}
+    with pytest.raises(NotModified):
+        await client.get("/apod", params={"api_key": "k"})
+
+    assert seen_headers == [None, '"v1"']
+    assert cache.stats()["not_modified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_governor_reserves_budget_for_scheduled():
+    """On-demand calls are shed once only the scheduled reserve remains."""
+    governor = RateLimitGovernor({"https://api.nasa.gov": 8})
+    governor.observe(
+        "https://api.nasa.gov",
+        httpx.Response(200, headers={"X-RateLimit-Limit": "8", "X-RateLimit-Remaining": "3"})
+    )
+
+    with on_demand_priority():
+        await governor.acquire("https://api.nasa.gov")
+        with pytest.raises(RateLimitedError):
+            await governor.acquire("https://api.nasa.gov")
+
+    # Scheduled collectors may still spend the reserve
+    await governor.acquire("https://api.nasa.gov")
+
+    stats = governor.stats()["https://api.nasa.gov"]
+    assert stats["remaining"] == 1
+    assert stats["shed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_wait_does_not_block_other_callers(mocker):
+    """A scheduled call waiting for a token does not hold up sheds or other hosts."""
+    governor = RateLimitGovernor({"https://api.nasa.gov": 3600, "https://other.test": 10})
+    governor.observe(
+        "https://api.nasa.gov",
+        httpx.Response(200, headers={"X-RateLimit-Limit": "3600", "X-RateLimit-Remaining": "0"})
+    )
+    mocker.patch.object(settings, "rate_limit_max_wait_seconds", 5.0)
+
+    waiter = asyncio.create_task(governor.acquire("https://api.nasa.gov"))
+    await asyncio.sleep(0)
+
+    # Shed and unrelated-host calls complete while the waiter sleeps
+    with on_demand_priority():
+        with pytest.raises(RateLimitedError):
+            await asyncio.wait_for(governor.acquire("https://api.nasa.gov"), 0.1)
+    await asyncio.wait_for(governor.acquire("https://other.test"), 0.1)
+    assert not waiter.done()
+
+    await waiter
+    assert governor.stats()["https://api.nasa.gov"]["deferred"] == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_fails_fast(upstream, mocker):
+    """Repeated 5xx responses open the circuit; later calls never hit the host."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503)
+
+    guard = upstream(handler).guard
+    mocker.patch.object(settings, "circuit_min_calls", 3)
+
+    client = BaseAPIClient("https://down.test")
+    for _ in range(3):
+        with pytest.raises(UpstreamError):
+            await client.get("/feed")
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("/feed")
+
+    assert len(calls) == 3
+    assert guard.stats()["https://down.test"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_locally_shed_call_does_not_close_half_open_circuit(upstream, mocker):
+    """A probe shed by the local quota never reaches the breaker."""
+    calls = []
+    guard = upstream(_refuse(calls)).guard
+    governor = RateLimitGovernor({"https://quota.test": 10})
+    governor.observe(
+        "https://quota.test",
+        httpx.Response(200, headers={"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "0"})
+    )
+    mocker.patch("app.clients.base_client.rate_limit_governor", governor)
+    mocker.patch.object(settings, "circuit_open_seconds", 0)
+
+    breaker = guard.breaker("https://quota.test")
+    breaker._open(0.0)
+
+    client = BaseAPIClient("https://quota.test")
+    with on_demand_priority():
+        with pytest.raises(RateLimitedError):
+            await client.get("/feed")
+
+    assert calls == []
+    assert breaker.state.value == "open"
+    assert breaker.probes_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_suppresses_retries_when_exhausted(upstream, mocker):
+    """Once the host's retry budget is spent, failures are not retried."""
+    calls = []
+    budgets = upstream(_refuse(calls)).budgets
+    mocker.patch.object(settings, "retry_budget_ratio", 0.0)
+    mocker.patch.object(settings, "retry_budget_min_per_window", 1)
+
+    client = BaseAPIClient("https://flaky.test")
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/feed")
+    assert len(calls) == 2  # first attempt + the single budgeted retry
+
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/feed")
+    assert len(calls) == 3  # budget exhausted: no retry
+
+    stats = budgets.stats()["https://flaky.test"]
+    assert stats["retries_allowed"] == 1
+    assert stats["retries_suppressed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_call_spends_only_the_retries_it_makes(upstream, mocker):
+    """A call failing every attempt spends one token per retry, none for the last attempt."""
+    calls = []
+    budgets = upstream(_refuse(calls)).budgets
+    mocker.patch.object(settings, "retry_budget_ratio", 0.0)
+    mocker.patch.object(settings, "retry_budget_min_per_window", 5)
+
+    with pytest.raises(httpx.ConnectError):
+        await BaseAPIClient("https://down.test").get("/feed")
+
+    stats = budgets.stats()["https://down.test"]
+    assert len(calls) == UPSTREAM_ATTEMPTS
+    assert stats["retries_in_window"] == stats["retries_allowed"] == UPSTREAM_ATTEMPTS - 1
+    assert stats["retries_suppressed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedged_get_returns_first_response(upstream):
+    """A GET slower than the observed p95 is hedged; the fast duplicate wins."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+        return httpx.Response(200, json={"attempt": len(calls)})
+
+    tracker = upstream(handler).latency
+    for _ in range(settings.latency_min_samples):
+        tracker.observe("https://jwst.test", "/all", 0.01)
+
+    client = BaseAPIClient("https://jwst.test", hedge=True)
+    result = await asyncio.wait_for(client.get("/all"), timeout=2)
+
+    assert result == {"attempt": 2}
+    assert len(calls) == 2
+    assert tracker.timeout_for("https://jwst.test", "/all", 30) == settings.adaptive_timeout_min_seconds
+
+
+@pytest.mark.asyncio
+async def test_timeouts_widen_the_adaptive_timeout(upstream):
+    """Timed-out calls are recorded, so a slowed upstream raises the timeout."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("slow", request=request)
+
+    tracker = upstream(handler).latency
+    for _ in range(settings.latency_min_samples):
+        tracker.observe("https://slow.test", "/feed", 2.0)
+
+    before = tracker.timeout_for("https://slow.test", "/feed", 30)
+    client = BaseAPIClient("https://slow.test")
+    with pytest.raises(UpstreamError):
+        await client.get("/feed")
+
+    assert tracker.timeout_for("https://slow.test", "/feed", 30) > before
+
+
+def test_path_template_collapses_identifiers():
+    assert path_template("/v1/coordinates/51.5,-0.12") == "/v1/coordinates/{id}"
+    assert path_template("/v4/launches/next") == "/v4/launches/next"
+
+
+@pytest.mark.asyncio
+async def test_get_raw_returns_undecoded_body(upstream):
+    """get_raw hands back bytes that can be wrapped without decoding."""
+    upstream(_json_handler([{"flrID": "F1"}]))
+
+    raw = await BaseAPIClient("https://api.nasa.gov").get_raw("/DONKI/FLR")
+
+    assert isinstance(raw, bytes)
+    assert json_codec.loads(json_codec.wrap("flares", raw)) == {"flares": [{"flrID": "F1"}]}
+
+
+@pytest.mark.asyncio
+async def test_get_raw_rejects_non_json_body(upstream):
+    """An HTML page served with 200 surfaces as an upstream error, not a DB error."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<html>maintenance</html>", headers={"Content-Type": "text/html"})
+
+    upstream(handler)
+
+    with pytest.raises(UpstreamError):
+        await BaseAPIClient("https://api.nasa.gov").get_raw("/DONKI/FLR")
+    assert not json_codec.looks_like_json(b"  <html>")
+    assert json_codec.looks_like_json(b"\n [1]")
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_records_requests_per_path_template(upstream):
+    """Each attempt is recorded with duration, size, status class and trace_id."""
+    instrumentation = upstream(_json_handler({"latitude": 1.0})).metrics
+    token = trace_id_var.set("trace-123")
+
+    try:
+        client = BaseAPIClient("https://iss.test")
+        await client.get("/v1/coordinates/10.5,20.25")
+        await client.get("/v1/coordinates/-3.0,40.0")
+    finally:
+        trace_id_var.reset(token)
+
+    metrics = instrumentation.endpoint("https://iss.test", "/v1/coordinates/1,2")
+    assert metrics.requests == 2
+    assert metrics.status_classes == {"2xx": 2}
+    assert metrics.response_bytes > 0
+    assert len(instrumentation.recent(trace_id="trace-123")) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_with_keyword_path_is_recorded(upstream):
+    """Retries of calls made with path= are counted instead of masking the error."""
+    instrumentation = upstream(_refuse([])).metrics
+
+    with pytest.raises(httpx.ConnectError):
+        await BaseAPIClient("https://down.test").post(path="/submit", json={})
+
+    assert instrumentation.endpoint("https://down.test", "/submit").retries == UPSTREAM_ATTEMPTS - 1
+
+
+@pytest.mark.asyncio
+async def test_prometheus_families_are_contiguous(upstream):
+    """Every family's TYPE line is followed by all of its samples, for every host."""
+    instrumentation = upstream(_json_handler({})).metrics
+
+    await BaseAPIClient("https://a.test").get("/feed")
+    await BaseAPIClient("https://b.test").get("/feed")
+
+    families = []
+    for line in instrumentation.prometheus_lines():
+        if line.startswith("# TYPE "):
+            families.append(line.split()[2])
+            continue
+        name = line.split("{")[0]
+        assert name.startswith(families[-1])
+    assert len(families) == len(set(families)) == 5
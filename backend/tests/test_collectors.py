@@ -0,0 +1,420 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from apscheduler.events import EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.clients.http_cache import ValidatorCache
+from app.collectors.adaptive import ChangeRateTracker, source_policies
+from app.collectors.iss_collector import backfill_iss_gaps, backfill_timestamps
+from app.collectors.leader import LeaderElector, _become_leader
+from app.collectors.partition_collector import partition_plan
+from app.collectors.notify import UPDATES_CHANNEL, DataUpdateListener, notify_update
+from app.collectors.scheduler import setup_scheduler
+from app.collectors.state import restore_collector_state
+from app.collectors.startup import (
+    SourceState,
+    StartupReadiness,
+    StartupSource,
+    StepState,
+    run_initial_collection,
+    run_startup_steps,
+    startup_readiness,
+)
+from app.collectors.telemetry import JobTelemetry, record_failure, record_rows, record_unchanged
+from app.core.config import get_settings
+from app.repositories.partition_repository import partition_day, partition_name
+
+settings = get_settings()
+
+
+def _source(name, collect, fresh_before=False, fresh_after=True):
+    checks = iter([fresh_before, fresh_after])
+
+    async def is_fresh():
+        return next(checks)
+
+    return StartupSource(name, collect, is_fresh)
+
+
+@pytest.mark.asyncio
+async def test_initial_collection_runs_in_parallel_with_deadlines(mocker):
+    """Fresh sources are skipped, slow ones time out, the rest run concurrently."""
+    mocker.patch.object(settings, "startup_collection_concurrency", 2)
+    mocker.patch.object(settings, "startup_source_deadline_seconds", 0.2)
+    running = []
+    peak = []
+
+    async def collect():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.05)
+        running.pop()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def never_called():
+        raise AssertionError("fresh source must be skipped")
+
+    sources = [
+        _source("iss", collect),
+        _source("osdr", collect),
+        _source("apod", never_called, fresh_before=True),
+        _source("neo", collect, fresh_after=False),
+        _source("flr", hang),
+    ]
+
+    await run_initial_collection(sources, persist_state=False)
+
+    snapshot = startup_readiness.snapshot()
+    states = {name: s["state"] for name, s in snapshot["sources"].items()}
+    assert snapshot["ready"] is True
+    assert states == {
+        "iss": SourceState.COLLECTED.value,
+        "osdr": SourceState.COLLECTED.value,
+        "apod": SourceState.FRESH.value,
+        "neo": SourceState.FAILED.value,
+        "flr": SourceState.TIMED_OUT.value,
+    }
+    assert snapshot["warm"] == ["apod", "iss", "osdr"]
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_new_leader_leaves_resumed_sources_to_the_scheduler(mocker):
+    """Sources with a persisted next run are not also collected at startup."""
+    overdue = datetime.now(timezone.utc) - timedelta(hours=1)
+    mocker.patch(
+        "app.collectors.state.restore_collector_state",
+        return_value={"iss": overdue, "osdr": None}
+    )
+    maintain = mocker.patch("app.collectors.partition_collector.maintain_partitions")
+    start_scheduler = mocker.patch("app.collectors.scheduler.start_scheduler")
+    start_initial = mocker.patch("app.collectors.startup.start_initial_collection")
+
+    await _become_leader()
+
+    maintain.assert_awaited_once()
+    start_scheduler.assert_called_once_with({"iss": overdue, "osdr": None})
+    assert start_initial.call_args.kwargs["scheduled"] == ["iss"]
+
+    async def never_called():
+        raise AssertionError("scheduled source must be left to the scheduler")
+
+    async def collect():
+        pass
+
+    await run_initial_collection(
+        [_source("iss", never_called), _source("osdr", collect)],
+        persist_state=False,
+        scheduled=["iss"]
+    )
+    states = {name: s["state"] for name, s in startup_readiness.snapshot()["sources"].items()}
+    assert states == {"iss": SourceState.SKIPPED.value, "osdr": SourceState.COLLECTED.value}
+
+
+@pytest.mark.asyncio
+async def test_readiness_endpoint_reports_pending_sources(client, mocker):
+    readiness = StartupReadiness()
+    mocker.patch("app.api.health.startup_readiness", readiness)
+    readiness.reset(["iss"])
+    response = await client.get("/api/ready")
+    assert response.status_code == 503
+    assert response.json()["sources"]["iss"]["state"] == "pending"
+
+    readiness.finished = True
+    response = await client.get("/api/ready")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_startup_steps_run_in_stages_and_gate_readiness():
+    """Later stages wait for earlier ones; a failed step still settles."""
+    order = []
+    release = asyncio.Event()
+
+    async def warmup():
+        await release.wait()
+        order.append("warmup")
+
+    async def geocoder():
+        raise OSError("boundary file missing")
+
+    async def collectors():
+        order.append("collectors")
+
+    startup_readiness.finished = True
+    task = asyncio.create_task(run_startup_steps([
+        {"http_warmup": warmup, "geocoder": geocoder},
+        {"collectors": collectors},
+    ]))
+    await asyncio.sleep(0)
+    snapshot = startup_readiness.snapshot()
+    assert snapshot["ready"] is False
+    assert snapshot["steps"]["collectors"]["state"] == StepState.PENDING.value
+
+    release.set()
+    await task
+    assert order == ["warmup", "collectors"]
+    steps = startup_readiness.snapshot()["steps"]
+    assert steps["geocoder"]["state"] == StepState.FAILED.value
+    assert "boundary file missing" in steps["geocoder"]["error"]
+    assert startup_readiness.ready is True
+
+
+@pytest.mark.asyncio
+async def test_leader_elector_promotes_and_steps_down(mocker):
+    """The lock holder runs collectors and gives them up when its connection breaks."""
+    events = []
+
+    async def on_elected():
+        events.append("elected")
+
+    async def on_demoted():
+        events.append("demoted")
+
+    elector = LeaderElector(1, on_elected=on_elected, on_demoted=on_demoted)
+    acquire = mocker.patch.object(elector, "_try_acquire", side_effect=[False, True])
+    mocker.patch.object(elector, "_heartbeat", side_effect=ConnectionError("connection lost"))
+    mocker.patch.object(elector, "_drop_connection")
+
+    await elector.step()  # another process holds the lock
+    assert events == ["demoted"] and not elector.is_leader
+
+    await elector.step()  # previous leader went away
+    assert events == ["demoted", "elected"] and elector.is_leader
+    assert elector.status()["role"] == "leader"
+
+    await elector.step()  # heartbeat fails -> step down
+    assert events == ["demoted", "elected", "demoted"]
+    assert not elector.is_leader
+    assert acquire.call_count == 2
+
+
+def test_change_tracker_backs_off_within_bounds(mocker):
+    mocker.patch.object(settings, "collector_jitter_seconds", 0)
+    tracker = ChangeRateTracker()
+    policy = source_policies()["neo"]
+
+    assert tracker.observe("neo", b'{"a": 1}') is True
+    for _ in range(20):
+        tracker.observe_unchanged("neo")
+    assert tracker.stats()["neo"]["interval_seconds"] == policy.max_seconds
+
+    for version in range(20):
+        assert tracker.observe("neo", b'{"a": %d}' % (version + 2)) is True
+    assert tracker.stats()["neo"]["interval_seconds"] == policy.min_seconds
+    assert tracker.next_run_time("iss") is None
+
+
+def test_change_tracker_aligns_apod_to_publish_time(mocker):
+    mocker.patch.object(settings, "collector_jitter_seconds", 0)
+    tracker = ChangeRateTracker()
+    policy = source_policies()["apod"]
+    now = datetime.now(timezone.utc)
+
+    # Not seen since the last publish: poll at the fastest allowed rate
+    assert tracker.next_run_time("apod", now) == now + timedelta(seconds=policy.min_seconds)
+
+    tracker.observe("apod", {"title": "Today"})
+    next_run = tracker.next_run_time("apod", datetime.now(timezone.utc))
+    delay = (next_run - datetime.now(timezone.utc)).total_seconds()
+    assert 0 < delay <= policy.max_seconds
+
+
+@pytest.mark.asyncio
+async def test_job_telemetry_records_outcomes_and_overlaps():
+    telemetry = JobTelemetry()
+    scheduled_at = datetime.now(timezone.utc) - timedelta(seconds=2)
+    telemetry.listener(SimpleNamespace(
+        code=EVENT_JOB_SUBMITTED, job_id="neo_collector", scheduled_run_times=[scheduled_at]
+    ))
+    telemetry.listener(SimpleNamespace(
+        code=EVENT_JOB_MISSED, job_id="neo_collector", scheduled_run_time=scheduled_at
+    ))
+
+    async with telemetry.track("neo_collector"):
+        record_rows(1)
+        async with telemetry.track("neo_collector", trigger="on_demand"):
+            record_unchanged()
+
+    async with telemetry.track("neo_collector"):
+        record_failure(RuntimeError("upstream down"))
+
+    with pytest.raises(asyncio.CancelledError):
+        async with telemetry.track("neo_collector"):
+            raise asyncio.CancelledError()
+
+    snapshot = telemetry.snapshot("neo_collector")
+    assert snapshot["runs"] == 4
+    assert snapshot["successes"] == 1
+    assert snapshot["unchanged"] == 1
+    assert snapshot["failures"] == 1
+    assert snapshot["cancelled"] == 1
+    assert snapshot["last_success_at"] < snapshot["last_attempt_at"]
+    assert snapshot["overlaps"] == 1
+    assert snapshot["misfires"] == 1
+    assert snapshot["max_lag_ms"] >= 2000
+    outcomes = [(run["trigger"], run["outcome"], run["rows_written"]) for run in snapshot["history"]]
+    assert outcomes == [
+        ("on_demand", "unchanged", 0),
+        ("scheduled", "success", 1),
+        ("scheduled", "error", 0),
+        ("scheduled", "cancelled", 0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_admin_jobs_endpoint(client, mocker):
+    async def fresh(source):
+        return source.name == "apod"
+
+    mocker.patch("app.api.admin.check_fresh", side_effect=fresh)
+    response = await client.get("/api/admin/jobs?history=5")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ok"] is True
+    jobs = {job["source"]: job for job in body["data"]["jobs"]}
+    assert len(jobs) == 11
+    assert jobs["apod"]["freshness"]["fresh"] is True
+    assert jobs["neo"]["freshness"]["fresh"] is False
+    assert jobs["iss"]["id"] == "iss_collector"
+
+
+def test_scheduler_resumes_persisted_next_due(mocker):
+    test_scheduler = AsyncIOScheduler()
+    mocker.patch("app.collectors.scheduler.scheduler", test_scheduler)
+    mocker.patch.object(settings, "collector_schedule_mode", "fixed")
+    now = datetime.now(timezone.utc)
+    due = now + timedelta(minutes=30)
+
+    setup_scheduler({"apod": due, "neo": now - timedelta(hours=1)})
+
+    apod = test_scheduler.get_job("apod_collector")
+    neo = test_scheduler.get_job("neo_collector")
+    iss = test_scheduler.get_job("iss_collector")
+    assert apod.trigger.start_date == due
+    # Overdue: runs right away, staggered behind earlier jobs
+    assert now < neo.trigger.start_date < now + timedelta(minutes=5)
+    # No persisted state: one interval from now
+    assert iss.trigger.start_date >= now + timedelta(seconds=settings.iss_poll_interval_seconds)
+
+
+@pytest.mark.asyncio
+async def test_restore_collector_state_loads_validators_and_next_due(mocker):
+    cache = ValidatorCache()
+    key = cache.make_key("https://api.nasa.gov", "/planetary/apod", {"api_key": "SECRET"})
+    assert "SECRET" not in key
+    due = datetime.now(timezone.utc) + timedelta(hours=3)
+    state = SimpleNamespace(
+        validators={key: {"etag": '"abc"', "last_modified": None, "stored_at": None}},
+        fingerprint="f" * 32,
+        last_change_at=None,
+        interval_seconds=None,
+        next_due_at=due,
+    )
+    mocker.patch("app.collectors.state.validator_cache", cache)
+    mocker.patch("app.collectors.state.async_session_factory", mocker.MagicMock())
+    mocker.patch(
+        "app.collectors.state.CollectorStateRepository.get_states",
+        mocker.AsyncMock(return_value={"apod": state}),
+    )
+
+    next_due = await restore_collector_state()
+
+    assert next_due == {"apod": due}
+    assert cache.get(key).etag == '"abc"'
+    assert cache.export("https://api.nasa.gov/planetary/apod")[key]["etag"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_data_updates_are_announced_and_dispatched(mocker):
+    session = mocker.AsyncMock()
+    await notify_update(session, "neo")
+    statement, params = session.execute.call_args.args
+    assert "pg_notify" in str(statement)
+    assert params == {"channel": UPDATES_CHANNEL, "source": "neo"}
+    session.commit.assert_awaited_once()
+
+    listener = DataUpdateListener()
+    seen = []
+    listener.subscribe(seen.append)
+    listener._on_notification(None, 1234, UPDATES_CHANNEL, "neo")
+    assert seen == ["neo"]
+    assert "neo" in listener.stats()["last_updates"]
+
+
+def test_backfill_timestamps_fill_gaps_newest_first():
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    gaps = [
+        (base + timedelta(hours=2), base + timedelta(hours=2, seconds=600)),
+        (base, base + timedelta(seconds=480)),
+    ]
+
+    timestamps = backfill_timestamps(gaps, step_seconds=120, limit=6)
+
+    start = int(base.timestamp())
+    assert timestamps == [
+        start + 7200 + 120, start + 7200 + 240, start + 7200 + 360, start + 7200 + 480,
+        start + 120, start + 240,
+    ]
+
+
+def test_partition_plan_premakes_and_drops_whole_expired_days():
+    now = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    days = [now.date() - timedelta(days=d) for d in (16, 15, 14, 13)] + [now.date() + timedelta(days=1)]
+    partitions = [(partition_name("iss_fetch_log", day), day) for day in days]
+
+    create, drop = partition_plan(partitions, now, premake_days=2, retention=14)
+
+    assert create == [now.date(), now.date() + timedelta(days=2)]
+    # The day 14 days ago still holds rows younger than the retention period
+    assert drop == ["iss_fetch_log_p20261001", "iss_fetch_log_p20261002"]
+    assert partition_plan(partitions, now, premake_days=0, retention=0)[1] == []
+
+    # Days whose rows landed in the DEFAULT partition get their own partition
+    late = now.date() - timedelta(days=3)
+    create, _ = partition_plan(partitions, now, premake_days=1, retention=14, default_days=[late])
+    assert create == [late, now.date()]
+
+    assert partition_day("iss_fetch_log", "iss_fetch_log_p20261001") == days[0]
+    assert partition_day("iss_fetch_log", "iss_fetch_log_default") is None
+
+
+@pytest.mark.asyncio
+async def test_backfill_batches_upstream_requests(mocker):
+    """Missing positions are requested 10 at a time and stored with upstream timestamps."""
+    base = datetime.now(timezone.utc) - timedelta(hours=3)
+    mocker.patch("app.collectors.iss_collector.async_session_factory", mocker.MagicMock())
+    mocker.patch("app.collectors.iss_collector.notify_update", mocker.AsyncMock())
+    mocker.patch(
+        "app.collectors.iss_collector.ISSRepository.find_gaps",
+        mocker.AsyncMock(return_value=[(base, base + timedelta(seconds=120 * 26))]),
+    )
+    insert = mocker.patch(
+        "app.collectors.iss_collector.ISSRepository.insert_positions",
+        mocker.AsyncMock(side_effect=lambda rows: len(rows)),
+    )
+
+    async def positions(timestamps):
+        return [
+            {"latitude": 1.0, "longitude": 2.0, "altitude": 410.0, "velocity": 27600.0, "timestamp": t}
+            for t in timestamps
+        ]
+
+    get_positions = mocker.patch(
+        "app.collectors.iss_collector.ISSClient.get_positions", side_effect=positions
+    )
+    telemetry = JobTelemetry()
+
+    async with telemetry.track("iss_backfill_collector") as run:
+        await backfill_iss_gaps()
+
+    assert [len(call.args[0]) for call in get_positions.call_args_list] == [10, 10, 5]
+    rows = [row for call in insert.call_args_list for row in call.args[0]]
+    assert rows[0]["timestamp"] == datetime.fromtimestamp(int(base.timestamp()) + 120, tz=timezone.utc)
+    assert run.rows_written == 25
+    assert run.outcome == "success"
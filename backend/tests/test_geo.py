@@ -0,0 +1,115 @@
+import asyncio
+import json
+import time
+import pytest
+
+from app.clients.iss_client import ISSClient
+from app.core.config import get_settings
+from app.geo.geocoder import GeoLayer, ReverseGeocoder, nautical_timezone
+
+settings = get_settings()
+
+
+def _square(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+
+
+def _write(path, features):
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+    return str(path)
+
+
+@pytest.fixture
+def geocoder(tmp_path):
+    """Two neighbouring countries, one with an enclave, and one time zone."""
+    countries = _write(tmp_path / "countries.geojson", [
+        {"properties": {"ISO_A2": "AA"},
+         "geometry": {"type": "Polygon",
+                      "coordinates": [_square(0, 0, 10.3, 10), _square(4.1, 4.1, 5.9, 5.9)]}},
+        {"properties": {"ISO_A2": "-99", "ISO_A2_EH": "BB"},
+         "geometry": {"type": "MultiPolygon",
+                      "coordinates": [[_square(10.3, 0, 20, 10)], [_square(4.1, 4.1, 5.9, 5.9)]]}},
+    ])
+    timezones = _write(tmp_path / "timezones.geojson", [
+        {"properties": {"tzid": "Test/Zone"},
+         "geometry": {"type": "Polygon", "coordinates": [_square(0, 0, 20, 10)]}},
+    ])
+    geocoder = ReverseGeocoder()
+    geocoder.build(countries, timezones, cell_deg=1.0)
+    return geocoder
+
+
+def test_lookup_interior_boundary_and_enclave(geocoder):
+    assert geocoder.lookup(2.5, 2.5) == {"country_code": "AA", "timezone_id": "Test/Zone"}
+    # Boundary cell between AA and BB is resolved exactly
+    assert geocoder.lookup(7.0, 10.2)["country_code"] == "AA"
+    assert geocoder.lookup(7.0, 10.4)["country_code"] == "BB"
+    # Enclave of BB inside AA
+    assert geocoder.lookup(5.0, 5.0)["country_code"] == "BB"
+    # Open water: no country, nautical time zone
+    assert geocoder.lookup(-30.0, 121.0) == {"country_code": None, "timezone_id": "Etc/GMT-8"}
+
+
+def test_prebuilt_index_round_trip(geocoder, tmp_path):
+    path = tmp_path / "index.json"
+    geocoder.save(path)
+    loaded = ReverseGeocoder()
+    loaded.load_index(path)
+
+    points = [(2.5, 2.5), (7.0, 10.2), (7.0, 10.4), (5.0, 5.0), (-30.0, 121.0)]
+    assert loaded.lookup_many(points) == geocoder.lookup_many(points)
+
+
+def test_nautical_timezone():
+    assert nautical_timezone(0.0) == "Etc/GMT"
+    assert nautical_timezone(-75.0) == "Etc/GMT+5"
+    assert nautical_timezone(179.9) == "Etc/GMT-12"
+
+
+@pytest.mark.asyncio
+async def test_iss_client_skips_coordinates_call_with_geocoder(geocoder, mocker):
+    mocker.patch("app.clients.iss_client.reverse_geocoder", geocoder)
+    get = mocker.patch.object(
+        ISSClient, "get", return_value={"latitude": 2.5, "longitude": 2.5}
+    )
+
+    position = await ISSClient().get_position()
+
+    assert get.await_count == 1
+    assert position["raw"]["location_info"]["country_code"] == "AA"
+
+
+@pytest.mark.asyncio
+async def test_iss_client_uses_coordinates_endpoint_while_geocoder_loads(mocker):
+    loading = ReverseGeocoder()
+    ensure_loaded = mocker.patch.object(loading, "ensure_loaded")
+    mocker.patch("app.clients.iss_client.reverse_geocoder", loading)
+    get = mocker.patch.object(
+        ISSClient, "get",
+        side_effect=[{"latitude": 2.5, "longitude": 2.5}, {"country_code": "AA", "timezone_id": "Test/Zone"}]
+    )
+
+    position = await ISSClient().get_position()
+
+    ensure_loaded.assert_not_called()
+    assert get.await_args_list[1].args == ("/v1/coordinates/2.5,2.5",)
+    assert position["raw"]["location_info"]["country_code"] == "AA"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_ensure_loaded_builds_once(mocker, tmp_path):
+    geocoder = ReverseGeocoder()
+    mocker.patch.object(settings, "geocoder_index_file", None)
+    mocker.patch.object(settings, "geocoder_countries_file", str(tmp_path / "countries.geojson"))
+    mocker.patch.object(settings, "geocoder_timezones_file", None)
+
+    def slow_build(*args):
+        time.sleep(0.05)
+        geocoder.countries = GeoLayer(1.0)
+
+    build = mocker.patch.object(geocoder, "build", side_effect=slow_build)
+
+    results = await asyncio.gather(*(asyncio.to_thread(geocoder.ensure_loaded) for _ in range(4)))
+
+    assert results == [True] * 4
+    assert build.call_count == 1
@@ -0,0 +1,144 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.iss_buffer import PositionBuffer, lttb
+
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _row(minutes_ago, lat=1.0):
+    return (NOW - timedelta(minutes=minutes_ago), lat, 2.0, 420.0, 27600.0, "daylight", "AA", "Test/Zone")
+
+
+class FakeRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def get_buffer_rows(self, since):
+        self.calls.append(since)
+        return [r for r in self.rows if r[0] > since]
+
+
+def test_append_wraps_and_keeps_order():
+    buffer = PositionBuffer(capacity=3)
+    assert buffer.extend([_row(m, lat=float(m)) for m in (40, 30, 20, 10)]) == 4
+    assert buffer.size == 3
+    # Oldest row was overwritten; out-of-order rows are rejected
+    assert not buffer.append(_row(15))
+    assert buffer.latest()["latitude"] == 10.0
+    assert buffer.latest()["timestamp"] == _row(10)[0].isoformat()
+
+
+def test_trend_json_window_limit_and_order():
+    buffer = PositionBuffer(capacity=10)
+    buffer.extend([_row(m, lat=float(m)) for m in (50, 40, 30, 20, 10)])
+
+    data, count = buffer.trend_json(NOW - timedelta(minutes=35), limit=100)
+    positions = json.loads(data)
+    assert count == 3
+    assert [p["latitude"] for p in positions] == [10.0, 20.0, 30.0]
+    assert positions[0]["country_code"] == "AA"
+
+    data, count = buffer.trend_json(NOW - timedelta(hours=1), limit=2)
+    assert [p["latitude"] for p in json.loads(data)] == [10.0, 20.0]
+
+    assert buffer.trend_json(NOW, limit=10) == (b"[]", 0)
+
+
+@pytest.mark.asyncio
+async def test_ensure_current_rebuilds_then_syncs_incrementally():
+    repository = FakeRepository([_row(30), _row(20)])
+    buffer = PositionBuffer(capacity=10)
+
+    await buffer.ensure_current(repository)
+    assert (buffer.size, buffer.rebuilds, len(repository.calls)) == (2, 1, 1)
+
+    # No notification: served from memory without touching the DB
+    await buffer.ensure_current(repository)
+    assert len(repository.calls) == 1
+
+    # New poll: incremental read after the last buffered timestamp
+    repository.rows.append(_row(10))
+    buffer.on_data_update("iss")
+    await buffer.ensure_current(repository)
+    assert repository.calls[-1] == _row(20)[0]
+    assert (buffer.size, buffer.syncs) == (3, 1)
+
+    # Backfill inserts rows in the past: full rebuild
+    repository.rows.insert(1, _row(25))
+    buffer.on_data_update("iss_backfill")
+    await buffer.ensure_current(repository)
+    assert (buffer.size, buffer.rebuilds) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_notification_during_sync_is_not_lost():
+    buffer = PositionBuffer(capacity=10)
+
+    class NotifiedDuringRead(FakeRepository):
+        async def get_buffer_rows(self, since):
+            rows = await super().get_buffer_rows(since)
+            # A new poll lands while the (slow) read is in flight
+            self.rows.append(_row(5))
+            buffer.on_data_update("iss")
+            return rows
+
+    repository = NotifiedDuringRead([_row(20)])
+    await buffer.ensure_current(repository)
+    assert buffer.size == 1
+
+    await buffer.ensure_current(repository)
+    assert buffer.size == 2
+    assert buffer.latest()["timestamp"] == _row(5)[0].isoformat()
+
+
+def _lttb_reference(x, y, threshold):
+    """Textbook LTTB, point by point."""
+    n = len(x)
+    every = (n - 2) / (threshold - 2)
+    kept, a = [0], 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = sum(x[end:next_end]) / (next_end - end)
+        avg_y = sum(y[end:next_end]) / (next_end - end)
+        areas = [abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])) for j in range(start, end)]
+        a = start + areas.index(max(areas))
+        kept.append(a)
+    return kept + [n - 1]
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = list(range(100))
+    y = [0.0] * 100
+    y[37] = 10.0
+    kept = lttb(x, y, 10).tolist()
+    assert len(kept) == 10
+    assert kept[0] == 0 and kept[-1] == 99
+    assert 37 in kept
+    assert kept == sorted(kept)
+    assert lttb(x, y, 200).tolist() == x
+
+    # Large buckets take the array path and agree with the per-point walk
+    x = list(range(2000))
+    y = [((i * 7919) % 1000) / 10.0 for i in x]
+    assert lttb(x, y, 20).tolist() == _lttb_reference(x, y, 20)
+
+
+def test_downsample_json_covers_whole_window_across_antimeridian():
+    buffer = PositionBuffer(capacity=100)
+    # Eastward track wrapping from +170 to -170
+    for m in range(60, 0, -1):
+        lon = ((160.0 + (60 - m) * 2.0 + 180.0) % 360.0) - 180.0
+        buffer.append((NOW - timedelta(minutes=m), float(m % 7), lon, 420.0, 27600.0, None, None, None))
+
+    data, count, total = buffer.downsample_json(NOW - timedelta(hours=2), points=12)
+    positions = json.loads(data)
+    assert (count, total) == (12, 60)
+    # Newest first, spanning the full window rather than the newest rows
+    assert positions[0]["timestamp"] == (NOW - timedelta(minutes=1)).isoformat()
+    assert positions[-1]["timestamp"] == (NOW - timedelta(minutes=60)).isoformat()
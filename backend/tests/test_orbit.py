@@ -0,0 +1,247 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.orbit.cache import PredictionCache
+from app.orbit.engine import OrbitEngine, great_circle_km
+from app.orbit.groundtrack import split_antimeridian
+from app.orbit.tle import parse_tle, parse_tle_text
+from app.services.iss_service import ISSService
+from app.services.orbit_service import OrbitService
+
+ISS_TLE = """ISS (ZARYA)
+1 25544U 98067A   08264.51782528 -.00002182  00000-0 -11606-4 0  2927
+2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537
+"""
+
+
+def _engine():
+    pytest.importorskip("numpy")
+    pytest.importorskip("sgp4")
+    engine = OrbitEngine()
+    engine.load(parse_tle_text(ISS_TLE))
+    return engine
+
+
+def test_tle_parsing_validates_checksums():
+    tle = parse_tle_text(ISS_TLE)
+    assert tle.norad_id == 25544
+    assert tle.name == "ISS (ZARYA)"
+    assert tle.epoch.year == 2008 and tle.epoch.tzinfo is timezone.utc
+
+    lines = ISS_TLE.splitlines()
+    corrupt = lines[1][:-1] + "0"
+    with pytest.raises(ValueError, match="checksum"):
+        parse_tle(corrupt, lines[2])
+
+
+def test_great_circle_distance():
+    assert great_circle_km(0, 0, 0, 0) == 0
+    # A quarter of the equator
+    assert great_circle_km(0, 0, 0, 90) == pytest.approx(10007.5, rel=1e-3)
+
+
+def test_propagation_batch_matches_single_positions():
+    """Vectorized propagation gives physically sane ISS states."""
+    engine = _engine()
+    import numpy as np
+
+    epoch = engine.tle.epoch
+    times = epoch.timestamp() + np.arange(0, 5400, 60.0)
+    state = engine.propagate(times)
+
+    # Geodetic latitude peaks slightly above the 51.64 deg inclination
+    assert np.all(np.abs(state["latitude"]) <= 51.9)
+    assert np.all((state["longitude"] >= -180) & (state["longitude"] <= 180))
+    assert np.all((state["altitude_km"] > 300) & (state["altitude_km"] < 450))
+    assert np.all(np.abs(state["velocity_kmh"] - 27600) < 300)
+
+    single = engine.position_at(epoch + timedelta(minutes=30))
+    assert single["latitude"] == pytest.approx(state["latitude"][30], abs=1e-5)
+    assert single["longitude"] == pytest.approx(state["longitude"][30], abs=1e-5)
+
+
+def test_drift_check_distrusts_engine():
+    engine = _engine()
+    at = engine.tle.epoch
+    predicted = engine.position_at(at)
+
+    assert engine.check_drift(predicted["latitude"], predicted["longitude"], at) < 1
+    assert not engine.drifted
+    engine.check_drift(-predicted["latitude"], predicted["longitude"] + 90, at)
+    assert engine.drifted
+    assert not engine.is_current(at)
+
+
+@pytest.mark.asyncio
+async def test_latest_position_served_from_propagation(mocker):
+    """A current orbit engine answers /last without touching stored polls."""
+    repository = mocker.AsyncMock()
+    orbit = mocker.AsyncMock(spec=OrbitService)
+    orbit.current_position.return_value = {"latitude": 1.0, "source": "sgp4"}
+
+    result = await ISSService(repository, orbit).get_latest_position()
+
+    assert result["source"] == "sgp4"
+    repository.get_latest.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_orbit_service_loads_stored_tle(mocker):
+    engine = OrbitEngine()
+    mocker.patch("app.services.orbit_service.orbit_engine", engine)
+    mocker.patch.object(engine, "load")
+    mocker.patch.object(engine, "needs_reload", return_value=True)
+    lines = ISS_TLE.splitlines()
+    repository = mocker.AsyncMock()
+    repository.get_latest_by_source.return_value = SimpleNamespace(
+        payload={"name": lines[0], "line1": lines[1], "line2": lines[2]}
+    )
+
+    assert await OrbitService(repository).ensure_loaded() is False
+    repository.get_latest_by_source.assert_awaited_once_with("iss_tle")
+    assert engine.load.call_args.args[0].norad_id == 25544
+
+
+@pytest.mark.asyncio
+async def test_current_position_fills_visibility_and_location_from_last_poll(mocker):
+    engine = mocker.patch("app.services.orbit_service.orbit_engine")
+    engine.position_at.return_value = {"latitude": 1.0, "longitude": 2.0}
+    engine.tle.epoch = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    mocker.patch("app.services.orbit_service.visibility_at", return_value="eclipsed")
+    mocker.patch("app.services.orbit_service.reverse_geocoder", SimpleNamespace(loaded=False))
+    buffer = mocker.patch("app.services.orbit_service.iss_position_buffer")
+    buffer.latest.return_value = {"country_code": "AA", "timezone_id": "Test/Zone"}
+    service = OrbitService(mocker.AsyncMock())
+    mocker.patch.object(service, "ensure_loaded", return_value=True)
+
+    position = await service.current_position()
+
+    assert position["visibility"] == "eclipsed"
+    assert (position["country_code"], position["timezone_id"]) == ("AA", "Test/Zone")
+
+    buffer.latest.return_value = None
+    assert (await service.current_position())["country_code"] is None
+
+
+def test_visibility_matches_earth_shadow():
+    engine = _engine()
+    import numpy as np
+    from app.orbit.passes import is_sunlit, sun_direction_ecef, visibility_at
+
+    start = engine.tle.epoch.timestamp()
+    times = [start + minutes * 60 for minutes in range(0, 92, 7)]
+    sunlit = is_sunlit(engine.propagate(times)["ecef"], sun_direction_ecef(np.array(times)))
+    # One orbit passes through both daylight and the Earth's shadow
+    assert sunlit.any() and not sunlit.all()
+    for at, lit in zip(times, sunlit):
+        expected = "daylight" if lit else "eclipsed"
+        assert visibility_at(engine, datetime.fromtimestamp(at, tz=timezone.utc)) == expected
+
+
+def test_split_antimeridian_interpolates_crossings():
+    np = pytest.importorskip("numpy")
+    lat = np.array([10.0, 12.0, 14.0, 16.0])
+    lon = np.array([170.0, 178.0, -174.0, -166.0])
+
+    segments = split_antimeridian(lat, lon)
+
+    assert len(segments) == 2
+    assert segments[0][-1] == [180.0, 12.5]
+    assert segments[1][0] == [-180.0, 12.5]
+    assert segments[1][-1] == [-166.0, 16.0]
+
+
+@pytest.mark.asyncio
+async def test_groundtrack_cached_per_epoch_and_resolution(mocker):
+    engine = OrbitEngine()
+    engine.tle = parse_tle_text(ISS_TLE)
+    mocker.patch("app.services.orbit_service.orbit_engine", engine)
+    mocker.patch("app.services.orbit_service.groundtrack_cache", PredictionCache(8))
+    compute = mocker.patch(
+        "app.services.orbit_service.ground_track", return_value=[[[0.0, 0.0], [1.0, 1.0]]]
+    )
+    service = OrbitService(mocker.AsyncMock())
+    mocker.patch.object(service, "ensure_loaded", return_value=True)
+
+    first = await service.get_groundtrack(orbits=2, step_seconds=60)
+    second = await service.get_groundtrack(orbits=2, step_seconds=60)
+    await service.get_groundtrack(orbits=2, step_seconds=30)
+
+    assert first is second
+    assert compute.call_count == 2
+    start, end, step = compute.call_args.args[1:]
+    assert step == 30
+    assert end - start >= 2 * engine.tle.period_seconds
+    assert first["track"]["type"] == "MultiLineString"
+
+
+@pytest.mark.asyncio
+async def test_groundtrack_without_tle_is_no_data(client, mocker):
+    from app.api.iss import get_orbit_service
+    from app.main import app
+
+    service = OrbitService(mocker.AsyncMock())
+    mocker.patch.object(service, "ensure_loaded", return_value=False)
+    app.dependency_overrides[get_orbit_service] = lambda: service
+    try:
+        response = await client.get("/api/iss/groundtrack?orbits=2")
+    finally:
+        app.dependency_overrides.clear()
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["ok"] is False
+    assert body["error"]["code"] == "NO_DATA"
+
+
+def test_pass_prediction_finds_complete_passes():
+    engine = _engine()
+    from app.orbit.passes import Observer, predict_passes
+
+    start = engine.tle.epoch.timestamp()
+    passes = predict_passes(engine, Observer(45.0, 10.0), start, start + 86400, min_elevation=10)
+
+    assert passes
+    for p in passes:
+        rise = datetime.fromisoformat(p["rise"]["time"])
+        peak = datetime.fromisoformat(p["culmination"]["time"])
+        set_ = datetime.fromisoformat(p["set"]["time"])
+        assert rise < peak < set_
+        assert 0 < p["duration_seconds"] < 15 * 60
+        assert 10 <= p["max_elevation"] <= 90
+        assert p["visible"] <= p["sunlit"]
+
+
+@pytest.mark.asyncio
+async def test_passes_shared_by_nearby_observers(mocker):
+    engine = OrbitEngine()
+    engine.tle = parse_tle_text(ISS_TLE)
+    mocker.patch("app.services.orbit_service.orbit_engine", engine)
+    mocker.patch("app.services.orbit_service.pass_cache", PredictionCache(8))
+    mocker.patch("app.services.orbit_service.Observer")
+    now = datetime.now(timezone.utc)
+
+    def _pass(offset_minutes, visible):
+        rise = now + timedelta(minutes=offset_minutes)
+        return {
+            "rise": {"time": rise.isoformat()},
+            "set": {"time": (rise + timedelta(minutes=6)).isoformat()},
+            "visible": visible,
+        }
+
+    compute = mocker.patch(
+        "app.services.orbit_service.predict_passes",
+        return_value=[_pass(-30, True), _pass(90, False), _pass(180, True)]
+    )
+    service = OrbitService(mocker.AsyncMock())
+    mocker.patch.object(service, "ensure_loaded", return_value=True)
+
+    first = await service.get_passes(55.7558, 37.6173)
+    second = await service.get_passes(55.7512, 37.6201, visible_only=True)
+
+    assert compute.call_count == 1
+    assert first["observer"] == {"latitude": 55.8, "longitude": 37.6, "elevation_m": 0}
+    # The pass that already set is dropped
+    assert first["count"] == 2
+    assert second["count"] == 1
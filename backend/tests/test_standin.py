@@ -0,0 +1,54 @@
+import httpx
+import pytest
+
+from app.clients.http_cache import NotModified
+from app.clients.iss_client import ISSClient
+from app.clients.nasa_client import NASAClient
+from app.core.exceptions import UpstreamError
+from app.orbit.tle import parse_tle
+from app.standin import create_app, standin_env, StandinSettings
+
+
+@pytest.fixture
+def standin(upstream):
+    """Route every pooled upstream client to an in-process stand-in."""
+    standin_app = create_app(StandinSettings(seed=1))
+    upstream(httpx.ASGITransport(app=standin_app))
+    return standin_app
+
+
+@pytest.mark.asyncio
+async def test_standin_serves_client_paths(standin):
+    """Recorded fixtures answer the paths the real clients request."""
+    position = await ISSClient().get_position()
+    assert position["latitude"] is not None
+    assert position["raw"]["location_info"]["country_code"] == "RU"
+
+    history = await ISSClient().get_positions([1364069476, 1364069596])
+    assert [p["timestamp"] for p in history] == [1364069476, 1364069596]
+
+    tle = await ISSClient().get_tle()
+    assert parse_tle(tle["line1"], tle["line2"]).norad_id == 25544
+
+    flares = await NASAClient().get_donki_flr()
+    assert isinstance(flares, list) and flares
+
+
+@pytest.mark.asyncio
+async def test_standin_etag_and_fault_injection(standin):
+    """Conditional requests get 304; injected errors surface as 5xx."""
+    client = NASAClient(conditional=True)
+    await client.get_apod()
+    with pytest.raises(NotModified):
+        await client.get_apod()
+
+    standin.state.standin.faults = standin.state.standin.faults.updated({"error_rate": 1.0})
+    with pytest.raises(UpstreamError) as exc_info:
+        await NASAClient().get_neo_feed()
+    assert exc_info.value.status_code == 503
+
+
+def test_standin_env_keeps_upstream_paths():
+    env = standin_env("http://localhost:8099")
+    assert env["DONKI_FLR_URL"] == "http://localhost:8099/DONKI/FLR"
+    assert env["ISS_API_URL"] == "http://localhost:8099/v1/satellites/25544"